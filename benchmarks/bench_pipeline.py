@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+bench_pipeline.py - 요약 생성/메일 발송 파이프라인 벤치마크
+
+합성 PDF, 크기별 합성 요약, 모의 LLM 백엔드, 로컬 SMTP 서버로 단계별 성능 측정
+(API 키, 네트워크, 실제 자료 불필요)
+
+측정 단계:
+- extract: PDF 텍스트 추출 (extract_text_from_pdf)
+- summarize: 요약 생성 오케스트레이션 (모의 백엔드, 동시 요청 + 청크 분할)
+- markdown: 마크다운 → HTML 변환 (markdown_to_html)
+- quiz: 퀴즈 섹션 추출 (extract_quiz_from_content)
+- search: 요약 전문 검색 (SearchIndex.search, 합성 요약 수천 개 색인)
+- email: HTML 이메일 조립 (create_html_email)
+- optimize: 발송 전 CSS 인라인·HTML 압축 (optimize_html, 전후 크기 포함)
+- send: 수신자별 발송 (send_email → 로컬 SMTP 서버)
+- startup: 발송하지 않는 날의 daily_mailer.py 실행 시간
+
+단계별 지연 시간 백분위수(p50/p90/p99), 처리량, 최대 메모리(tracemalloc)를 출력하고
+benchmarks/results/에 저장. 기준 결과(baseline.json)보다 느려지면 --check가 실패
+
+실행 방법:
+- python benchmarks/bench_pipeline.py
+- python benchmarks/bench_pipeline.py --quick
+- python benchmarks/bench_pipeline.py --save-baseline (현재 결과를 기준으로 저장)
+- python benchmarks/bench_pipeline.py --check (기준 대비 회귀 시 종료 코드 1)
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+from fixtures import SMTPSink, synthetic_summary, synthetic_text, write_pdf, write_workspace  # noqa: E402
+
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+
+# 기준 대비 이 배수보다 느려지거나 메모리를 더 쓰면 회귀로 판단
+REGRESSION_THRESHOLD = float(os.getenv('BENCH_REGRESSION_THRESHOLD', '1.5'))
+
+# 합성 데이터 크기
+PDF_PAGES = (2, 8, 20)
+SUMMARY_CHARS = (1500, 4000, 12000)
+DOCUMENT_CHARS = (3000, 10000, 40000)  # 40000자는 청크 분할(map-reduce) 경로
+TEXT_PIECE_CHARS = 16 * 1024  # 요약 단계에 텍스트를 나누어 주는 조각 크기
+
+# 검색 단계 검색어 (영어 단어, 한글 n-gram, 섹션 제목)
+SEARCH_QUERIES = ("receptor agonist", "half-life", "nerve plexus", "핵심 개념", "임상 적용", "정답")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_timings(latencies: List[float], items: int, seconds: float,
+                      peak_bytes: int, unit: str) -> Dict:
+    """지연 시간 목록(초) → 결과 항목"""
+    ms = [value * 1000 for value in latencies]
+    return {
+        "count": len(ms),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p90_ms": round(percentile(ms, 90), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "max_ms": round(max(ms), 3),
+        "throughput": round(items / seconds, 2) if seconds else None,
+        "unit": unit,
+        "peak_kib": round(peak_bytes / 1024, 1),
+    }
+
+
+def peak_memory(fn: Callable[[], None]) -> int:
+    """fn 실행 중 최대 할당 메모리(바이트)"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_each(fn: Callable, items: Iterable, repeat: int, unit: str) -> Dict:
+    """항목별로 fn(item)을 호출하여 항목당 지연 시간 측정"""
+    items = list(items)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            t0 = time.perf_counter()
+            fn(item)
+            latencies.append(time.perf_counter() - t0)
+    seconds = time.perf_counter() - started
+
+    peak = peak_memory(lambda: [fn(item) for item in items])
+    return summarize_timings(latencies, len(latencies), seconds, peak, unit)
+
+
+def bench_extract(workdir: Path, count: int, repeat: int) -> Dict:
+    from summarizer import extract_text_from_pdf
+
+    pdf_dir = workdir / "pdf"
+    pdf_dir.mkdir()
+    pdfs = []
+    for i in range(count):
+        path = pdf_dir / f"2025{i + 1:04d}_synthetic{i}.pdf"
+        write_pdf(path, PDF_PAGES[i % len(PDF_PAGES)], seed=i)
+        pdfs.append(path)
+
+    return bench_each(extract_text_from_pdf, pdfs, repeat, "파일/s")
+
+
+def bench_summarize(workdir: Path, count: int, repeat: int, stub_latency: float) -> Dict:
+    """요약 생성 오케스트레이션 (문서별 지연 시간 = 청크 요약 + 최종 요약)"""
+    from summarizer import PDFSummarizer, RateLimiter, StubBackend, SummaryCache, TextCache
+
+    class TimedSummarizer(PDFSummarizer):
+        def iter_text(self, pdf_path: Path) -> Iterator[str]:
+            # 텍스트 캐시처럼 조각으로 나누어 제공
+            text = texts[pdf_path]
+            return (text[i:i + TEXT_PIECE_CHARS] for i in range(0, len(text), TEXT_PIECE_CHARS))
+
+        def summarize_document(self, pieces: Iterable[str], subject: str, label: str) -> str:
+            t0 = time.perf_counter()
+            try:
+                return super().summarize_document(pieces, subject, label)
+            finally:
+                self.latencies.append(time.perf_counter() - t0)
+
+    subjects = ('pharmacology', 'anatomy')
+    # 텍스트 캐시 대신 합성 텍스트를 경로별로 제공
+    texts = {
+        workdir / f"doc{i}.pdf": synthetic_text(DOCUMENT_CHARS[i % len(DOCUMENT_CHARS)], seed=i)
+        for i in range(count)
+    }
+    tasks = [(i // 2 + 1, subjects[i % 2], workdir / f"doc{i}.pdf") for i in range(count)]
+
+    def run_once(tag: str) -> TimedSummarizer:
+        # 매번 빈 캐시로 시작 (청크 캐시 적중 방지)
+        summarizer = TimedSummarizer(
+            StubBackend(latency=stub_latency),
+            rate_limiter=RateLimiter(10 ** 6, 10 ** 9),
+            summary_cache=SummaryCache(workdir / "cache" / tag, model_name="bench"),
+            text_cache=TextCache(workdir / "cache" / f"{tag}.sqlite"),
+        )
+        summarizer.latencies = []
+        summarizer.summarize_all(tasks)
+        return summarizer
+
+    latencies = []
+    calls = 0
+    started = time.perf_counter()
+    for run in range(repeat):
+        summarizer = run_once(f"run{run}")
+        latencies += summarizer.latencies
+        calls += summarizer.backend.calls
+    seconds = time.perf_counter() - started
+
+    peak = peak_memory(lambda: run_once("memory"))
+    result = summarize_timings(latencies, len(latencies), seconds, peak, "문서/s")
+    result["backend_calls"] = calls // repeat
+    return result
+
+
+def bench_search(workdir: Path, count: int, repeat: int) -> Dict:
+    """요약 count개를 색인한 뒤 검색어별 지연 시간 측정"""
+    from summarizer import SearchIndex
+
+    summaries = workdir / "search"
+    summaries.mkdir()
+    for i in range(count):
+        chars = SUMMARY_CHARS[i % len(SUMMARY_CHARS)]
+        (summaries / f"day{i // 2 + 1:04d}_{('pharmacology', 'anatomy')[i % 2]}.md").write_text(
+            synthetic_summary(chars, seed=i), encoding='utf-8')
+
+    index = SearchIndex(workdir / "search_index.sqlite")
+    try:
+        started = time.perf_counter()
+        index.sync(summaries)
+        build_seconds = time.perf_counter() - started
+        result = bench_each(index.search, SEARCH_QUERIES, repeat, "건/s")
+    finally:
+        index.close()
+    result["indexed_summaries"] = count
+    result["build_seconds"] = round(build_seconds, 3)
+    return result
+
+
+def bench_mailer(workdir: Path, days: int, recipients: int, repeat: int) -> Dict[str, Dict]:
+    """daily_mailer.py 단계 (마크다운 변환, 퀴즈 추출, 이메일 조립, 크기 줄이기, 발송)"""
+    workdir.mkdir()
+    write_workspace(workdir, days, SUMMARY_CHARS)
+    os.chdir(workdir)  # DailyMailer는 현재 폴더 기준 경로 사용
+    summaries = [synthetic_summary(chars, seed=i) for i, chars in enumerate(SUMMARY_CHARS * 3)]
+
+    with SMTPSink() as sink:
+        host, port = sink.address
+        os.environ.update({
+            "SMTP_HOST": host, "SMTP_PORT": str(port), "SMTP_SSL": "false",
+            "GMAIL_USER": "bench@example.com", "GMAIL_APP_PASSWORD": "",
+            "RECIPIENT_EMAIL": ",".join(f"user{i}@example.com" for i in range(recipients)),
+        })
+        import daily_mailer
+
+        mailer = daily_mailer.DailyMailer()
+        results = {
+            "markdown": bench_each(mailer.markdown_to_html, summaries, repeat, "요약/s"),
+            "quiz": bench_each(mailer.extract_quiz_from_content, summaries, repeat, "요약/s"),
+        }
+
+        rendered = {
+            day: (mailer.render_summary(day, 'pharmacology'), mailer.render_summary(day, 'anatomy'))
+            for day in range(1, days + 1)
+        }
+        results["email"] = bench_each(
+            lambda day: mailer.create_html_email(day, *rendered[day]),
+            range(1, days + 1), repeat, "통/s"
+        )
+
+        from email_optimizer import optimize_html
+
+        htmls = [mailer.create_html_email(day, *rendered[day]) for day in range(1, days + 1)]
+        result = bench_each(optimize_html, htmls, repeat, "통/s")
+        optimized = [optimize_html(html) for html in htmls]
+        result["bytes_before"] = sum(len(html.encode('utf-8')) for html in htmls) // len(htmls)
+        result["bytes_after"] = sum(len(html.encode('utf-8')) for html in optimized) // len(htmls)
+        results["optimize"] = result
+
+        html = optimized[0]
+        text = mailer.create_text_email(1, *rendered[1])
+
+        def send(_):
+            mailer.progress.pop('delivery', None)  # 매번 모든 수신자에게 다시 발송
+            if not mailer.send_email(1, html, text_content=text):
+                raise RuntimeError("로컬 SMTP 서버 발송 실패")
+
+        # 발송 로그는 측정에서 제외
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                result = bench_each(send, [None], repeat, "회/s")
+            finally:
+                sys.stdout = stdout
+        result["throughput"] = round(result["throughput"] * recipients, 2)
+        result["unit"] = "통/s"
+        result["bytes_per_message"] = sink.bytes // max(sink.messages, 1)
+        results["send"] = result
+
+    return results
+
+
+def bench_startup(repeat: int) -> Dict:
+    from bench_startup import measure
+
+    with tempfile.TemporaryDirectory() as workdir:
+        progress = {"current_day": 2, "last_sent_date": datetime.now().date().isoformat(),
+                    "total_days": 20, "completed": False, "sent_count": 1}
+        (Path(workdir) / "progress.json").write_text(json.dumps(progress), encoding='utf-8')
+        started = time.perf_counter()
+        timings = measure([sys.executable, str(ROOT / "daily_mailer.py")], Path(workdir), repeat)
+        seconds = time.perf_counter() - started
+    return summarize_timings([t / 1000 for t in timings], len(timings), seconds, 0, "회/s")
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준 결과 대비 회귀 목록 (p50 지연 시간, 최대 메모리)"""
+    regressions = []
+    for stage, result in current["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base:
+            continue
+        for metric in ("p50_ms", "peak_kib"):
+            if base.get(metric) and result[metric] > base[metric] * threshold:
+                regressions.append(
+                    f"{stage}.{metric}: {base[metric]} → {result[metric]} "
+                    f"({result[metric] / base[metric]:.2f}배)"
+                )
+    return regressions
+
+
+def print_report(stages: Dict[str, Dict]):
+    print(f"{'stage':<12}{'p50':>10}{'p90':>10}{'p99':>10}{'throughput':>16}{'peak':>12}")
+    print("-" * 68)
+    for stage, result in stages.items():
+        throughput = f"{result['throughput']} {result['unit']}"
+        print(f"{stage:<12}{result['p50_ms']:>8.2f}ms{result['p90_ms']:>8.2f}ms"
+              f"{result['p99_ms']:>8.2f}ms{throughput:>14}{result['peak_kib']:>9.0f}KiB")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="요약 생성/메일 발송 파이프라인 벤치마크")
+    parser.add_argument('--quick', action='store_true', help="적은 데이터로 빠르게 측정")
+    parser.add_argument('--repeat', type=int, default=3, help="단계별 반복 횟수 (기본 3)")
+    parser.add_argument('--stub-latency', type=float, default=0.01,
+                        help="모의 백엔드 요청당 지연 시간(초, 기본 0.01)")
+    parser.add_argument('--recipients', type=int, default=20, help="발송 수신자 수 (기본 20)")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 기준(baseline.json)으로 저장")
+    parser.add_argument('--check', action='store_true', help="기준 대비 회귀가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    pdf_count, document_count, days, search_count = (3, 4, 2, 200) if args.quick else (12, 12, 6, 2000)
+
+    print("=" * 68)
+    print("⏱️  파이프라인 벤치마크")
+    print("=" * 68)
+
+    stages = {}
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        # 요약/렌더 결과가 실제 data/ 폴더에 쓰이지 않도록 임시 폴더에서 실행
+        os.chdir(workdir)
+        try:
+            print("📄 extract...")
+            stages["extract"] = bench_extract(workdir, pdf_count, args.repeat)
+            print("🤖 summarize...")
+            stages["summarize"] = bench_summarize(workdir, document_count, args.repeat, args.stub_latency)
+            print("🔍 search...")
+            stages["search"] = bench_search(workdir, search_count, args.repeat)
+            print("📧 mailer...")
+            stages.update(bench_mailer(workdir / "mailer", days, args.recipients, args.repeat))
+        finally:
+            os.chdir(cwd)
+
+    print("🚀 startup...")
+    stages["startup"] = bench_startup(5 if args.quick else 15)
+
+    result = {
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"quick": args.quick, "repeat": args.repeat, "stub_latency": args.stub_latency,
+                   "recipients": args.recipients},
+        "stages": stages,
+    }
+
+    print()
+    print_report(stages)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    result_file = RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    result_file.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n💾 결과 저장: {result_file.relative_to(ROOT)}")
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"💾 기준 결과 저장: {BASELINE_FILE.relative_to(ROOT)}")
+
+    exit_code = 0
+    if args.check:
+        if not BASELINE_FILE.exists():
+            print("⚠️  기준 결과가 없습니다. --save-baseline으로 먼저 저장하세요.")
+        else:
+            baseline = json.loads(BASELINE_FILE.read_text(encoding='utf-8'))
+            if baseline.get("config") != result["config"]:
+                print("⚠️  기준 결과와 측정 설정이 달라 비교 결과가 정확하지 않을 수 있습니다.")
+            regressions = compare(result, baseline, REGRESSION_THRESHOLD)
+            if regressions:
+                print(f"\n❌ 성능 회귀 ({REGRESSION_THRESHOLD}배 초과):")
+                for line in regressions:
+                    print(f"   - {line}")
+                exit_code = 1
+            else:
+                print(f"\n✅ 기준 대비 회귀 없음 (허용 {REGRESSION_THRESHOLD}배)")
+
+    print("=" * 68)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - daily_mailer.py 시작 비용 측정
+
+가장 흔한 실행 경로(오늘 이미 발송함 / 완료됨)에서 프로세스 시작부터 종료까지
+걸리는 시간을 빈 인터프리터(python -c pass)와 비교
+
+실행 방법:
+- python benchmarks/bench_startup.py
+- python benchmarks/bench_startup.py --runs 50
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+MAILER = ROOT / "daily_mailer.py"
+
+
+def measure(command: List[str], cwd: Path, runs: int) -> List[float]:
+    """명령을 runs번 실행하고 실행 시간(ms) 목록 반환"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: List[float]):
+    print(f"min {min(timings):7.1f} ms   median {statistics.median(timings):7.1f} ms   "
+          f"max {max(timings):7.1f} ms   {label}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="daily_mailer.py 시작 비용 측정")
+    parser.add_argument('--runs', type=int, default=20, help="경로별 실행 횟수 (기본 20)")
+    args = parser.parse_args()
+
+    scenarios = {
+        "이미 발송한 날": {
+            "current_day": 4, "last_sent_date": date.today().isoformat(),
+            "total_days": 20, "completed": False, "sent_count": 3,
+        },
+        "학습 완료": {
+            "current_day": 21, "last_sent_date": "2000-01-01",
+            "total_days": 20, "completed": True, "sent_count": 20,
+        },
+    }
+
+    print("=" * 60)
+    print(f"⏱️  daily_mailer.py 시작 비용 ({args.runs}회)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        report("python -c pass", measure([sys.executable, "-c", "pass"], workdir, args.runs))
+
+        for label, progress in scenarios.items():
+            (workdir / "progress.json").write_text(json.dumps(progress), encoding='utf-8')
+            timings = measure([sys.executable, str(MAILER)], workdir, args.runs)
+            report(f"발송 안 함 ({label})", timings)
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+fixtures.py - 벤치마크용 합성 데이터와 로컬 SMTP 서버
+
+- 합성 PDF: 외부 라이브러리 없이 텍스트 페이지로 구성된 PDF 생성
+- 합성 요약: 실제 요약 파일과 같은 섹션 구성의 마크다운 생성
+- SMTP 싱크: 받은 메일을 버리기만 하는 로컬 SMTP 서버 (스레드)
+"""
+
+import json
+import random
+import socketserver
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+WORDS = (
+    "absorption distribution metabolism excretion receptor agonist antagonist "
+    "clearance half-life bioavailability artery vein nerve muscle ligament "
+    "tendon cortex medulla vertebra foramen plexus enzyme inhibitor dose"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def write_pdf(path: Path, pages: int, lines_per_page: int = 40, seed: int = 0):
+    """텍스트 페이지로 된 PDF 생성 (Helvetica, PyPDF2로 추출 가능)"""
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_id = len(objects) + 1
+    objects.append(b"")  # 페이지 트리 자리
+    kids = []
+
+    for page in range(pages):
+        lines = [f"Page {page + 1}: {sentence(rng)}"] + [
+            sentence(rng) for _ in range(lines_per_page - 1)
+        ]
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 780 Td"]
+        for line in lines:
+            ops.append(f"({line}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode('latin-1')
+        content = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (pages_id, font, content)
+        ))
+
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids))
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog, xref)
+
+    path.write_bytes(bytes(out))
+
+
+def synthetic_text(chars: int, seed: int = 0) -> str:
+    """추출 텍스트 대용 (문단 단위, 약 chars자)"""
+    rng = random.Random(seed)
+    paragraphs = []
+    size = 0
+    while size < chars:
+        paragraph = "\n".join(sentence(rng) for _ in range(rng.randint(2, 6)))
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)[:chars]
+
+
+def synthetic_summary(chars: int, title: str = "합성 요약", seed: int = 0) -> str:
+    """요약 파일과 같은 섹션 구성의 마크다운 (핵심 개념/표/임상/암기/퀴즈, 약 chars자)"""
+    rng = random.Random(seed)
+    parts = [f"# {title}\n", "## 💡 핵심 개념\n"]
+    quiz = ["## ✅ 복습 퀴즈\n"] + [
+        f"{i}. {sentence(rng, 8)}?\n   - 정답: {sentence(rng, 4)}\n" for i in range(1, 6)
+    ]
+    fixed = sum(len(p) for p in parts + quiz) + 400
+    body = []
+    size = 0
+    section = 0
+    while size < max(0, chars - fixed):
+        section += 1
+        block = [f"### {section}. {sentence(rng, 3)}\n"]
+        block += [f"- **{rng.choice(WORDS)}**: {sentence(rng)}\n" for _ in range(6)]
+        if section % 3 == 0:
+            block.append("\n| 항목 | 내용 |\n|------|------|\n")
+            block += [f"| {rng.choice(WORDS)} | {sentence(rng, 6)} |\n" for _ in range(4)]
+        text = "".join(block) + "\n"
+        body.append(text)
+        size += len(text)
+
+    tail = [
+        "## 🏥 임상 적용\n", f"- {sentence(rng)}\n", f"- {sentence(rng)}\n\n",
+        "## ⚠️ 중요 암기 사항\n", f"1. {sentence(rng)}\n", f"2. {sentence(rng)}\n\n",
+    ]
+    return "\n".join(parts) + "".join(body) + "".join(tail) + "\n".join(quiz)
+
+
+def write_workspace(root: Path, days: int, summary_chars: Tuple[int, ...]) -> Dict:
+    """daily_mailer.py가 읽는 작업 폴더 구성 (요약 파일, index.json, progress.json)"""
+    summaries = root / "data" / "summaries"
+    summaries.mkdir(parents=True, exist_ok=True)
+    files = []
+    for day in range(1, days + 1):
+        entry = {"day": day}
+        for i, subject in enumerate(("pharmacology", "anatomy")):
+            chars = summary_chars[(day + i) % len(summary_chars)]
+            name = f"day{day:02d}_{subject}.md"
+            (summaries / name).write_text(
+                synthetic_summary(chars, f"Day {day} {subject}", seed=day * 10 + i), encoding='utf-8')
+            entry[subject] = {"original": f"{day:02d}_{subject}.pdf", "summary": name,
+                              "title": f"{subject} {day}"}
+        files.append(entry)
+
+    index = {"total_days": days, "files": files}
+    (root / "index.json").write_text(json.dumps(index, ensure_ascii=False), encoding='utf-8')
+    progress = {"current_day": 1, "last_sent_date": None, "total_days": days,
+                "completed": False, "sent_count": 0}
+    (root / "progress.json").write_text(json.dumps(progress), encoding='utf-8')
+    return index
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """SMTP 최소 구현 (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT)"""
+
+    def reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode('ascii'))
+
+    def handle(self):
+        sink = self.server.sink
+        self.reply("220 bench-sink ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('ascii', 'replace').strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 bench-sink")
+            elif command.startswith("DATA"):
+                self.reply("354 end with <CRLF>.<CRLF>")
+                size = 0
+                for data in self.rfile:
+                    if data in (b".\r\n", b".\n"):
+                        break
+                    size += len(data)
+                sink.record(size)
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 bye")
+                return
+            else:  # MAIL, RCPT, RSET, NOOP
+                self.reply("250 OK")
+
+
+class SMTPSink:
+    """받은 메일 수와 바이트 수만 세는 로컬 SMTP 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.messages = 0
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.server = socketserver.ThreadingTCPServer((host, port), _SMTPHandler)
+        self.server.daemon_threads = True
+        self.server.sink = self
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self.server.server_address
+
+    def record(self, size: int):
+        with self.lock:
+            self.messages += 1
+            self.bytes += size
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
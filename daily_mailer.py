@@ -11,527 +11,1208 @@ daily_mailer.py - 저장된 요약을 이메일로 발송
 실행 방법:
 - GitHub Actions에서 매일 자동 실행
 - 또는 로컬에서: python daily_mailer.py
+- 렌더 캐시 생성: python daily_mailer.py --prerender
+- 구독자별 진도로 발송: python daily_mailer.py --cohorts (subscriber_store.py 참고)
+- 밀린 날짜 한 번에 발송: python daily_mailer.py --catch-up [--digest] (STUDY_START_DATE 필요)
+- 주간 묶음 발송: python daily_mailer.py --weekly (다음 DIGEST_DAYS일치를 한 통으로)
+- 발송 전 크기 줄이기: CSS 인라인·HTML 압축 + 텍스트 대체본 (email_optimizer.py)
 
 기능:
 - 진도 확인 및 중복 발송 방지
 - 마크다운 → HTML 변환
-- Gmail SMTP 발송
-- 재시도 로직
+- 이전 날짜 퀴즈 간격 반복 복습 (review_store.py)
+- Gmail SMTP 발송 (수신자별 병렬 발송)
+- 수신자별 재시도 로직 및 발송 상태 기록
 - 에러 로깅
 - 진도 자동 업데이트
 """
 
+from __future__ import annotations
+
 import os
 import json
-import smtplib
-import time
-from datetime import datetime, date
+import argparse
+import re
+from datetime import date
 from pathlib import Path
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Optional
-
-import markdown2
-from dotenv import load_dotenv
-
-# 환경 변수 로드
-load_dotenv()
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# 환경 변수 로드 (.env가 있을 때만, GitHub Actions에서는 Secrets 사용)
+# metrics/progress_store/review_store가 import 시점에 설정을 읽으므로 그보다 먼저 로드
+ENV_FILE = Path(".env")
+if ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
+
+from metrics import Metrics  # noqa: E402
+from progress_store import FileLock, ProgressStore  # noqa: E402
+from review_store import (  # noqa: E402
+    QuizItem, QuizStore, find_quiz_block, parse_quiz_items, select_review_items,
+)
+
+# 발송할 때만 필요한 모듈은 사용하는 곳에서 import
+# (이미 발송했거나 완료된 날은 progress.json만 읽고 바로 종료)
+if TYPE_CHECKING:
+    from email.mime.multipart import MIMEMultipart
+    from subscriber_store import Subscriber, SubscriberStore
 
 # 설정
 GMAIL_USER = os.getenv('GMAIL_USER')
 GMAIL_APP_PASSWORD = os.getenv('GMAIL_APP_PASSWORD')
 RECIPIENT_EMAIL = os.getenv('RECIPIENT_EMAIL')
 
+# 학습 시작일 (Day 1 발송일, YYYY-MM-DD) - --catch-up이 밀린 날짜를 계산할 때 사용
+STUDY_START_DATE = os.getenv('STUDY_START_DATE')
+
+# 발송이 끝난 것으로 보는 수신자 상태 (rejected: 존재하지 않는 주소 등 영구 오류)
+DELIVERED = ("sent", "rejected")
+
 # 경로
 SUMMARIES_DIR = Path("data/summaries")
 PROGRESS_FILE = Path("progress.json")
 INDEX_FILE = Path("index.json")
+RENDER_CACHE_DIR = Path("data/rendered")
 
+# 렌더 캐시 항목 형식 버전 (형식이 바뀌면 기존 캐시 무효화)
+RENDER_CACHE_VERSION = 5
 
-class DailyMailer:
-    """매일 학습 자료 이메일 발송 클래스"""
-
-    def __init__(self):
-        self.validate_config()
-        self.progress = self.load_progress()
-        self.index = self.load_index()
-
-    def validate_config(self):
-        """환경 변수 검증"""
-        if not GMAIL_USER:
-            raise ValueError("GMAIL_USER가 설정되지 않았습니다.")
-        if not GMAIL_APP_PASSWORD:
-            raise ValueError("GMAIL_APP_PASSWORD가 설정되지 않았습니다.")
-        if not RECIPIENT_EMAIL:
-            raise ValueError("RECIPIENT_EMAIL이 설정되지 않았습니다.")
-
-    def load_progress(self) -> Dict:
-        """진도 파일 로드"""
-        if not PROGRESS_FILE.exists():
-            # 초기화
-            progress = {
-                "current_day": 1,
-                "last_sent_date": None,
-                "total_days": 20,
-                "completed": False,
-                "sent_count": 0
-            }
-            self.save_progress(progress)
-            return progress
-
-        with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    def save_progress(self, progress: Dict):
-        """진도 파일 저장"""
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(progress, f, ensure_ascii=False, indent=2)
-
-    def load_index(self) -> Dict:
-        """인덱스 파일 로드"""
-        if not INDEX_FILE.exists():
-            raise FileNotFoundError("index.json 파일이 없습니다. setup.py를 먼저 실행하세요.")
-
-        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-    def should_send_today(self) -> bool:
-        """오늘 발송해야 하는지 확인"""
-        today = date.today().isoformat()
-
-        # 이미 완료된 경우
-        if self.progress.get('completed', False):
-            print("✅ 모든 학습이 완료되었습니다!")
-            return False
-
-        # 오늘 이미 발송한 경우
-        if self.progress.get('last_sent_date') == today:
-            print(f"ℹ️  오늘 이미 발송했습니다 (Day {self.progress['current_day'] - 1})")
-            return False
+# 묶음 메일 설정 (주간 묶음 일수, 최대 크기, 미리보기 길이, Day·과목별 퀴즈 문항 수)
+# Gmail은 HTML이 약 102KB를 넘으면 메일을 잘라 표시하므로 그 안으로 맞춤
+DIGEST_DAYS = int(os.getenv('DIGEST_DAYS', '7'))
+DIGEST_MAX_BYTES = int(os.getenv('DIGEST_MAX_BYTES', str(100 * 1024)))
+DIGEST_PREVIEW_CHARS = int(os.getenv('DIGEST_PREVIEW_CHARS', '1200'))
+DIGEST_QUIZ_ITEMS = int(os.getenv('DIGEST_QUIZ_ITEMS', '2'))
 
-        # 진도가 총 일수를 초과한 경우
-        if self.progress['current_day'] > self.progress['total_days']:
-            print("✅ 모든 학습이 완료되었습니다!")
-            self.progress['completed'] = True
-            self.save_progress(self.progress)
-            return False
-
-        return True
-
-    def load_summary(self, day: int, subject: str) -> Optional[str]:
-        """요약 파일 로드"""
-        filename = f"day{day:02d}_{subject}.md"
-        filepath = SUMMARIES_DIR / filename
+# 텍스트 대체본 포함 여부 (HTML을 표시하지 않는 메일 앱용, 과목별 앞부분만 담음)
+EMAIL_TEXT_PART = os.getenv('EMAIL_TEXT_PART', 'true').lower() not in ('0', 'false', 'no')
 
-        if not filepath.exists():
-            print(f"⚠️  파일을 찾을 수 없습니다: {filename}")
-            return None
+# 과목 및 기본 제목
+SUBJECT_LABELS = {'pharmacology': '약리학', 'anatomy': '해부학'}
+SUBJECT_ICONS = {'pharmacology': '💊', 'anatomy': '🫀'}
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+# 마크다운 변환 옵션
+MARKDOWN_EXTRAS = ['fenced-code-blocks', 'tables', 'break-on-newline']
 
-    def markdown_to_html(self, markdown_text: str) -> str:
-        """마크다운을 HTML로 변환"""
-        return markdown2.markdown(
-            markdown_text,
-            extras=['fenced-code-blocks', 'tables', 'break-on-newline']
-        )
 
-    def get_day_info(self, day: int) -> Dict:
-        """특정 날짜 정보 가져오기"""
-        for file_info in self.index['files']:
-            if file_info['day'] == day:
-                return file_info
-        return {}
+class EmailTemplate:
+    """{{이름}} 슬롯이 있는 HTML 템플릿
 
-    def extract_quiz_from_content(self, content: str) -> str:
-        """마크다운 내용에서 퀴즈 섹션 추출"""
-        # "복습 퀴즈" 또는 "오늘의 퀴즈" 섹션 찾기
-        import re
-        patterns = [
-            r'#+\s*✅\s*복습 퀴즈.*?(?=\n#+\s|\Z)',
-            r'#+\s*✅\s*오늘의 퀴즈.*?(?=\n#+\s|\Z)',
-            r'#+\s*복습 퀴즈.*?(?=\n#+\s|\Z)',
-            r'#+\s*오늘의 퀴즈.*?(?=\n#+\s|\Z)'
-        ]
+    정적 부분(CSS 포함)은 생성 시 한 번만 나누어 두고, render는 조각을 이어 붙이기만 함
+    """
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
-            if match:
-                return match.group(0).strip()
+    SLOT_PATTERN = re.compile(r'\{\{(\w+)\}\}')
 
-        return ""
+    def __init__(self, source: str):
+        pieces = self.SLOT_PATTERN.split(source)
+        # 짝수 위치: 정적 문자열, 홀수 위치: 슬롯 이름
+        self.static = pieces[0::2]
+        self.slots = pieces[1::2]
 
-    def create_html_email(self, day: int, pharma_content: str, anatomy_content: str) -> str:
-        """HTML 이메일 생성"""
-        # 진행률 계산
-        progress = (day / self.progress['total_days']) * 100
-        remaining = self.progress['total_days'] - day
-        next_day = day + 1 if day < self.progress['total_days'] else day
-
-        # 제목 가져오기
-        day_info = self.get_day_info(day)
-        pharma_title = day_info.get('pharmacology', {}).get('title', '약리학')
-        anatomy_title = day_info.get('anatomy', {}).get('title', '해부학')
-
-        # 마크다운 → HTML
-        pharma_html = self.markdown_to_html(pharma_content)
-        anatomy_html = self.markdown_to_html(anatomy_content)
-
-        # 전날 복습 퀴즈 생성
-        review_section = ""
-        if day > 1:
-            prev_pharma = self.load_summary(day - 1, 'pharmacology')
-            prev_anatomy = self.load_summary(day - 1, 'anatomy')
-
-            if prev_pharma and prev_anatomy:
-                prev_pharma_quiz = self.extract_quiz_from_content(prev_pharma)
-                prev_anatomy_quiz = self.extract_quiz_from_content(prev_anatomy)
-
-                prev_day_info = self.get_day_info(day - 1)
-                prev_pharma_title = prev_day_info.get('pharmacology', {}).get('title', '약리학')
-                prev_anatomy_title = prev_day_info.get('anatomy', {}).get('title', '해부학')
-
-                review_html = f"""
-                <div class="section review">
-                  <div class="section-header">
-                    <span class="section-icon">🔁</span>
-                    <h2 class="section-title">어제의 복습 (Day {day-1})</h2>
-                  </div>
-                  <div class="content">
-                    <h3>💊 약리학 복습: {prev_pharma_title}</h3>
-                    {self.markdown_to_html(prev_pharma_quiz) if prev_pharma_quiz else '<p>퀴즈를 찾을 수 없습니다.</p>'}
+    def render(self, **values) -> str:
+        """슬롯 값을 채워 HTML 반환"""
+        out = [self.static[0]]
+        for slot, static in zip(self.slots, self.static[1:]):
+            out.append(str(values[slot]))
+            out.append(static)
+        return ''.join(out)
 
-                    <h3>🫀 해부학 복습: {prev_anatomy_title}</h3>
-                    {self.markdown_to_html(prev_anatomy_quiz) if prev_anatomy_quiz else '<p>퀴즈를 찾을 수 없습니다.</p>'}
-                  </div>
-                </div>
-                """
-                review_section = review_html
 
-        # 오늘 날짜
-        today = date.today().strftime('%Y년 %m월 %d일')
-
-        html = f"""<!DOCTYPE html>
+# 이메일 본문 템플릿 (모듈 로드 시 한 번만 컴파일)
+EMAIL_TEMPLATE = EmailTemplate("""<!DOCTYPE html>
 <html lang="ko">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Day {day} 학습 자료</title>
+  <title>Day {{day}} 학습 자료</title>
   <style>
-    * {{
+    * {
       margin: 0;
       padding: 0;
       box-sizing: border-box;
-    }}
+    }
 
-    body {{
+    body {
       font-family: -apple-system, BlinkMacSystemFont, 'Malgun Gothic',
                    'Apple SD Gothic Neo', sans-serif;
       line-height: 1.6;
       color: #333;
       background-color: #f5f5f5;
       padding: 20px;
-    }}
+    }
 
-    .container {{
+    .container {
       max-width: 600px;
       margin: 0 auto;
       background-color: white;
       border-radius: 12px;
       box-shadow: 0 2px 8px rgba(0,0,0,0.1);
       overflow: hidden;
-    }}
+    }
 
-    .header {{
+    .header {
       background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
       color: white;
       padding: 30px 20px;
       text-align: center;
-    }}
+    }
 
-    .header h1 {{
+    .header h1 {
       font-size: 24px;
       margin-bottom: 8px;
-    }}
+    }
 
-    .progress-bar {{
+    .progress-bar {
       background-color: rgba(255,255,255,0.3);
       height: 8px;
       border-radius: 4px;
       margin-top: 15px;
       overflow: hidden;
-    }}
+    }
 
-    .progress-fill {{
+    .progress-fill {
       background-color: white;
       height: 100%;
-      width: {progress}%;
       transition: width 0.3s ease;
-    }}
+    }
 
-    .section {{
+    .section {
       padding: 30px 20px;
       border-bottom: 1px solid #eee;
-    }}
+    }
 
-    .section:last-of-type {{
+    .section:last-of-type {
       border-bottom: none;
-    }}
+    }
 
-    .section-header {{
+    .section-header {
       display: flex;
       align-items: center;
       gap: 10px;
       margin-bottom: 20px;
-    }}
+    }
 
-    .section-icon {{
+    .section-icon {
       font-size: 28px;
-    }}
+    }
 
-    .section-title {{
+    .section-title {
       font-size: 20px;
       font-weight: bold;
       color: #667eea;
-    }}
+    }
 
-    .pharmacology {{
+    .pharmacology {
       background-color: #f0f4ff;
-    }}
+    }
 
-    .anatomy {{
+    .anatomy {
       background-color: #fff0f6;
-    }}
+    }
 
-    .review {{
+    .review {
       background-color: #fffbea;
-    }}
+    }
 
-    .content h1 {{
+    .review-box {
+      font-size: 12px;
+      color: #b7791f;
+      margin-bottom: 8px;
+    }
+
+    .content h1 {
       font-size: 22px;
       color: #333;
       margin: 20px 0 12px 0;
-    }}
+    }
 
-    .content h2 {{
+    .content h2 {
       font-size: 18px;
       color: #333;
       margin: 20px 0 10px 0;
-    }}
+    }
 
-    .content h3 {{
+    .content h3 {
       font-size: 16px;
       color: #555;
       margin: 15px 0 8px 0;
-    }}
+    }
 
-    .content p {{
+    .content p {
       margin-bottom: 12px;
       color: #666;
-    }}
+    }
 
-    .content ul, .content ol {{
+    .content ul, .content ol {
       margin-left: 20px;
       margin-bottom: 12px;
-    }}
+    }
 
-    .content li {{
+    .content li {
       margin-bottom: 6px;
       color: #666;
-    }}
+    }
 
-    .content strong {{
+    .content strong {
       color: #333;
-    }}
+    }
 
-    .content code {{
+    .content code {
       background-color: #f4f4f4;
       padding: 2px 6px;
       border-radius: 3px;
       font-family: 'Courier New', monospace;
       font-size: 0.9em;
-    }}
+    }
 
-    .content blockquote {{
+    .content blockquote {
       background-color: #fffbea;
       border-left: 4px solid #f59e0b;
       padding: 15px;
       margin: 15px 0;
       border-radius: 4px;
-    }}
+    }
 
-    .content table {{
+    .content table {
       border-collapse: collapse;
       width: 100%;
       margin: 15px 0;
-    }}
+    }
 
-    .content th, .content td {{
+    .content th, .content td {
       border: 1px solid #ddd;
       padding: 8px;
       text-align: left;
-    }}
+    }
 
-    .content th {{
+    .content th {
       background-color: #f0f4ff;
       font-weight: bold;
-    }}
+    }
 
-    .footer {{
+    .footer {
       background-color: #f9fafb;
       padding: 20px;
       text-align: center;
       color: #999;
       font-size: 14px;
-    }}
+    }
 
-    .footer a {{
+    .footer a {
       color: #667eea;
       text-decoration: none;
-    }}
+    }
 
-    .footer p {{
+    .footer p {
       margin: 5px 0;
-    }}
+    }
 
-    @media (max-width: 600px) {{
-      body {{
+    @media (max-width: 600px) {
+      body {
         padding: 10px;
-      }}
+      }
 
-      .header {{
+      .header {
         padding: 20px 15px;
-      }}
+      }
 
-      .section {{
+      .section {
         padding: 20px 15px;
-      }}
+      }
 
-      .section-title {{
+      .section-title {
         font-size: 18px;
-      }}
-    }}
+      }
+    }
 
-    @media (prefers-color-scheme: dark) {{
-      body {{
+    @media (prefers-color-scheme: dark) {
+      body {
         background-color: #1a1a1a;
-      }}
+      }
 
-      .container {{
+      .container {
         background-color: #2d2d2d;
-      }}
+      }
 
-      .content h1, .content h2, .content h3, .content strong {{
+      .content h1, .content h2, .content h3, .content strong {
         color: #e0e0e0;
-      }}
+      }
 
-      .content p, .content li {{
+      .content p, .content li {
         color: #b0b0b0;
-      }}
+      }
 
-      .footer {{
+      .footer {
         background-color: #1a1a1a;
         color: #666;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
   <div class="container">
     <!-- 헤더 -->
     <div class="header">
-      <h1>📚 Day {day}/{self.progress['total_days']} - 오늘의 학습</h1>
-      <p>{today}</p>
+      <h1>📚 Day {{day}}/{{total_days}} - 오늘의 학습</h1>
+      <p>{{today}}</p>
       <div class="progress-bar">
-        <div class="progress-fill"></div>
+        <div class="progress-fill" style="width: {{progress}}%;"></div>
       </div>
     </div>
 
-    <!-- 전날 복습 퀴즈 (Day 2부터) -->
-    {review_section}
+    <!-- 간격 반복 복습 퀴즈 (Day 2부터) -->
+    {{review_section}}
+
+    {{subject_sections}}
 
-    <!-- 약리학 섹션 -->
-    <div class="section pharmacology">
+    <!-- 푸터 -->
+    <div class="footer">
+      <p>💪 잘하고 있어요! {{remaining}}일 남았습니다.</p>
+      <p>📅 다음 학습: Day {{next_day}}</p>
+      <p style="margin-top: 10px; font-size: 12px;">
+        자동 발송 시스템 | 매일 아침 새로운 지식을 전달합니다
+      </p>
+    </div>
+  </div>
+</body>
+</html>""")
+
+# 과목별 오늘의 학습 섹션 템플릿
+SUBJECT_SECTION_TEMPLATE = EmailTemplate("""
+    <!-- {{label}} 섹션 -->
+    <div class="section {{subject}}">
       <div class="section-header">
-        <span class="section-icon">💊</span>
-        <h2 class="section-title">오늘의 약리학: {pharma_title}</h2>
+        <span class="section-icon">{{icon}}</span>
+        <h2 class="section-title">오늘의 {{label}}: {{title}}</h2>
       </div>
       <div class="content">
-        {pharma_html}
+        {{html}}
       </div>
     </div>
+""")
+
+# 간격 반복 복습 섹션 템플릿
+REVIEW_TEMPLATE = EmailTemplate("""
+                <div class="section review">
+                  <div class="section-header">
+                    <span class="section-icon">🔁</span>
+                    <h2 class="section-title">오늘의 복습 ({{count}}문항)</h2>
+                  </div>
+                  <div class="content">
+{{items}}
+                  </div>
+                </div>
+""")
+
+# 복습 문항 템플릿
+REVIEW_ITEM_TEMPLATE = EmailTemplate("""
+                    <h3>{{icon}} Day {{review_day}} {{label}}: {{title}}</h3>
+                    <p class="review-box">{{box}}번째 복습</p>
+                    {{quiz}}
+""")
 
-    <!-- 해부학 섹션 -->
-    <div class="section anatomy">
+
+# 묶음 메일 퀴즈 섹션 템플릿
+DIGEST_QUIZ_TEMPLATE = EmailTemplate("""
+    <div class="section review">
       <div class="section-header">
-        <span class="section-icon">🫀</span>
-        <h2 class="section-title">오늘의 해부학: {anatomy_title}</h2>
+        <span class="section-icon">✅</span>
+        <h2 class="section-title">묶음 퀴즈 ({{count}}문항)</h2>
       </div>
       <div class="content">
-        {anatomy_html}
+{{items}}
       </div>
     </div>
+""")
 
-    <!-- 푸터 -->
-    <div class="footer">
-      <p>💪 잘하고 있어요! {remaining}일 남았습니다.</p>
-      <p>📅 다음 학습: Day {next_day}</p>
-      <p style="margin-top: 10px; font-size: 12px;">
-        자동 발송 시스템 | 매일 아침 새로운 지식을 전달합니다
-      </p>
-    </div>
-  </div>
-</body>
-</html>"""
+# 묶음 메일 퀴즈 Day·과목별 항목 템플릿
+DIGEST_QUIZ_GROUP_TEMPLATE = EmailTemplate("""
+        <h3>{{icon}} Day {{day}} {{label}}</h3>
+        {{quiz}}
+""")
 
-        return html
+# 크기 제한으로 접은 섹션 안내
+DIGEST_PREVIEW_NOTE = '<p class="review-box">… 메일 크기 제한으로 앞부분만 표시합니다.</p>'
+DIGEST_COLLAPSED_NOTE = '<p class="review-box">메일 크기 제한으로 생략했습니다. Day {day} 요약 파일을 확인하세요.</p>'
+
+# 텍스트 대체본 템플릿 (HTML을 표시하지 않는 메일 앱용, 요약 마크다운에서 변환)
+TEXT_EMAIL_TEMPLATE = EmailTemplate("""📚 Day {{day}}/{{total_days}} - 오늘의 학습
+{{today}} · 진도 {{progress}}%
+{{review_section}}{{subject_sections}}
+------------------------------
+💪 잘하고 있어요! {{remaining}}일 남았습니다.
+📅 다음 학습: Day {{next_day}}
+""")
 
-    def send_email(self, day: int, html_content: str, retry_count: int = 3) -> bool:
-        """이메일 발송 (재시도 로직 포함)"""
-        subject = f"📚 Day {day}/{self.progress['total_days']} - 오늘의 학습 자료"
+# 텍스트 대체본 섹션 템플릿
+TEXT_SECTION_TEMPLATE = EmailTemplate("""
+==============================
+{{icon}} {{heading}}
+==============================
+
+{{text}}
+""")
+
+# 텍스트 대체본은 과목별 앞부분만 (전체는 HTML 본문, 메시지 크기를 늘리지 않도록)
+TEXT_PREVIEW_NOTE = "\n\n… 전체 내용은 HTML 본문에서 확인하세요."
+
+
+# 마크다운 제목 (한 번의 스캔으로 모든 섹션 위치 파악)
+HEADING_PATTERN = re.compile(r'^(#{1,6})[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# 퀴즈 섹션 제목 (앞쪽일수록 우선)
+QUIZ_TITLES = ('✅ 복습 퀴즈', '✅ 오늘의 퀴즈', '복습 퀴즈', '오늘의 퀴즈')
+
+# 그 밖의 섹션 종류와 제목 표시
+SECTION_MARKERS = {
+    'concepts': '💡',   # 핵심 개념
+    'clinical': '🏥',   # 임상 적용 / 임상 의의
+    'memorize': '⚠',    # 중요 암기 사항
+}
+
+
+def classify_heading(title: str) -> Optional[Tuple[str, int]]:
+    """제목을 섹션 종류로 분류 (종류, 우선순위) 반환, 해당 없으면 None"""
+    compact = re.sub(r'^(✅)\s*', r'\1 ', title)
+    for rank, quiz_title in enumerate(QUIZ_TITLES):
+        if compact.startswith(quiz_title):
+            return 'quiz', rank
+
+    for kind, marker in SECTION_MARKERS.items():
+        if marker in title:
+            return kind, 0
+    return None
+
+
+def index_sections(content: str) -> Dict[str, List[int]]:
+    """요약 마크다운을 한 번 훑어 {섹션 종류: [시작, 끝]} 색인 생성
+
+    섹션은 제목 줄부터 같은 수준 이상의 다음 제목 직전까지
+    (종류별로 우선순위가 가장 높은 첫 섹션만 기록)
+    """
+    spans = {}
+    ranks = {}
+    open_sections = []  # (제목 수준, 종류) - 아직 끝나지 않은 섹션
+
+    def close(level: int, position: int):
+        while open_sections and open_sections[-1][0] >= level:
+            _, kind = open_sections.pop()
+            if kind is not None and spans[kind][1] is None:
+                spans[kind][1] = position
+
+    for match in HEADING_PATTERN.finditer(content):
+        level = len(match.group(1))
+        close(level, match.start())
+
+        kind = None
+        classified = classify_heading(match.group(2))
+        if classified and classified[1] < ranks.get(classified[0], len(QUIZ_TITLES)):
+            kind, ranks[kind] = classified
+            spans[kind] = [match.start(), None]
+        open_sections.append((level, kind))
+
+    close(0, len(content))
+    return spans
+
+
+def get_section(content: str, spans: Dict[str, List[int]], kind: str) -> str:
+    """색인으로 섹션 내용 반환 (없으면 빈 문자열)"""
+    span = spans.get(kind)
+    return content[span[0]:span[1]].strip() if span else ""
+
+
+# 최상위 블록 경계 (빈 줄 다음 줄이 들여쓰기 없이 시작)
+BLOCK_BOUNDARY = re.compile(r'\n[ \t]*\n(?=\S)')
+
+# 제목 또는 굵은 글씨 한 줄로 된 블록
+HEADING_BLOCK = re.compile(r'^(#{1,6}[ \t].*|\*\*[^*\n]+\*\*:?)$')
+
+
+def preview_markdown(content: str, limit: int = DIGEST_PREVIEW_CHARS) -> str:
+    """요약 앞부분 (최상위 블록 경계에서 limit자 이내로 자르고, 끝에 남은 제목은 제거)"""
+    blocks = []
+    size = 0
+    for block in BLOCK_BOUNDARY.split(content.strip()):
+        if blocks and size + len(block) > limit:
+            break
+        blocks.append(block)
+        size += len(block) + 2
+
+    while len(blocks) > 1 and HEADING_BLOCK.match(blocks[-1].strip()):
+        blocks.pop()
+    return "\n\n".join(blocks)
+
+
+class SubjectRecord:
+    """index.json의 과목별 항목"""
+
+    __slots__ = ('original', 'summary', 'title')
+
+    def __init__(self, original: str, summary: str, title: str):
+        self.original = original
+        self.summary = summary
+        self.title = title
+
+
+class DayRecord:
+    """index.json의 날짜별 항목"""
+
+    __slots__ = ('day', 'pharmacology', 'anatomy')
+
+    def __init__(self, day: int, pharmacology: Optional[SubjectRecord] = None,
+                 anatomy: Optional[SubjectRecord] = None):
+        self.day = day
+        self.pharmacology = pharmacology
+        self.anatomy = anatomy
+
+
+def parse_index(index_data: Dict) -> Dict[int, DayRecord]:
+    """index.json 내용을 검증하고 {day: DayRecord}로 변환"""
+    files = index_data.get('files')
+    if not isinstance(files, list):
+        raise ValueError("index.json 형식 오류: 'files' 목록이 없습니다.")
+
+    days = {}
+    for position, file_info in enumerate(files):
+        day = file_info.get('day') if isinstance(file_info, dict) else None
+        if not isinstance(day, int) or day < 1:
+            raise ValueError(f"index.json 형식 오류: {position + 1}번째 항목의 day 값이 잘못되었습니다.")
+        if day in days:
+            raise ValueError(f"index.json 형식 오류: Day {day} 항목이 중복되었습니다.")
+
+        record = DayRecord(day)
+        for subject in SUBJECT_LABELS:
+            info = file_info.get(subject)
+            if info is None:
+                continue
+            if not isinstance(info, dict) or not info.get('summary'):
+                raise ValueError(f"index.json 형식 오류: Day {day} {subject} 항목에 summary가 없습니다.")
+            setattr(record, subject, SubjectRecord(
+                info.get('original', ''), info['summary'], info.get('title') or SUBJECT_LABELS[subject]
+            ))
+        days[day] = record
+
+    return days
+
+
+class RenderCache:
+    """요약별 HTML 변환 결과 캐시 (dayNN_subject.json)
+
+    원본 마크다운 해시와 markdown2 extras가 같을 때만 재사용
+    """
+
+    def __init__(self, cache_dir: Path = RENDER_CACHE_DIR, extras: Optional[List[str]] = None):
+        self.cache_dir = cache_dir
+        self.extras = extras or MARKDOWN_EXTRAS
+
+    def key(self, content: str) -> str:
+        """원본 마크다운과 extras로 캐시 키 생성"""
+        import hashlib
+
+        payload = json.dumps({
+            "version": RENDER_CACHE_VERSION,
+            "extras": self.extras,
+            "content": content,
+        }, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load(self, day: int, subject: str, key: str) -> Optional[Dict]:
+        """캐시된 변환 결과 반환 (없거나 원본이 바뀌었으면 None)"""
+        filepath = self.cache_dir / f"day{day:02d}_{subject}.json"
+        if not filepath.exists():
+            return None
+
+        with open(filepath, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        return entry if entry.get('key') == key else None
+
+    def save(self, day: int, subject: str, entry: Dict):
+        """변환 결과 저장"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        filepath = self.cache_dir / f"day{day:02d}_{subject}.json"
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+
+class DailyMailer:
+    """매일 학습 자료 이메일 발송 클래스"""
+
+    def __init__(self, metrics: Optional[Metrics] = None):
+        self.metrics = metrics or Metrics("daily_mailer")
+        self.progress_store = ProgressStore(PROGRESS_FILE)
+        self.progress = self.load_progress()
+        self.render_cache = RenderCache()
+        self.quiz_store = QuizStore()
+        self._quiz_items = {}
+        self._days = None
+
+    @property
+    def days(self) -> Dict[int, DayRecord]:
+        """날짜별 인덱스 (처음 사용할 때 index.json 로드)"""
+        if self._days is None:
+            self._days = self.load_index()
+        return self._days
+
+    def validate_config(self, require_recipients: bool = True):
+        """환경 변수 검증 (구독자 저장소로 발송할 때는 RECIPIENT_EMAIL 불필요)"""
+        if not GMAIL_USER:
+            raise ValueError("GMAIL_USER가 설정되지 않았습니다.")
+        if not GMAIL_APP_PASSWORD:
+            raise ValueError("GMAIL_APP_PASSWORD가 설정되지 않았습니다.")
+        if require_recipients and not RECIPIENT_EMAIL:
+            raise ValueError("RECIPIENT_EMAIL이 설정되지 않았습니다.")
+
+    def load_progress(self) -> Dict:
+        """진도 파일 로드"""
+        progress = self.progress_store.load()
+        if progress is None:
+            # 초기화
+            progress = {
+                "current_day": 1,
+                "last_sent_date": None,
+                "total_days": 20,
+                "completed": False,
+                "sent_count": 0
+            }
+            self.save_progress(progress)
+        return progress
+
+    def save_progress(self, progress: Dict):
+        """진도 파일 저장 (임시 파일에 쓴 뒤 교체 → 중단되어도 파일이 깨지지 않음)"""
+        self.progress_store.save(progress)
+
+    def load_index(self) -> Dict[int, DayRecord]:
+        """인덱스 파일 로드 (로드 시 한 번 검증하고 날짜별로 바로 찾을 수 있게 변환)"""
+        if not INDEX_FILE.exists():
+            raise FileNotFoundError("index.json 파일이 없습니다. setup.py를 먼저 실행하세요.")
+
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            return parse_index(json.load(f))
+
+    def should_send_today(self) -> bool:
+        """오늘 발송해야 하는지 확인"""
+        today = date.today().isoformat()
+
+        # 이미 완료된 경우
+        if self.progress.get('completed', False):
+            print("✅ 모든 학습이 완료되었습니다!")
+            return False
+
+        # 오늘 이미 발송한 경우
+        if self.progress.get('last_sent_date') == today:
+            print(f"ℹ️  오늘 이미 발송했습니다 (Day {self.progress['current_day'] - 1})")
+            return False
+
+        # 진도가 총 일수를 초과한 경우
+        if self.progress['current_day'] > self.progress['total_days']:
+            print("✅ 모든 학습이 완료되었습니다!")
+            self.progress['completed'] = True
+            self.save_progress(self.progress)
+            return False
+
+        return True
+
+    def load_summary(self, day: int, subject: str) -> Optional[str]:
+        """요약 파일 로드"""
+        filename = f"day{day:02d}_{subject}.md"
+        filepath = SUMMARIES_DIR / filename
+
+        if not filepath.exists():
+            print(f"⚠️  파일을 찾을 수 없습니다: {filename}")
+            return None
+
+        with self.metrics.timer("load"), open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def markdown_to_html(self, markdown_text: str) -> str:
+        """마크다운을 HTML로 변환"""
+        import markdown2
+
+        return markdown2.markdown(
+            markdown_text,
+            extras=MARKDOWN_EXTRAS
+        )
 
-        # 여러 수신자 처리 (쉼표로 구분)
-        recipients = [email.strip() for email in RECIPIENT_EMAIL.split(',')]
+    def render_summary(self, day: int, subject: str, content: Optional[str] = None) -> Optional[Dict]:
+        """요약 파일을 HTML과 텍스트로 변환 (본문 + 퀴즈, 렌더 캐시 우선 사용)
+
+        {"key", "html", "preview_html", "quiz_html", "preview_text", "sections"} 반환,
+        요약 파일이 없으면 None (preview_*는 묶음 메일에서 접을 때와 텍스트 대체본에 쓰는 앞부분,
+        sections는 index_sections 색인)
+        이미 읽은 요약 내용(content)을 넘기면 파일을 다시 읽지 않음
+        """
+        if content is None:
+            content = self.load_summary(day, subject)
+        if not content:
+            return None
+
+        key = self.render_cache.key(content)
+        entry = self.render_cache.load(day, subject, key)
+        if entry is not None:
+            self.metrics.incr("render_cache_hits")
+            return entry
+
+        from email_optimizer import markdown_to_text
+
+        self.metrics.incr("render_cache_misses")
+        with self.metrics.timer("render"):
+            sections = index_sections(content)
+            quiz = get_section(content, sections, 'quiz')
+            preview = preview_markdown(content)
+            entry = {
+                "key": key,
+                "html": self.markdown_to_html(content),
+                "preview_html": self.markdown_to_html(preview),
+                "quiz_html": self.markdown_to_html(quiz) if quiz else "",
+                "preview_text": markdown_to_text(preview),
+                "sections": sections,
+            }
+        self.render_cache.save(day, subject, entry)
+        return entry
+
+    def prerender_all(self):
+        """모든 날짜의 요약을 미리 HTML로 변환하여 렌더 캐시와 퀴즈 저장소 채우기"""
+        count = 0
+        quiz_count = 0
+        for day, record in self.days.items():
+            for subject in SUBJECT_LABELS:
+                if getattr(record, subject) and self.render_summary(day, subject):
+                    count += 1
+                    quiz_count += len(self.quiz_items(day, subject))
+        self.quiz_store.save()
+        print(f"✅ 렌더 캐시 생성 완료: {count}개 ({self.render_cache.cache_dir}/)")
+        print(f"✅ 퀴즈 저장소 생성 완료: {quiz_count}문항 ({self.quiz_store.path})")
+
+    def quiz_items(self, day: int, subject: str) -> List[QuizItem]:
+        """특정 날짜·과목의 퀴즈 문항 (퀴즈 저장소 우선 사용, 요약이 없으면 빈 목록)
+
+        한 번 찾은 문항은 인스턴스에 보관해 같은 실행 안에서는 요약 파일을 다시 읽고
+        해시하지 않음
+        """
+        if (day, subject) not in self._quiz_items:
+            self._quiz_items[(day, subject)] = self._load_quiz_items(day, subject)
+        return self._quiz_items[(day, subject)]
+
+    def _load_quiz_items(self, day: int, subject: str) -> List[QuizItem]:
+        """quiz_items의 실제 조회 (요약 해시로 퀴즈 저장소 확인, 없으면 파싱 후 저장)"""
+        record = self.days.get(day)
+        if not record or not getattr(record, subject):
+            return []
+        content = self.load_summary(day, subject)
+        if not content:
+            return []
+
+        key = self.render_cache.key(content)
+        items = self.quiz_store.get(day, subject, key)
+        if items is not None:
+            self.metrics.incr("quiz_store_hits")
+            return items
+
+        self.metrics.incr("quiz_store_misses")
+        # 렌더 캐시에 저장된 섹션 색인 사용 (발송할 때 어차피 렌더링됨)
+        sections = self.render_summary(day, subject, content)['sections']
+        block = find_quiz_block(content, get_section(content, sections, 'quiz'))
+        items = parse_quiz_items(day, subject, block, self.markdown_to_html)
+        self.quiz_store.put(day, subject, key, items)
+        return items
+
+    def review_items(self, day: int, subjects: List[str]) -> List[Tuple[int, QuizItem]]:
+        """Day day 메일의 복습 문항 (상자 번호, 문항) 목록 (간격 반복 일정)"""
+        due = select_review_items(day, subjects, self.quiz_items)
+        self.quiz_store.save()
+        return due
+
+    def get_day_info(self, day: int) -> Optional[DayRecord]:
+        """특정 날짜 정보 가져오기"""
+        return self.days.get(day)
+
+    def get_title(self, day: int, subject: str) -> str:
+        """특정 날짜의 과목 제목 (없으면 과목명)"""
+        record = self.days.get(day)
+        subject_record = getattr(record, subject) if record else None
+        return subject_record.title if subject_record else SUBJECT_LABELS[subject]
+
+    def extract_quiz_from_content(self, content: str) -> str:
+        """마크다운 내용에서 퀴즈 섹션 추출 ("복습 퀴즈" 또는 "오늘의 퀴즈")"""
+        return get_section(content, index_sections(content), 'quiz')
+
+    def render_review_section(self, due: List[Tuple[int, QuizItem]]) -> str:
+        """review_items 결과로 만든 복습 섹션 HTML (복습할 문항이 없으면 빈 문자열)"""
+        if not due:
+            return ""
+        return REVIEW_TEMPLATE.render(
+            count=len(due),
+            items="".join(
+                REVIEW_ITEM_TEMPLATE.render(
+                    icon=SUBJECT_ICONS[item.subject],
+                    label=SUBJECT_LABELS[item.subject],
+                    review_day=item.day,
+                    title=self.get_title(item.day, item.subject),
+                    box=box,
+                    quiz=item.html,
+                )
+                for box, item in due
+            ),
+        )
+
+    def create_html_email(self, day: int, pharma: Optional[Dict], anatomy: Optional[Dict],
+                          total_days: Optional[int] = None,
+                          due: Optional[List[Tuple[int, QuizItem]]] = None) -> str:
+        """HTML 이메일 생성 (pharma/anatomy는 render_summary 결과, None이면 해당 과목 생략)
+
+        due는 review_items 결과. 텍스트 대체본과 같이 만들 때는 한 번 구해 둘 다 넘김
+        (없으면 여기서 구함)
+        """
+        total_days = total_days or self.progress['total_days']
+        rendered = {'pharmacology': pharma, 'anatomy': anatomy}
+        subjects = [subject for subject in SUBJECT_LABELS if rendered[subject]]
+        if due is None:
+            due = self.review_items(day, subjects)
+
+        # 진행률 계산
+        progress = (day / total_days) * 100
+        remaining = total_days - day
+        next_day = day + 1 if day < total_days else day
+
+        # 과목별 섹션 (마크다운 → HTML은 렌더 캐시)
+        subject_sections = "".join(
+            SUBJECT_SECTION_TEMPLATE.render(
+                subject=subject,
+                label=SUBJECT_LABELS[subject],
+                icon=SUBJECT_ICONS[subject],
+                title=self.get_title(day, subject),
+                html=rendered[subject]['html'],
+            )
+            for subject in subjects
+        )
+
+        # 간격 반복 복습 (이전 날짜들의 퀴즈 문항)
+        review_section = self.render_review_section(due)
+
+        # 오늘 날짜
+        today = date.today().strftime('%Y년 %m월 %d일')
+
+        return EMAIL_TEMPLATE.render(
+            day=day,
+            total_days=total_days,
+            today=today,
+            progress=progress,
+            review_section=review_section,
+            subject_sections=subject_sections,
+            remaining=remaining,
+            next_day=next_day,
+        )
+
+    def create_digest_email(self, days: List[int], rendered: Dict[int, Dict[str, Dict]],
+                            total_days: Optional[int] = None,
+                            max_bytes: int = DIGEST_MAX_BYTES) -> str:
+        """여러 날짜를 한 통으로 묶은 HTML 이메일 (rendered: {Day: {과목: render_summary 결과}})
+
+        CSS는 한 번만 넣고, 본문은 렌더 캐시의 HTML을 그대로 이어 붙인 뒤 끝에 묶음 퀴즈를 추가.
+        max_bytes를 넘으면 가장 큰 Day·과목 섹션부터 전체 → 앞부분 → 제목만 순서로 접고,
+        그래도 넘으면 묶음 퀴즈의 뒤쪽 문항을 뺌
+        """
+        total_days = total_days or self.progress['total_days']
+        last_day = days[-1]
+        units = [(day, subject) for day in days for subject in SUBJECT_LABELS if rendered[day].get(subject)]
+
+        def section(day: int, subject: str, html: str) -> str:
+            return SUBJECT_SECTION_TEMPLATE.render(
+                subject=subject,
+                label=SUBJECT_LABELS[subject],
+                icon=SUBJECT_ICONS[subject],
+                title=f"Day {day} · {self.get_title(day, subject)}",
+                html=html,
+            )
+
+        # Day·과목별 접기 단계: 0 전체, 1 앞부분, 2 제목만
+        variants = {
+            (day, subject): [
+                section(day, subject, rendered[day][subject]['html']),
+                section(day, subject, rendered[day][subject]['preview_html'] + DIGEST_PREVIEW_NOTE),
+                section(day, subject, DIGEST_COLLAPSED_NOTE.format(day=day)),
+            ]
+            for day, subject in units
+        }
+        levels = {unit: 0 for unit in units}
+
+        # 묶음 퀴즈 (Day·과목별 앞쪽 DIGEST_QUIZ_ITEMS문항, 퀴즈 저장소 사용)
+        groups = [
+            (day, subject, self.quiz_items(day, subject)[:DIGEST_QUIZ_ITEMS])
+            for day, subject in units
+        ]
+        groups = [group for group in groups if group[2]]
+        self.quiz_store.save()
+
+        def quiz_section(groups: List[Tuple[int, str, List[QuizItem]]]) -> str:
+            if not groups:
+                return ""
+            return DIGEST_QUIZ_TEMPLATE.render(
+                count=sum(len(items) for _, _, items in groups),
+                items="".join(
+                    DIGEST_QUIZ_GROUP_TEMPLATE.render(
+                        icon=SUBJECT_ICONS[subject],
+                        day=day,
+                        label=SUBJECT_LABELS[subject],
+                        quiz="".join(item.html for item in items),
+                    )
+                    for day, subject, items in groups
+                ),
+            )
+
+        def render(quiz: str) -> str:
+            return EMAIL_TEMPLATE.render(
+                day=f"{days[0]}~{last_day}" if len(days) > 1 else last_day,
+                total_days=total_days,
+                today=date.today().strftime('%Y년 %m월 %d일'),
+                progress=(last_day / total_days) * 100,
+                review_section="",
+                subject_sections="".join(variants[unit][levels[unit]] for unit in units) + quiz,
+                remaining=total_days - last_day,
+                next_day=last_day + 1 if last_day < total_days else last_day,
+            )
+
+        def size(text: str) -> int:
+            return len(text.encode('utf-8'))
+
+        # 섹션 크기만 더하고 빼며 접기 (템플릿 전체를 매번 다시 만들지 않음)
+        quiz = quiz_section(groups)
+        total = size(render(quiz))
+        while total > max_bytes:
+            candidates = [unit for unit in units if levels[unit] < 2]
+            if not candidates:
+                break
+            unit = max(candidates, key=lambda unit: size(variants[unit][levels[unit]]))
+            total -= size(variants[unit][levels[unit]]) - size(variants[unit][levels[unit] + 1])
+            levels[unit] += 1
+
+        while total > max_bytes and groups:
+            groups = groups[:-1]
+            shorter = quiz_section(groups)
+            total -= size(quiz) - size(shorter)
+            quiz = shorter
+
+        collapsed = sum(1 for level in levels.values() if level)
+        self.metrics.incr("digest_collapsed_sections", collapsed)
+        html_content = render(quiz)
+        self.metrics.incr("digest_bytes", size(html_content))
+        print(f"📏 묶음 메일 크기: {size(html_content) / 1024:.1f}KB "
+              f"(제한 {max_bytes / 1024:.0f}KB, 접은 섹션 {collapsed}/{len(units)}개)")
+        return html_content
+
+    def render_text_quiz(self, icon: str, heading: str, entries: List[Tuple[str, QuizItem]]) -> str:
+        """퀴즈 문항의 텍스트 대체본 섹션 (entries: (머리말, 문항), 없으면 빈 문자열)"""
+        from email_optimizer import markdown_to_text
+
+        if not entries:
+            return ""
+        return TEXT_SECTION_TEMPLATE.render(
+            icon=icon,
+            heading=heading,
+            text="\n\n".join(
+                "\n".join(line for line in (
+                    label,
+                    f"Q. {markdown_to_text(item.question)}",
+                    f"   정답: {item.answer}" if item.answer else "",
+                    f"   해설: {item.explanation}" if item.explanation else "",
+                ) if line)
+                for label, item in entries
+            ),
+        )
+
+    def create_text_email(self, day: int, pharma: Optional[Dict], anatomy: Optional[Dict],
+                          total_days: Optional[int] = None,
+                          due: Optional[List[Tuple[int, QuizItem]]] = None) -> str:
+        """create_html_email의 텍스트 대체본 (렌더 캐시의 preview_text 사용, 과목별 앞부분만)"""
+        total_days = total_days or self.progress['total_days']
+        rendered = {'pharmacology': pharma, 'anatomy': anatomy}
+        subjects = [subject for subject in SUBJECT_LABELS if rendered[subject]]
+        if due is None:
+            due = self.review_items(day, subjects)
+
+        review_section = self.render_text_quiz("🔁", f"오늘의 복습 ({len(due)}문항)", [
+            (f"[{box}번째 복습] {SUBJECT_ICONS[item.subject]} Day {item.day} "
+             f"{SUBJECT_LABELS[item.subject]}: {self.get_title(item.day, item.subject)}", item)
+            for box, item in due
+        ])
+        subject_sections = "".join(
+            TEXT_SECTION_TEMPLATE.render(
+                icon=SUBJECT_ICONS[subject],
+                heading=f"오늘의 {SUBJECT_LABELS[subject]}: {self.get_title(day, subject)}",
+                text=rendered[subject]['preview_text'] + TEXT_PREVIEW_NOTE,
+            )
+            for subject in subjects
+        )
+
+        return TEXT_EMAIL_TEMPLATE.render(
+            day=day,
+            total_days=total_days,
+            today=date.today().strftime('%Y년 %m월 %d일'),
+            progress=f"{day / total_days * 100:.0f}",
+            review_section=review_section,
+            subject_sections=subject_sections,
+            remaining=total_days - day,
+            next_day=day + 1 if day < total_days else day,
+        )
+
+    def create_digest_text(self, days: List[int], rendered: Dict[int, Dict[str, Dict]],
+                           total_days: Optional[int] = None) -> str:
+        """create_digest_email의 텍스트 대체본 (Day·과목별 앞부분 + 묶음 퀴즈)"""
+        total_days = total_days or self.progress['total_days']
+        last_day = days[-1]
+        units = [(day, subject) for day in days for subject in SUBJECT_LABELS if rendered[day].get(subject)]
+
+        subject_sections = "".join(
+            TEXT_SECTION_TEMPLATE.render(
+                icon=SUBJECT_ICONS[subject],
+                heading=f"오늘의 {SUBJECT_LABELS[subject]}: Day {day} · {self.get_title(day, subject)}",
+                text=rendered[day][subject]['preview_text'] + TEXT_PREVIEW_NOTE,
+            )
+            for day, subject in units
+        )
+        entries = [
+            (f"{SUBJECT_ICONS[subject]} Day {day} {SUBJECT_LABELS[subject]} {item.number}번", item)
+            for day, subject in units
+            for item in self.quiz_items(day, subject)[:DIGEST_QUIZ_ITEMS]
+        ]
+        self.quiz_store.save()
+        quiz_section = self.render_text_quiz("✅", f"묶음 퀴즈 ({len(entries)}문항)", entries)
+
+        return TEXT_EMAIL_TEMPLATE.render(
+            day=f"{days[0]}~{last_day}" if len(days) > 1 else last_day,
+            total_days=total_days,
+            today=date.today().strftime('%Y년 %m월 %d일'),
+            progress=f"{last_day / total_days * 100:.0f}",
+            review_section="",
+            subject_sections=subject_sections + quiz_section,
+            remaining=total_days - last_day,
+            next_day=last_day + 1 if last_day < total_days else last_day,
+        )
+
+    def optimize_email(self, html_content: str, text_content: str = "") -> str:
+        """발송 전 HTML 크기 줄이기 (쓰인 CSS 인라인, 압축) 후 전후 크기 출력
+
+        같은 내용을 여러 수신자에게 보내므로 메시지마다가 아니라 내용마다 한 번만 호출.
+        메시지 크기는 실제로 보내는 MIME 메시지(msg.as_string()) 기준으로, 최적화 전은
+        원래 HTML만 담은 메시지, 최적화 후는 텍스트 대체본까지 담은 메시지
+        """
+        from email_optimizer import EMAIL_OPTIMIZE, optimize_html
+
+        before = len(html_content.encode('utf-8'))
+        message_before = self.message_size(html_content)
+        if EMAIL_OPTIMIZE:
+            with self.metrics.timer("optimize"):
+                html_content = optimize_html(html_content)
+        after = len(html_content.encode('utf-8'))
+        message_after = self.message_size(html_content, text_content)
+        text_bytes = len(text_content.encode('utf-8'))
+
+        self.metrics.incr("html_bytes_before", before)
+        self.metrics.incr("html_bytes_after", after)
+        self.metrics.incr("message_bytes_before", message_before)
+        self.metrics.incr("message_bytes_after", message_after)
+        self.metrics.incr("text_bytes", text_bytes)
+        text_info = f"텍스트 대체본 {text_bytes / 1024:.1f}KB 포함" if text_content else "텍스트 대체본 없음"
+        print(f"📦 메시지 크기: {message_before / 1024:.1f}KB → {message_after / 1024:.1f}KB "
+              f"({(message_after - message_before) / message_before:+.0%}, {text_info})")
+        print(f"   HTML: {before / 1024:.1f}KB → {after / 1024:.1f}KB ({(after - before) / before:+.0%})")
+        return html_content
+
+    def message_size(self, html_content: str, text_content: str = "") -> int:
+        """보낼 MIME 메시지 크기 (인코딩 후 바이트, 수신자 주소 길이 차이는 무시)"""
+        return len(self.build_message("", html_content, "", text_content).as_string().encode('utf-8'))
+
+    def build_message(self, subject: str, html_content: str, recipient: str,
+                      text_content: str = "") -> MIMEMultipart:
+        """수신자 1명에게 보낼 메시지 생성 (text_content가 있으면 텍스트 대체본 포함)"""
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
 
         msg = MIMEMultipart('alternative')
         msg['Subject'] = subject
         msg['From'] = GMAIL_USER
-        msg['To'] = ', '.join(recipients)
+        msg['To'] = recipient
 
-        # HTML 파트 추가
+        # 텍스트 파트를 먼저, HTML 파트를 마지막에 (메일 앱은 표시할 수 있는 마지막 파트를 사용)
+        if text_content:
+            msg.attach(MIMEText(text_content, 'plain', 'utf-8'))
         html_part = MIMEText(html_content, 'html', 'utf-8')
         msg.attach(html_part)
+        return msg
+
+    def get_recipients(self) -> List[str]:
+        """수신자 목록 (쉼표로 구분)"""
+        return [email.strip() for email in RECIPIENT_EMAIL.split(',') if email.strip()]
+
+    def get_delivery_state(self, day: int) -> Dict[str, Dict]:
+        """해당 날짜의 수신자별 발송 상태 (다른 날짜의 상태는 초기화)"""
+        delivery = self.progress.get('delivery')
+        if not delivery or delivery.get('day') != day:
+            delivery = {"day": day, "recipients": {}}
+            self.progress['delivery'] = delivery
+        return delivery['recipients']
+
+    def send_email(self, day: int, html_content: str, retry_count: int = 3, text_content: str = "") -> bool:
+        """이메일 발송 (수신자별 병렬 발송 및 재시도, 발송 상태는 progress.json에 기록)
+
+        이전 실행에서 이미 발송된 수신자는 건너뛰고 실패한 수신자에게만 다시 발송
+        (수신 거부된 주소는 재시도하지 않으며 진도 진행을 막지 않음)
+        """
+        subject = f"📚 Day {day}/{self.progress['total_days']} - 오늘의 학습 자료"
+        recipients = self.get_recipients()
+        states = self.get_delivery_state(day)
 
-        for attempt in range(retry_count):
-            try:
-                # Gmail SMTP 연결
-                with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                    server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
-                    server.sendmail(GMAIL_USER, recipients, msg.as_string())
-
-                print(f"✅ 이메일 발송 성공 (Day {day})")
-                print(f"   수신자: {', '.join(recipients)}")
-                return True
-
-            except Exception as e:
-                if attempt < retry_count - 1:
-                    wait_time = 2 ** attempt
-                    print(f"⚠️  발송 실패 (재시도 {attempt + 1}/{retry_count}): {e}")
-                    print(f"   {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"❌ 이메일 발송 최종 실패: {e}")
-                    return False
-
-        return False
-
-    def update_progress(self):
-        """진도 업데이트"""
+        pending = [r for r in recipients if states.get(r, {}).get('status') not in DELIVERED]
+        if len(pending) < len(recipients):
+            print(f"ℹ️  이미 발송된 수신자 {len(recipients) - len(pending)}명은 건너뜁니다.")
+
+        def record(recipient: str, state: Dict):
+            states[recipient] = state
+            self.save_progress(self.progress)
+
+        from mail_delivery import DeliveryEngine
+
+        engine = DeliveryEngine(GMAIL_USER, GMAIL_APP_PASSWORD, retry_count=retry_count)
+        with self.metrics.timer("send"):
+            results = engine.deliver(
+                {r: self.build_message(subject, html_content, r, text_content) for r in pending},
+                on_update=record
+            )
+        self.record_delivery(results)
+
+        sent = [r for r in pending if states[r]['status'] == 'sent']
+        rejected = [r for r in pending if states[r]['status'] == 'rejected']
+        failed = [r for r in recipients if states[r]['status'] not in DELIVERED]
+        if sent:
+            print(f"✅ 이메일 발송 성공 (Day {day})")
+            print(f"   수신자: {', '.join(sent)}")
+        if rejected:
+            print(f"⚠️  수신 거부된 주소 (재시도 안 함): {', '.join(rejected)}")
+        if failed:
+            print(f"❌ 발송 실패 수신자: {', '.join(failed)}")
+
+        return not failed
+
+    def record_delivery(self, states: Dict[str, Dict]):
+        """수신자별 발송 결과를 메트릭에 반영 (발송/거부/실패 수, 재시도, 보낸 바이트)"""
+        for state in states.values():
+            self.metrics.incr(f"messages_{state['status']}")
+            self.metrics.incr("send_retries", state['attempts'] - 1)
+            self.metrics.incr("bytes_sent", state.get('bytes', 0))
+
+    def write_metrics(self):
+        """메트릭 파일 기록 (METRICS_FILE 설정 시)"""
+        path = self.metrics.write()
+        if path:
+            print(f"📈 메트릭 기록: {path}")
+
+    def update_progress(self, count: int = 1):
+        """진도 업데이트 (count일치를 한 번에 진행하고 한 번만 저장)"""
         today = date.today().isoformat()
-        self.progress['current_day'] += 1
+        self.progress['current_day'] += count
         self.progress['last_sent_date'] = today
-        self.progress['sent_count'] += 1
+        self.progress['sent_count'] += count
+        self.progress.pop('delivery', None)
+        self.progress.pop('catch_up', None)
 
         # 완료 체크
         if self.progress['current_day'] > self.progress['total_days']:
@@ -540,34 +1221,59 @@ class DailyMailer:
         self.save_progress(self.progress)
 
     def run(self):
-        """메일 발송 프로세스 실행"""
+        """메일 발송 프로세스 실행
+
+        발송 확인 → 발송 → 진도 진행을 진도 파일 잠금 안에서 수행하므로
+        여러 실행이 겹쳐도 같은 날짜를 두 번 발송하지 않음
+        """
         print("=" * 60)
         print("📧 매일 학습 메일 발송 시스템")
         print("=" * 60)
 
+        with self.progress_store.lock.hold() as acquired:
+            if not acquired:
+                print("ℹ️  다른 발송이 진행 중입니다. 이번 실행은 건너뜁니다.")
+                return
+
+            # 잠금을 잡은 뒤 다시 읽어 먼저 끝난 실행의 결과를 반영
+            self.progress = self.load_progress()
+            self.send_today()
+
+        print("=" * 60)
+
+    def send_today(self):
+        """오늘 분량 발송 후 진도 진행 (진도 파일 잠금 안에서 호출)"""
         # 발송 여부 확인
         if not self.should_send_today():
             return
 
+        # 실제로 발송할 때만 메일 설정 검증
+        self.validate_config()
+
         current_day = self.progress['current_day']
         print(f"\n📅 오늘 발송: Day {current_day}/{self.progress['total_days']}")
 
-        # 요약 파일 로드
+        # 요약 파일 로드 (렌더 캐시 사용)
         print("\n📖 요약 파일 로드 중...")
-        pharma_content = self.load_summary(current_day, 'pharmacology')
-        anatomy_content = self.load_summary(current_day, 'anatomy')
+        pharma = self.render_summary(current_day, 'pharmacology')
+        anatomy = self.render_summary(current_day, 'anatomy')
 
-        if not pharma_content or not anatomy_content:
+        if not pharma or not anatomy:
             print("❌ 요약 파일을 찾을 수 없습니다.")
             return
 
         # HTML 이메일 생성
         print("🎨 HTML 이메일 생성 중...")
-        html_content = self.create_html_email(current_day, pharma_content, anatomy_content)
+        with self.metrics.timer("render"):
+            due = self.review_items(current_day, list(SUBJECT_LABELS))
+            html_content = self.create_html_email(current_day, pharma, anatomy, due=due)
+            text_content = self.create_text_email(current_day, pharma, anatomy,
+                                                  due=due) if EMAIL_TEXT_PART else ""
+        html_content = self.optimize_email(html_content, text_content)
 
         # 이메일 발송
         print("📤 이메일 발송 중...")
-        success = self.send_email(current_day, html_content)
+        success = self.send_email(current_day, html_content, text_content=text_content)
 
         if success:
             # 진도 업데이트
@@ -576,15 +1282,292 @@ class DailyMailer:
         else:
             print("\n❌ 발송 실패. 나중에 다시 시도하세요.")
 
+    def scheduled_day(self, start_date: date, today: Optional[date] = None) -> int:
+        """시작일 기준으로 오늘까지 발송했어야 하는 마지막 Day (총 일수 이내)"""
+        today = today or date.today()
+        return min(self.progress['total_days'], (today - start_date).days + 1)
+
+    def missed_days(self, start_date: date, today: Optional[date] = None) -> List[int]:
+        """아직 발송하지 않은 Day 중 오늘까지 발송했어야 하는 날짜 (오늘 분량 포함)"""
+        return list(range(self.progress['current_day'], self.scheduled_day(start_date, today) + 1))
+
+    def get_catch_up_state(self) -> Dict[str, Dict]:
+        """여러 날짜 발송(밀린 날짜·주간 묶음)의 수신자별·메시지별 상태 (진도가 바뀌었으면 초기화)
+
+        {수신자: {메시지 키: 상태}} 형식, 메시지 키는 Day 번호 또는 묶음 범위("3~7")
+        """
+        catch_up = self.progress.get('catch_up')
+        if not catch_up or catch_up.get('from_day') != self.progress['current_day']:
+            catch_up = {"from_day": self.progress['current_day'], "recipients": {}}
+            self.progress['catch_up'] = catch_up
+        return catch_up['recipients']
+
+    def run_catch_up(self, start_date: Optional[str] = None, digest: bool = False):
+        """밀린 날짜를 한 번에 발송 (진도 파일 잠금 안에서 확인 → 발송 → 진도 진행)"""
+        print("=" * 60)
+        print("📧 매일 학습 메일 발송 시스템 (밀린 날짜 발송)")
         print("=" * 60)
 
+        start_date = start_date or STUDY_START_DATE
+        if not start_date:
+            raise ValueError("STUDY_START_DATE가 설정되지 않았습니다. (예: 2025-03-02, 또는 --start-date)")
+
+        with self.progress_store.lock.hold() as acquired:
+            if not acquired:
+                print("ℹ️  다른 발송이 진행 중입니다. 이번 실행은 건너뜁니다.")
+                return
+
+            self.progress = self.load_progress()
+            self.send_catch_up(date.fromisoformat(start_date), digest)
+
+        print("=" * 60)
+
+    def send_catch_up(self, start_date: date, digest: bool = False):
+        """밀린 날짜를 한 번에 렌더링하고 하나의 SMTP 연결로 발송
+
+        digest=True면 모든 날짜를 한 통으로 묶어 발송. 모든 메시지가 발송된 경우에만
+        진도를 마지막 날짜까지 한 번에 진행 (일부 실패 시 다음 실행에서 실패한 것만 재발송)
+        """
+        if self.progress.get('completed', False):
+            print("✅ 모든 학습이 완료되었습니다!")
+            return
+
+        days = self.missed_days(start_date)
+        if not days:
+            print(f"ℹ️  밀린 날짜가 없습니다 (다음 발송: Day {self.progress['current_day']})")
+            return
+
+        self.validate_config()
+        print(f"\n📅 발송할 날짜: Day {days[0]}~{days[-1]} ({len(days)}일, 시작일 {start_date})")
+        self.send_days(days, digest, "밀린 학습 자료")
+
+    def send_days(self, days: List[int], digest: bool, title: str):
+        """여러 날짜를 렌더링해 하나의 SMTP 연결로 차례대로 발송 (밀린 날짜 / 주간 묶음 공용)
+
+        digest=True면 모든 날짜를 한 통으로 묶고 제목에 title을 붙임. 모든 메시지가
+        발송된 경우에만 진도를 마지막 날짜까지 한 번에 진행
+        """
+        total_days = self.progress['total_days']
+
+        # 모든 날짜를 한 번에 렌더링 (렌더 캐시 사용)
+        print("\n📖 요약 파일 로드 중...")
+        rendered = {}
+        for day in days:
+            rendered[day] = {subject: self.render_summary(day, subject) for subject in SUBJECT_LABELS}
+            if not all(rendered[day].values()):
+                print(f"❌ Day {day} 요약 파일을 찾을 수 없습니다.")
+                return
+
+        print("🎨 HTML 이메일 생성 중...")
+        with self.metrics.timer("render"):
+            if digest:
+                key = f"{days[0]}~{days[-1]}"
+                contents = [(key, f"📚 Day {key}/{total_days} - {title} ({len(days)}일치)",
+                             self.create_digest_email(days, rendered, total_days),
+                             self.create_digest_text(days, rendered, total_days) if EMAIL_TEXT_PART else "")]
+            else:
+                contents = []
+                for day in days:
+                    pharma, anatomy = rendered[day]['pharmacology'], rendered[day]['anatomy']
+                    due = self.review_items(day, list(SUBJECT_LABELS))
+                    contents.append((
+                        str(day), f"📚 Day {day}/{total_days} - 오늘의 학습 자료",
+                        self.create_html_email(day, pharma, anatomy, total_days, due),
+                        self.create_text_email(day, pharma, anatomy, total_days, due) if EMAIL_TEXT_PART else "",
+                    ))
+        contents = [
+            (key, subject_line, self.optimize_email(html_content, text_content), text_content)
+            for key, subject_line, html_content, text_content in contents
+        ]
+
+        # 이전 실행에서 이미 발송된 수신자·메시지는 건너뜀
+        recipients = self.get_recipients()
+        states = self.get_catch_up_state()
+        batches = [
+            {
+                recipient: self.build_message(subject_line, html_content, recipient, text_content)
+                for recipient in recipients
+                if states.get(recipient, {}).get(key, {}).get('status') not in DELIVERED
+            }
+            for key, subject_line, html_content, text_content in contents
+        ]
+
+        def record(index: int, recipient: str, state: Dict):
+            states.setdefault(recipient, {})[contents[index][0]] = state
+            self.save_progress(self.progress)
+
+        print(f"📤 이메일 발송 중... ({sum(len(batch) for batch in batches)}통)")
+        from mail_delivery import DeliveryEngine
+
+        with self.metrics.timer("send"):
+            # 하나의 SMTP 세션으로 Day 순서대로 발송 (연결 풀 없이)
+            engine = DeliveryEngine(GMAIL_USER, GMAIL_APP_PASSWORD, concurrency=1)
+            results = engine.deliver_batches(batches, on_update=record)
+        for result in results:
+            self.record_delivery(result)
+
+        failed = [
+            f"{recipient} (Day {key})"
+            for key, _, _, _ in contents
+            for recipient in recipients
+            if states.get(recipient, {}).get(key, {}).get('status') not in DELIVERED
+        ]
+        if failed:
+            print(f"\n❌ 발송 실패: {', '.join(failed)}")
+            print("   진도는 그대로 두고, 다음 실행 때 실패한 메시지만 다시 발송합니다.")
+            return
+
+        # 모두 발송된 경우에만 진도를 한 번에 진행
+        self.update_progress(len(days))
+        print(f"\n✅ 완료! Day {days[0]}~{days[-1]} 발송, 다음 발송: Day {self.progress['current_day']}")
+
+    def run_weekly(self):
+        """주간 묶음 발송 (진도 파일 잠금 안에서 확인 → 발송 → 진도 진행)"""
+        print("=" * 60)
+        print("📧 매일 학습 메일 발송 시스템 (주간 묶음)")
+        print("=" * 60)
+
+        with self.progress_store.lock.hold() as acquired:
+            if not acquired:
+                print("ℹ️  다른 발송이 진행 중입니다. 이번 실행은 건너뜁니다.")
+                return
+
+            self.progress = self.load_progress()
+            self.send_weekly()
+
+        print("=" * 60)
+
+    def send_weekly(self, days_per_digest: int = DIGEST_DAYS):
+        """현재 진도부터 days_per_digest일치를 한 통으로 묶어 발송"""
+        if not self.should_send_today():
+            return
+
+        self.validate_config()
+        current_day = self.progress['current_day']
+        last_day = min(current_day + days_per_digest - 1, self.progress['total_days'])
+        days = list(range(current_day, last_day + 1))
+        print(f"\n📅 이번 주 발송: Day {days[0]}~{days[-1]} ({len(days)}일치)")
+        self.send_days(days, True, "주간 학습 자료")
+
+    def run_cohorts(self, store: Optional[SubscriberStore] = None):
+        """구독자별 진도에 맞춰 발송
+
+        같은 Day·과목 조합의 구독자를 묶어 이메일을 한 번만 렌더링하고 모두에게 발송
+        (실행 비용은 구독자 수가 아니라 서로 다른 Day 수에 비례)
+        """
+        print("=" * 60)
+        print("📧 매일 학습 메일 발송 시스템 (구독자별 진도)")
+        print("=" * 60)
+
+        from subscriber_store import SubscriberStore
+
+        self.validate_config(require_recipients=False)
+        store = store or SubscriberStore()
+        with FileLock(store.db_path).hold() as acquired:
+            if not acquired:
+                print("ℹ️  다른 발송이 진행 중입니다. 이번 실행은 건너뜁니다.")
+                return
+            self.send_cohorts(store)
+
+        print("=" * 60)
+
+    def send_cohorts(self, store: SubscriberStore):
+        """구독자별 오늘 분량 발송 후 진도 진행 (구독자 저장소 잠금 안에서 호출)"""
+        today = date.today().isoformat()
+        total_days = max(self.days) if self.days else 0
+
+        store.mark_completed(total_days)
+        subscribers = store.due(today)
+        if not subscribers:
+            print("ℹ️  오늘 발송할 구독자가 없습니다.")
+            return
+
+        groups: Dict[Tuple[int, Tuple[str, ...]], List[Subscriber]] = {}
+        for subscriber in subscribers:
+            groups.setdefault((subscriber.current_day, subscriber.subjects), []).append(subscriber)
+
+        print(f"\n📅 발송 대상: {len(subscribers)}명 ({len(groups)}개 Day·과목 조합)")
+
+        # 조합별로 한 번만 렌더링
+        print("\n🎨 HTML 이메일 생성 중...")
+        messages = {}
+        for (day, subjects), members in sorted(groups.items()):
+            rendered = {subject: self.render_summary(day, subject) for subject in subjects}
+            if not all(rendered.values()):
+                print(f"❌ Day {day} 요약 파일을 찾을 수 없습니다. ({len(members)}명 건너뜀)")
+                continue
+
+            with self.metrics.timer("render"):
+                due = self.review_items(day, list(subjects))
+                html_content = self.create_html_email(
+                    day, rendered.get('pharmacology'), rendered.get('anatomy'), total_days, due
+                )
+                text_content = self.create_text_email(
+                    day, rendered.get('pharmacology'), rendered.get('anatomy'), total_days, due
+                ) if EMAIL_TEXT_PART else ""
+            html_content = self.optimize_email(html_content, text_content)
+            subject_line = f"📚 Day {day}/{total_days} - 오늘의 학습 자료"
+            for member in members:
+                messages[member.email] = self.build_message(subject_line, html_content,
+                                                            member.email, text_content)
+
+            labels = ', '.join(SUBJECT_LABELS[subject] for subject in subjects)
+            print(f"   - Day {day} ({labels}): {len(members)}명")
+
+        # 모든 조합을 한 번에 발송 (연결 풀 공유)
+        print("\n📤 이메일 발송 중...")
+        from mail_delivery import DeliveryEngine
+
+        with self.metrics.timer("send"):
+            states = DeliveryEngine(GMAIL_USER, GMAIL_APP_PASSWORD).deliver(messages)
+        self.record_delivery(states)
+
+        sent = [email for email, state in states.items() if state['status'] == 'sent']
+        rejected = [email for email, state in states.items() if state['status'] == 'rejected']
+        store.mark_sent(sent, today, total_days)
+        store.mark_bounced(rejected, today)
+
+        print(f"\n✅ 발송 완료: {len(sent)}/{len(subscribers)}명")
+        if rejected:
+            print(f"⚠️  수신 거부된 주소는 이후 발송에서 제외합니다 (다시 add하면 재개): {', '.join(rejected)}")
+        failed = len(messages) - len(sent) - len(rejected)
+        if failed:
+            print(f"❌ 발송 실패 {failed}명은 다음 실행 때 다시 발송합니다.")
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 요약을 이메일로 발송")
+    parser.add_argument('--prerender', action='store_true',
+                        help="모든 날짜의 요약을 미리 HTML로 변환 (렌더 캐시 생성, 발송 안 함)")
+    parser.add_argument('--cohorts', action='store_true',
+                        help="subscribers.db의 구독자별 진도에 맞춰 발송")
+    parser.add_argument('--catch-up', action='store_true',
+                        help="학습 시작일(STUDY_START_DATE) 기준으로 밀린 날짜를 한 번에 발송")
+    parser.add_argument('--digest', action='store_true',
+                        help="--catch-up에서 밀린 날짜를 한 통으로 묶어 발송")
+    parser.add_argument('--weekly', action='store_true',
+                        help="현재 진도부터 DIGEST_DAYS일치를 한 통으로 묶어 발송")
+    parser.add_argument('--start-date', help="--catch-up 학습 시작일 (YYYY-MM-DD, STUDY_START_DATE 대신)")
+    args = parser.parse_args()
+
+    mailer = None
     try:
         mailer = DailyMailer()
-        mailer.run()
+        if args.prerender:
+            mailer.prerender_all()
+        elif args.cohorts:
+            mailer.run_cohorts()
+        elif args.catch_up:
+            mailer.run_catch_up(args.start_date, digest=args.digest)
+        elif args.weekly:
+            mailer.run_weekly()
+        else:
+            mailer.run()
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
         exit(1)
+    finally:
+        if mailer is not None:
+            mailer.write_metrics()
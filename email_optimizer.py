@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+email_optimizer.py - 발송 전 이메일 크기 줄이기 (daily_mailer.py에서 사용)
+
+- CSS 인라인: <style> 규칙 중 문서에서 실제로 쓰인 것만 남기고, @media 밖의 규칙은 모두
+  요소의 style 속성으로 옮김 (<style>을 지우는 메일 앱에서도 레이아웃 유지)
+  인라인할 수 없는 규칙(@media, :last-of-type 같은 의사 클래스, *)만 압축해 <style>에 남기고
+  인라인 스타일보다 우선하도록 !important를 붙임 (* 초기화 규칙은 원래대로 가장 약하게 둠)
+- HTML 압축: 주석 제거, 블록 요소 앞뒤 공백 제거, 연속 공백을 한 칸으로 (<pre> 안은 그대로)
+- 텍스트 대체본: 요약 마크다운을 일반 텍스트로 변환 (HTML을 표시하지 않는 메일 앱용)
+
+인라인할 수 있는 선택자: 태그, .클래스, 태그.클래스, 자손 결합(공백), 쉼표 목록
+
+실행 방법 (크기 비교):
+- python email_optimizer.py 메일.html
+"""
+
+import os
+import re
+import sys
+from functools import lru_cache
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# 발송 전 HTML 최적화 사용 여부 (텍스트 대체본은 항상 추가)
+EMAIL_OPTIMIZE = os.getenv('EMAIL_OPTIMIZE', 'true').lower() not in ('0', 'false', 'no')
+
+# CSS
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+STYLE_BLOCK_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+CLASS_ATTR_PATTERN = re.compile(r'class\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+SELECTOR_CLASS_PATTERN = re.compile(r'\.([\w-]+)')
+COMPOUND_PATTERN = re.compile(r'^([a-z][a-z0-9]*)?((?:\.[\w-]+)*)$', re.IGNORECASE)
+
+# HTML
+WHITESPACE_PATTERN = re.compile(r'\s+')
+BLOCK_TAGS = frozenset({
+    'html', 'head', 'body', 'title', 'meta', 'link', 'style', 'div', 'p', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'table', 'thead', 'tbody', 'tfoot',
+    'tr', 'th', 'td', 'blockquote', 'pre', 'hr', 'br', 'section', 'header', 'footer',
+})
+VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'})
+PRESERVE_TAGS = frozenset({'pre', 'textarea'})
+
+# 마크다운 → 텍스트
+FENCE_PATTERN = re.compile(r'^[ \t]*(```|~~~)')
+HEADING_LINE_PATTERN = re.compile(r'^#{1,6}[ \t]+(.*?)[ \t#]*$')
+RULE_LINE_PATTERN = re.compile(r'^[ \t]*([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^[ \t]*\|?(?:[ \t]*:?-{3,}:?[ \t]*\|?)+[ \t]*$')
+LIST_MARKER_PATTERN = re.compile(r'^([ \t]*)[*+-][ \t]+')
+LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(([^)\s]*)[^)]*\)')
+EMPHASIS_PATTERN = re.compile(r'(\*\*|__|\*|~~)(?=\S)(.+?)(?<=\S)\1')
+INLINE_CODE_PATTERN = re.compile(r'`([^`\n]*)`')
+HTML_TAG_PATTERN = re.compile(r'<[^>\n]+>')
+ESCAPE_PATTERN = re.compile(r'\\([\\`*_{}\[\]()#+\-.!|>])')
+
+# 선택자 한 단계 (태그, 클래스 집합)
+Compound = Tuple[Optional[str], FrozenSet[str]]
+Declarations = List[Tuple[str, str]]
+
+
+def parse_declarations(text: str) -> Declarations:
+    """"color: #333; padding: 0" → [("color", "#333"), ("padding", "0")]"""
+    declarations = []
+    for part in text.split(';'):
+        name, sep, value = part.partition(':')
+        if sep and name.strip() and value.strip():
+            declarations.append((name.strip().lower(), " ".join(value.split())))
+    return declarations
+
+
+def parse_rules(css: str) -> List[Tuple[str, object]]:
+    """CSS를 (선택자 목록, 선언) 또는 ("@media ...", 내부 규칙) 목록으로 분리 (중첩 1단계)"""
+    css = CSS_COMMENT_PATTERN.sub('', css)
+    rules = []
+    position = 0
+    while True:
+        brace = css.find('{', position)
+        if brace < 0:
+            return rules
+        prelude = " ".join(css[position:brace].split())
+        if prelude.startswith('@'):
+            depth, end = 1, brace + 1
+            while depth and end < len(css):
+                depth += {'{': 1, '}': -1}.get(css[end], 0)
+                end += 1
+            rules.append((prelude, parse_rules(css[brace + 1:end - 1])))
+        else:
+            end = css.find('}', brace)
+            end = len(css) if end < 0 else end + 1
+            rules.append((prelude, parse_declarations(css[brace + 1:end - 1])))
+        position = end
+
+
+def compile_selector(selector: str) -> Optional[List[Compound]]:
+    """인라인할 수 있는 선택자면 단계 목록, 아니면 None (*, 의사 클래스, >, 속성 등)"""
+    compounds = []
+    for part in selector.split():
+        match = COMPOUND_PATTERN.match(part)
+        if not match or not part:
+            return None
+        tag = match.group(1).lower() if match.group(1) else None
+        classes = frozenset(name for name in match.group(2).split('.') if name)
+        compounds.append((tag, classes))
+    return compounds or None
+
+
+def compound_matches(compound: Compound, tag: str, classes: FrozenSet[str]) -> bool:
+    return (compound[0] is None or compound[0] == tag) and compound[1] <= classes
+
+
+def selector_matches(compounds: List[Compound], tag: str, classes: FrozenSet[str],
+                     ancestors: List[Tuple[str, FrozenSet[str]]]) -> bool:
+    """자손 결합만 있으므로 오른쪽부터 가장 가까운 조상을 차례로 찾으면 됨"""
+    if not compound_matches(compounds[-1], tag, classes):
+        return False
+    i = len(ancestors) - 1
+    for compound in reversed(compounds[:-1]):
+        while i >= 0 and not compound_matches(compound, *ancestors[i]):
+            i -= 1
+        if i < 0:
+            return False
+        i -= 1
+    return True
+
+
+def property_family(name: str) -> str:
+    """축약/개별 속성을 같은 것으로 보기 위한 이름 (margin-top → margin, border-bottom → border)"""
+    return name.split('-')[0]
+
+
+def declaration_text(declarations: Declarations, important: bool = False) -> str:
+    suffix = "!important" if important else ""
+    return ";".join(
+        f"{name}:{value}" + ("" if value.endswith("!important") else suffix)
+        for name, value in declarations
+    )
+
+
+class CSSRule:
+    """선택자 1개짜리 CSS 규칙 (쉼표 목록은 선택자별로 나눔, order가 같으면 원래 같은 규칙)"""
+
+    __slots__ = ('order', 'selector', 'declarations', 'media', 'compounds', 'rank', 'classes', 'families')
+
+    def __init__(self, order: int, selector: str, declarations: Declarations, media: str = ""):
+        self.order = order
+        self.selector = selector
+        self.declarations = declarations
+        self.media = media
+        self.compounds = compile_selector(selector)
+        specificity = (
+            (sum(len(c[1]) for c in self.compounds), sum(1 for c in self.compounds if c[0]))
+            if self.compounds else (0, 0)
+        )
+        self.rank = (specificity, order)
+        self.classes = frozenset(SELECTOR_CLASS_PATTERN.findall(selector))
+        self.families = frozenset(property_family(name) for name, _ in declarations)
+
+    @property
+    def inlinable(self) -> bool:
+        """@media 안의 규칙과 지원하지 않는 선택자는 인라인할 수 없음"""
+        return not self.media and self.compounds is not None
+
+    @property
+    def important(self) -> bool:
+        """<style>에 남길 때 인라인 스타일보다 우선하도록 !important (* 초기화 규칙은 제외)"""
+        return self.selector != '*'
+
+    def css(self) -> str:
+        return f"{self.selector}{{{declaration_text(self.declarations, self.important)}}}"
+
+
+class Stylesheet:
+    """<style> 내용을 선택자 1개짜리 규칙 목록으로 펼친 것 (원래 순서 유지)"""
+
+    def __init__(self, css: str):
+        self.rules: List[CSSRule] = []
+        order = 0
+        for prelude, body in parse_rules(css):
+            if prelude.startswith('@'):
+                for selectors, declarations in body:
+                    order += 1
+                    self.rules += [CSSRule(order, selector.strip(), declarations, prelude)
+                                   for selector in selectors.split(',') if declarations]
+            elif body:
+                order += 1
+                self.rules += [CSSRule(order, selector.strip(), body) for selector in prelude.split(',')]
+        # 요소와 비교할 수 있는 규칙 번호 (명시도·순서대로 적용)
+        self.matchable = sorted((i for i, rule in enumerate(self.rules) if rule.compounds),
+                                key=lambda i: self.rules[i].rank)
+
+    def match(self, tag: str, classes: FrozenSet[str],
+              ancestors: List[Tuple[str, FrozenSet[str]]]) -> Tuple[int, ...]:
+        """요소에 적용되는 규칙 번호 (@media 안의 규칙 포함, 명시도·순서대로)"""
+        return tuple(i for i in self.matchable
+                     if selector_matches(self.rules[i].compounds, tag, classes, ancestors))
+
+    def choose_inline(self, matches: Dict[Tuple[int, ...], int]) -> Tuple[Set[int], Set[int]]:
+        """인라인할 규칙 번호와 <style>에도 함께 남길 규칙 번호 (matches: 요소별 적용 규칙 → 요소 수)
+
+        요소에 적용되는 @media 밖의 규칙은 모두 인라인. <style>에 남긴 @media 규칙(!important)이
+        원래 명시도가 더 높은 규칙까지 덮어쓰지 않도록, 남긴 규칙보다 우선하던 규칙은
+        인라인하면서 <style>에도 함께 남김
+        """
+        inline = {i for matched in matches for i in matched if self.rules[i].inlinable}
+
+        repeated: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for matched in matches:
+                for position, i in enumerate(matched):
+                    if i in inline and i not in repeated:
+                        continue
+                    families = self.rules[i].families
+                    for stronger in matched[position + 1:]:
+                        if stronger not in repeated and families & self.rules[stronger].families:
+                            repeated.add(stronger)
+                            changed = True
+        return inline, repeated
+
+    def residual_css(self, inline: Set[int], repeated: Set[int], matched: Set[int],
+                     used_classes: Set[str]) -> Tuple[str, Set[int]]:
+        """<style>에 남길 CSS와 그 규칙 번호 (인라인한 규칙, 쓰이지 않은 규칙은 제외)
+
+        인라인했어도 repeated에 있으면 남기고, 원래 같은 규칙에서 나온 선택자는
+        다시 쉼표로 묶어 원래 순서대로 씀
+        """
+        kept = [
+            i for i, rule in enumerate(self.rules)
+            if (i not in inline or i in repeated)
+            and (i in matched if rule.compounds else rule.classes <= used_classes)
+        ]
+        out = []
+        media = ""
+        for group in groupby_order([self.rules[i] for i in kept]):
+            rule = group[0]
+            if rule.media != media:
+                if media:
+                    out.append("}")
+                if rule.media:
+                    out.append(f"{rule.media}{{")
+                media = rule.media
+            selectors = ",".join(r.selector for r in group)
+            out.append(f"{selectors}{{{declaration_text(rule.declarations, rule.important)}}}")
+        if media:
+            out.append("}")
+        return "".join(out), set(kept)
+
+
+def groupby_order(rules: List[CSSRule]) -> List[List[CSSRule]]:
+    """연속된 같은 원래 규칙끼리 묶기"""
+    groups: List[List[CSSRule]] = []
+    for rule in rules:
+        if groups and groups[-1][0].order == rule.order:
+            groups[-1].append(rule)
+        else:
+            groups.append([rule])
+    return groups
+
+
+@lru_cache(maxsize=8)
+def load_stylesheet(css: str) -> Stylesheet:
+    """같은 CSS(이메일 템플릿)는 한 번만 파싱"""
+    return Stylesheet(css)
+
+
+def escape_attribute(value: str) -> str:
+    return value.replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+class EmailRewriter(HTMLParser):
+    """HTML을 한 번 파싱해 이벤트와 요소별 적용 규칙을 모은 뒤, 인라인·압축해 다시 씀"""
+
+    def __init__(self, stylesheet: Stylesheet):
+        super().__init__(convert_charrefs=False)
+        self.stylesheet = stylesheet
+        self.events: List[Tuple] = []
+        self.stack: List[Tuple[str, FrozenSet[str]]] = []
+        self.memo: Dict[Tuple, Tuple[int, ...]] = {}
+        self.matches: Dict[Tuple[int, ...], int] = {}
+        self.in_style = False
+        self.preserve = 0
+
+    # 1단계: 파싱
+    def element(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> Tuple:
+        attributes = dict(attrs)
+        classes = frozenset((attributes.get('class') or "").split())
+        key = (tuple(self.stack), tag, classes)
+        matched = self.memo.get(key)
+        if matched is None:
+            matched = self.memo[key] = self.stylesheet.match(tag, classes, self.stack)
+        self.matches[matched] = self.matches.get(matched, 0) + 1
+        return ('tag', tag, attributes, matched)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'style':
+            self.in_style = True
+            return
+        self.events.append(self.element(tag, attrs))
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, frozenset((dict(attrs).get('class') or "").split())))
+            self.preserve += tag in PRESERVE_TAGS
+
+    def handle_startendtag(self, tag, attrs):
+        self.events.append(self.element(tag, attrs))
+
+    def handle_endtag(self, tag):
+        if tag == 'style':
+            self.in_style = False
+            if ('style',) not in self.events:
+                self.events.append(('style',))
+            return
+        if tag in VOID_TAGS:
+            return
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                for open_tag, _ in self.stack[i:]:
+                    self.preserve -= open_tag in PRESERVE_TAGS
+                del self.stack[i:]
+                break
+        self.events.append(('end', tag))
+
+    def handle_data(self, data):
+        if not self.in_style:
+            self.events.append(('raw' if self.preserve else 'text', data))
+
+    def handle_entityref(self, name):
+        self.events.append(('raw', f"&{name};"))
+
+    def handle_charref(self, name):
+        self.events.append(('raw', f"&#{name};"))
+
+    def handle_comment(self, data):
+        if data.startswith('[if'):
+            self.events.append(('block', f"<!--{data}-->"))
+
+    def handle_decl(self, decl):
+        self.events.append(('block', f"<!{decl}>"))
+
+    # 2단계: 다시 쓰기 (블록 요소 앞뒤 공백은 버리고, 글자/인라인 요소 사이 공백은 한 칸으로)
+    def render(self, inline: Set[int], css: str, kept_classes: Set[str], important: Set[str]) -> str:
+        out: List[str] = []
+        pending_space = False
+        after_block = True
+        styles: Dict[Tuple[int, ...], Dict[str, str]] = {}
+
+        def emit(text: str, block: bool):
+            nonlocal pending_space, after_block
+            if pending_space and not block and not after_block:
+                out.append(" ")
+            pending_space = False
+            after_block = block
+            out.append(text)
+
+        for event in self.events:
+            kind = event[0]
+            if kind == 'tag':
+                _, tag, attributes, matched = event
+                inherited = styles.get(matched)
+                if inherited is None:
+                    inherited = styles[matched] = {}
+                    for i in matched:
+                        if i in inline:
+                            inherited.update(self.stylesheet.rules[i].declarations)
+                own = parse_declarations(attributes.get('style') or "")
+                if inherited or own:
+                    merged = dict(inherited)
+                    merged.update(
+                        (name, value + "!important"
+                         if property_family(name) in important and not value.endswith("!important")
+                         else value)
+                        for name, value in own
+                    )
+                    attributes = dict(attributes, style=declaration_text(list(merged.items())))
+                if 'class' in attributes:
+                    kept = [name for name in (attributes['class'] or "").split() if name in kept_classes]
+                    attributes = dict(attributes, **{'class': " ".join(kept)}) if kept else {
+                        name: value for name, value in attributes.items() if name != 'class'}
+                parts = [tag] + [
+                    name if value is None else f'{name}="{escape_attribute(value)}"'
+                    for name, value in attributes.items()
+                ]
+                emit("<" + " ".join(parts) + ">", tag in BLOCK_TAGS)
+            elif kind == 'end':
+                emit(f"</{event[1]}>", event[1] in BLOCK_TAGS)
+            elif kind == 'text':
+                text = WHITESPACE_PATTERN.sub(' ', event[1])
+                if text.startswith(' '):
+                    pending_space = True
+                    text = text[1:]
+                if text:
+                    emit(text.rstrip(' '), False)
+                    pending_space = text.endswith(' ')
+            elif kind == 'raw':
+                emit(event[1], False)
+            elif kind == 'style':
+                if css:
+                    emit(f"<style>{css}</style>", True)
+            else:
+                emit(event[1], True)
+        return "".join(out)
+
+
+def optimize_html(html: str) -> str:
+    """쓰인 CSS만 남겨 인라인(또는 <style>에 압축)하고 HTML 압축"""
+    stylesheet = load_stylesheet("\n".join(STYLE_BLOCK_PATTERN.findall(html)))
+    used_classes: Set[str] = set()
+    for value in CLASS_ATTR_PATTERN.findall(html):
+        used_classes.update(value.split())
+
+    rewriter = EmailRewriter(stylesheet)
+    rewriter.feed(html)
+    rewriter.close()
+
+    inline, repeated = stylesheet.choose_inline(rewriter.matches)
+    matched = {i for key in rewriter.matches for i in key}
+    css, kept = stylesheet.residual_css(inline, repeated, matched, used_classes)
+    kept_rules = [stylesheet.rules[i] for i in kept]
+    kept_classes = set().union(*(rule.classes for rule in kept_rules))
+    important = set().union(*(rule.families for rule in kept_rules if rule.important))
+    return rewriter.render(inline, css, kept_classes, important)
+
+
+def inline_markdown(text: str) -> str:
+    """한 줄 안의 마크다운 서식 제거 (링크는 "글자 (주소)")"""
+    text = INLINE_CODE_PATTERN.sub(r'\1', text)
+    text = LINK_PATTERN.sub(lambda m: m.group(2) if m.group(1) else f"{m.group(2)} ({m.group(3)})", text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    previous = None
+    while previous != text:  # **굵게 *기울임*** 처럼 겹친 서식
+        previous, text = text, EMPHASIS_PATTERN.sub(r'\2', text)
+    return ESCAPE_PATTERN.sub(r'\1', text)
+
+
+def markdown_to_text(markdown_text: str) -> str:
+    """요약 마크다운을 텍스트 대체본용 일반 텍스트로 변환"""
+    lines = []
+    in_fence = False
+    for line in markdown_text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            lines.append(line)
+            continue
+
+        line = line.rstrip()
+        heading = HEADING_LINE_PATTERN.match(line)
+        if heading:
+            if lines and lines[-1]:
+                lines.append("")
+            lines.append(f"■ {inline_markdown(heading.group(1))}")
+        elif RULE_LINE_PATTERN.match(line):
+            lines.append("")
+        elif TABLE_SEPARATOR_PATTERN.match(line) and '-' in line:
+            continue
+        elif line.lstrip().startswith('|'):
+            cells = [inline_markdown(cell.strip()) for cell in line.strip().strip('|').split('|')]
+            lines.append(" | ".join(cells))
+        else:
+            lines.append(inline_markdown(LIST_MARKER_PATTERN.sub(r'\1- ', line)))
+
+    text = "\n".join(lines).strip()
+    return re.sub(r'\n{3,}', '\n\n', text)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("사용법: python email_optimizer.py 메일.html")
+        sys.exit(1)
+
+    html = Path(sys.argv[1]).read_text(encoding='utf-8')
+    optimized = optimize_html(html)
+    before, after = len(html.encode('utf-8')), len(optimized.encode('utf-8'))
+    print(f"📦 HTML 크기: {before / 1024:.1f}KB → {after / 1024:.1f}KB ({(after - before) / before:+.0%})")
+
+
+if __name__ == "__main__":
+    main()
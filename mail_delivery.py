@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+mail_delivery.py - SMTP 발송 (수신자별 병렬 발송 및 재시도)
+
+daily_mailer.py가 실제로 발송할 때만 import
+(asyncio/smtplib 로딩 비용을 발송하지 않는 날에는 내지 않음)
+"""
+
+import os
+import asyncio
+import smtplib
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Type
+
+# SMTP 서버 (로컬 테스트 시 SMTP_HOST=localhost SMTP_PORT=1025 SMTP_SSL=false)
+SMTP_HOST = os.getenv('SMTP_HOST', 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '465'))
+SMTP_SSL = os.getenv('SMTP_SSL', 'true').lower() not in ('0', 'false', 'no')
+
+# 동시 발송 수 (동시에 여는 SMTP 연결 수)
+MAIL_CONCURRENCY = int(os.getenv('MAIL_CONCURRENCY', '4'))
+
+
+class SMTPDelivery:
+    """SMTP 발송 연결 (배치 전체에서 하나의 인증된 연결을 재사용, 실패 시에만 재연결)"""
+
+    def __init__(self, user: str, password: str, host: str = SMTP_HOST, port: int = SMTP_PORT,
+                 smtp_class: Optional[Type[smtplib.SMTP]] = None):
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.smtp_class = smtp_class or (smtplib.SMTP_SSL if SMTP_SSL else smtplib.SMTP)
+        self.server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connect(self):
+        """연결 및 로그인 (AUTH를 지원하지 않는 로컬 테스트 서버는 로그인 생략)
+
+        로그인 등이 실패하면 연결을 닫아, 다음 시도가 인증되지 않은 연결을 재사용하지 않게 함
+        """
+        self.server = self.smtp_class(self.host, self.port)
+        try:
+            self.server.ehlo_or_helo_if_needed()
+            if self.password and self.server.has_extn('auth'):
+                self.server.login(self.user, self.password)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """연결 종료 (이미 끊긴 연결은 무시)"""
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+        except OSError:
+            pass
+        self.server = None
+
+    def send(self, msg: MIMEMultipart, recipient: str) -> int:
+        """메시지 1통 발송 후 보낸 바이트 수 반환
+
+        연결이 없으면 새로 연결하고, 실패하면 연결을 버려 다음 시도에서 재연결
+        (수신자 거부는 smtplib이 RSET으로 세션을 정리하므로 연결을 계속 사용)
+        """
+        if self.server is None:
+            self.connect()
+        data = msg.as_string()
+        try:
+            self.server.sendmail(self.user, [recipient], data)
+        except smtplib.SMTPRecipientsRefused:
+            raise
+        except Exception:
+            self.close()
+            raise
+        return len(data.encode('utf-8'))
+
+
+class DeliveryEngine:
+    """수신자별 비동기 병렬 발송
+
+    동시 발송 수는 SMTP 연결 풀 크기로 제한하고, 재시도 대기는 수신자별로 독립적으로
+    진행 (대기 중에는 연결을 다른 수신자가 사용)
+    """
+
+    def __init__(self, user: str, password: str, concurrency: int = MAIL_CONCURRENCY,
+                 retry_count: int = 3, **smtp_options):
+        self.user = user
+        self.password = password
+        self.concurrency = max(1, concurrency)
+        self.retry_count = retry_count
+        self.smtp_options = smtp_options
+
+    def deliver(self, messages: Dict[str, MIMEMultipart],
+                on_update: Optional[Callable[[str, Dict], None]] = None) -> Dict[str, Dict]:
+        """{수신자: 메시지} 발송 후 {수신자: 발송 상태} 반환
+
+        on_update(수신자, 상태)는 수신자별 발송이 끝날 때마다 작업 스레드에서 한 번에 하나씩 호출
+        """
+        notify = (lambda _, recipient, state: on_update(recipient, state)) if on_update else None
+        return self.deliver_batches([messages], notify)[0]
+
+    def deliver_batches(self, batches: List[Dict[str, MIMEMultipart]],
+                        on_update: Optional[Callable[[int, str, Dict], None]] = None) -> List[Dict[str, Dict]]:
+        """여러 묶음을 순서대로 발송 (앞 묶음이 끝나야 다음 묶음 시작)
+
+        연결 풀은 전체 묶음이 공유하므로 밀린 여러 날짜를 보내도 SMTP 연결은 한 번만 맺음
+        on_update(묶음 번호, 수신자, 상태)는 수신자별 발송이 끝날 때마다 작업 스레드에서 한 번에 하나씩 호출
+        """
+        return asyncio.run(self._deliver_all(batches, on_update))
+
+    async def _deliver_all(self, batches: List[Dict[str, MIMEMultipart]],
+                           on_update: Optional[Callable[[int, str, Dict], None]]) -> List[Dict[str, Dict]]:
+        connections = asyncio.Queue()
+        largest = max((len(messages) for messages in batches), default=0)
+        pool = [SMTPDelivery(self.user, self.password, **self.smtp_options)
+                for _ in range(min(self.concurrency, largest))]
+        for delivery in pool:
+            connections.put_nowait(delivery)
+
+        # on_update(진도 저장, fsync)는 이벤트 루프를 막지 않도록 스레드에서 한 번에 하나씩 실행
+        updates = asyncio.Lock()
+
+        async def notify(index: int, recipient: str, state: Dict):
+            async with updates:
+                await asyncio.to_thread(on_update, index, recipient, state)
+
+        results = []
+        try:
+            for index, messages in enumerate(batches):
+                states = await asyncio.gather(*(
+                    self._deliver_one(recipient, msg, connections,
+                                      partial(notify, index) if on_update else None)
+                    for recipient, msg in messages.items()
+                ))
+                results.append(dict(zip(messages, states)))
+        finally:
+            for delivery in pool:
+                await asyncio.to_thread(delivery.close)
+
+        return results
+
+    async def _deliver_one(self, recipient: str, msg: MIMEMultipart, connections: asyncio.Queue,
+                           on_update: Optional[Callable[[str, Dict], Awaitable[None]]]) -> Dict:
+        state = {"status": "failed", "attempts": 0, "error": None}
+
+        for attempt in range(self.retry_count):
+            state['attempts'] = attempt + 1
+            delivery = await connections.get()
+            try:
+                size = await asyncio.to_thread(delivery.send, msg, recipient)
+                state.update(status="sent", error=None, bytes=size)
+                break
+
+            except Exception as e:
+                state['error'] = str(e)
+                # 존재하지 않는 주소 등 영구 오류는 재시도하지 않음
+                if isinstance(e, smtplib.SMTPRecipientsRefused) and all(
+                        code >= 500 for code, _ in e.recipients.values()):
+                    print(f"❌ 수신 거부 ({recipient}): {e}")
+                    state['status'] = "rejected"
+                    break
+
+            finally:
+                connections.put_nowait(delivery)
+
+            if attempt < self.retry_count - 1:
+                wait_time = 2 ** attempt
+                print(f"⚠️  발송 실패 ({recipient}, 재시도 {attempt + 1}/{self.retry_count}): {state['error']}")
+                print(f"   {wait_time}초 후 재시도...")
+                await asyncio.sleep(wait_time)
+            else:
+                print(f"❌ 이메일 발송 최종 실패 ({recipient}): {state['error']}")
+
+        state['updated_at'] = datetime.utcnow().isoformat() + "Z"
+        if on_update:
+            await on_update(recipient, state)
+        return state
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+metrics.py - summarizer.metrics를 기존 경로로 import하기 위한 모듈 (daily_mailer.py 등)
+
+구현은 summarizer/metrics.py 참고
+"""
+
+from summarizer.metrics import METRIC_PREFIX, METRICS_FILE, Metrics  # noqa: F401
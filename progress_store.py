@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+progress_store.py - summarizer.progress_store를 기존 경로로 import하기 위한 모듈 (daily_mailer.py 등)
+
+구현은 summarizer/progress_store.py 참고
+"""
+
+from summarizer.progress_store import (  # noqa: F401
+    PROGRESS_FSYNC, FileLock, ProgressStore, atomic_write_json,
+)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+review_store.py - 복습 퀴즈 문항 저장소 + 간격 반복 일정
+
+- 저장소: 요약 파일의 퀴즈 섹션을 한 번만 파싱해 문항(질문/정답/해설/HTML)으로 저장
+  (data/quiz_items.json, 요약 내용 해시가 같으면 다시 파싱하지 않음)
+- 일정: 라이트너(Leitner) 방식 고정 간격 복습
+  Day d에 배운 문항은 d+1, d+3, d+7, d+14, d+30일에 다시 출제되고
+  복습할 때마다 다음 상자로 넘어가며 같은 날의 다른 문항이 나옴
+  (메일은 답을 받지 않으므로 상자 이동은 복습 횟수로만 결정)
+
+오늘 복습할 문항은 간격 수 × 과목 수만큼 조회하면 되므로 전체 Day 수와 상관없이 일정
+
+실행 방법:
+- 저장소 생성: python daily_mailer.py --prerender
+- 특정 날짜의 복습 문항 확인: python review_store.py --day 8
+"""
+
+import os
+import json
+import re
+import argparse
+import textwrap
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from progress_store import atomic_write_json
+
+# 경로
+QUIZ_STORE_FILE = Path("data/quiz_items.json")
+
+# 저장 형식 버전 (파싱 규칙이 바뀌면 올려서 전체 재생성)
+QUIZ_STORE_VERSION = 1
+
+# 복습 간격 (일, 앞에서부터 1번 상자, 2번 상자, ...)
+REVIEW_INTERVALS = tuple(
+    int(days) for days in os.getenv('REVIEW_INTERVALS', '1,3,7,14,30').split(',') if days.strip()
+)
+
+# 메일 1통에 넣을 최대 복습 문항 수
+REVIEW_MAX_ITEMS = int(os.getenv('REVIEW_MAX_ITEMS', '10'))
+
+# 문항 시작 줄 ("1.  질문")
+ITEM_PATTERN = re.compile(r'^(\d+)\.(?:[ \t]+(.*))?$')
+
+# 정답/해설 줄 ("*   **정답:** ...", "*   **답**: ...", "**정답: (B)** ..." 등)
+FIELD_PATTERN = re.compile(r'^(?:[*-][ \t]+)?(?:\*\*)?(정답|답|해설)(?:\*\*)?[ \t]*[:：][ \t]*(.*)$')
+
+# 제목 대신 굵은 글씨 줄로 쓴 퀴즈 섹션 ("**✅ 오늘의 퀴즈:**")
+QUIZ_LINE_PATTERN = re.compile(r'^\*\*[^*\n]*퀴즈[^*\n]*\*\*[ \t]*$', re.MULTILINE)
+
+
+class QuizItem:
+    """퀴즈 문항 1개"""
+
+    __slots__ = ('day', 'subject', 'number', 'question', 'answer', 'explanation', 'html')
+
+    def __init__(self, day: int, subject: str, number: int, question: str,
+                 answer: str = "", explanation: str = "", html: str = ""):
+        self.day = day
+        self.subject = subject
+        self.number = number
+        self.question = question
+        self.answer = answer
+        self.explanation = explanation
+        self.html = html
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QuizItem':
+        return cls(**data)
+
+
+def find_quiz_block(content: str, section: str = "") -> str:
+    """퀴즈 섹션 반환 (제목으로 찾은 section이 없으면 굵은 글씨 줄 이후 전체)"""
+    if section:
+        return section
+    match = QUIZ_LINE_PATTERN.search(content)
+    return content[match.end():] if match else ""
+
+
+def split_items(block: str) -> Iterable[Tuple[int, str, List[str]]]:
+    """퀴즈 섹션을 문항별 (번호, 질문, 나머지 줄)로 분리
+
+    번호 줄 다음의 들여쓴 줄까지를 한 문항으로 보고,
+    들여쓰지 않은 일반 문단(마무리 인사 등)이 나오면 문항을 끝냄
+    """
+    current = None
+    for line in block.splitlines():
+        match = ITEM_PATTERN.match(line)
+        if match:
+            if current:
+                yield current
+            current = (int(match.group(1)), (match.group(2) or "").strip(), [])
+        elif current is None:
+            continue
+        elif not line.strip() or line[0] in ' \t':
+            current[2].append(line)
+        else:
+            yield current
+            current = None
+    if current:
+        yield current
+
+
+def parse_quiz_items(day: int, subject: str, block: str,
+                     render: Callable[[str], str]) -> List[QuizItem]:
+    """퀴즈 섹션을 문항 목록으로 파싱 (render: 마크다운 → HTML)"""
+    items = []
+    for number, question, lines in split_items(block):
+        if not question:
+            continue
+
+        fields = {}
+        for line in lines:
+            match = FIELD_PATTERN.match(line.strip())
+            if match:
+                name = 'explanation' if match.group(1) == '해설' else 'answer'
+                fields.setdefault(name, match.group(2).replace('**', '').strip())
+
+        body = textwrap.dedent("\n".join(lines)).strip()
+        items.append(QuizItem(
+            day, subject, number, question,
+            answer=fields.get('answer', ''),
+            explanation=fields.get('explanation', ''),
+            html=render(f"**Q.** {question}\n\n{body}"),
+        ))
+    return items
+
+
+def review_schedule(day: int, intervals: Tuple[int, ...] = REVIEW_INTERVALS) -> List[Tuple[int, int]]:
+    """Day day에 복습할 (상자 번호, 원래 Day) 목록 (가까운 날짜부터)"""
+    return [(box, day - interval) for box, interval in enumerate(intervals, 1) if day - interval >= 1]
+
+
+class QuizStore:
+    """요약 파일별 퀴즈 문항 저장소 (처음 사용할 때 로드)"""
+
+    def __init__(self, path: Path = QUIZ_STORE_FILE):
+        self.path = Path(path)
+        self._entries = None
+        self._items: Dict[Tuple[int, str], List[QuizItem]] = {}
+        self.dirty = False
+
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        """{"dayNN_subject": {"key", "items"}} (버전이 다르면 빈 저장소)"""
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == QUIZ_STORE_VERSION:
+                    self._entries = data.get('files', {})
+        return self._entries
+
+    def get(self, day: int, subject: str, key: str) -> Optional[List[QuizItem]]:
+        """저장된 문항 반환 (없거나 요약 내용이 바뀌었으면 None)"""
+        entry = self.entries.get(f"day{day:02d}_{subject}")
+        if entry is None or entry.get('key') != key:
+            return None
+        if (day, subject) not in self._items:
+            self._items[day, subject] = [QuizItem.from_dict(item) for item in entry['items']]
+        return self._items[day, subject]
+
+    def put(self, day: int, subject: str, key: str, items: List[QuizItem]):
+        """문항 저장 (save를 호출해야 파일에 기록)"""
+        self.entries[f"day{day:02d}_{subject}"] = {
+            "key": key,
+            "items": [item.to_dict() for item in items],
+        }
+        self._items[day, subject] = items
+        self.dirty = True
+
+    def save(self):
+        """바뀐 내용이 있을 때만 파일에 기록"""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.path, {
+            "version": QUIZ_STORE_VERSION,
+            "files": dict(sorted(self.entries.items())),
+        }, fsync=False)
+        self.dirty = False
+
+
+def select_review_items(day: int, subjects: Iterable[str],
+                        lookup: Callable[[int, str], List[QuizItem]],
+                        limit: int = REVIEW_MAX_ITEMS) -> List[Tuple[int, QuizItem]]:
+    """Day day 메일에 넣을 (상자 번호, 문항) 목록
+
+    상자(복습 간격)마다 과목별로 1문항씩, 상자 번호에 따라 돌아가며 고르므로
+    같은 날의 문항이 복습할 때마다 바뀜 (lookup: (Day, 과목) → 문항 목록)
+    """
+    selected = []
+    for box, source_day in review_schedule(day):
+        for subject in subjects:
+            items = lookup(source_day, subject)
+            if items:
+                selected.append((box, items[(box - 1) % len(items)]))
+                if len(selected) >= limit:
+                    return selected
+    return selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="복습 퀴즈 저장소 확인")
+    parser.add_argument('--day', type=int, required=True, help="복습 문항을 확인할 Day")
+    args = parser.parse_args()
+
+    from daily_mailer import SUBJECT_LABELS, DailyMailer
+
+    mailer = DailyMailer()
+    due = mailer.review_items(args.day, list(SUBJECT_LABELS))
+    mailer.quiz_store.save()
+
+    print(f"🔁 Day {args.day} 복습 문항: {len(due)}개")
+    for box, item in due:
+        print(f"   [{box}번째 복습] Day {item.day} {SUBJECT_LABELS[item.subject]} "
+              f"{item.number}. {item.question}")
+        if item.answer:
+            print(f"      → {item.answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+search.py - 생성된 요약에서 검색어가 나오는 Day/섹션 찾기
+
+실행 방법:
+- python search.py "Facial nerve"
+- python search.py 보톡스 --subject pharmacology --limit 5
+- python search.py 보톡스 --rebuild (색인 전체 재생성)
+
+색인(data/cache/search_index.sqlite)은 setup.py가 요약을 저장할 때 갱신되고,
+검색할 때도 바뀐 요약 파일만 다시 색인함 (summarizer/search.py 참고)
+"""
+
+if __name__ == "__main__":
+    from summarizer.cli import search_main
+    search_main()
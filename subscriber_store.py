@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+subscriber_store.py - 구독자별 진도 저장소 (SQLite)
+
+여러 스터디 그룹이 각자 다른 날짜에 시작해도 하나의 저장소로 발송할 수 있도록
+구독자마다 현재 Day, 과목, 마지막 발송일을 기록
+
+실행 방법:
+- 구독자 추가: python subscriber_store.py add student@example.com --group A반 --day 1
+- 목록 확인: python subscriber_store.py list (수신 거부된 주소는 Day 대신 "거부")
+- 구독 해지: python subscriber_store.py remove student@example.com
+- 발송: python daily_mailer.py --cohorts
+"""
+
+import argparse
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# 경로
+SUBSCRIBERS_DB = Path("subscribers.db")
+
+# 기본 구독 과목
+DEFAULT_SUBJECTS = ('pharmacology', 'anatomy')
+
+
+class Subscriber:
+    """구독자 1명의 진도"""
+
+    __slots__ = ('email', 'group_name', 'subjects', 'current_day',
+                 'last_sent_date', 'completed', 'sent_count', 'bounced_at')
+
+    def __init__(self, email: str, group_name: str, subjects: Tuple[str, ...], current_day: int,
+                 last_sent_date: str, completed: bool, sent_count: int,
+                 bounced_at: Optional[str] = None):
+        self.email = email
+        self.group_name = group_name
+        self.subjects = subjects
+        self.current_day = current_day
+        self.last_sent_date = last_sent_date
+        self.completed = completed
+        self.sent_count = sent_count
+        self.bounced_at = bounced_at
+
+
+class SubscriberStore:
+    """구독자/진도 저장소"""
+
+    def __init__(self, db_path: Path = SUBSCRIBERS_DB):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS subscribers (
+                email TEXT PRIMARY KEY,
+                group_name TEXT NOT NULL DEFAULT '',
+                subjects TEXT NOT NULL,
+                current_day INTEGER NOT NULL DEFAULT 1,
+                last_sent_date TEXT,
+                completed INTEGER NOT NULL DEFAULT 0,
+                sent_count INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                bounced_at TEXT
+            )
+        """)
+        # 수신 거부 기록 열이 없던 저장소는 열을 추가
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(subscribers)")}
+        if 'bounced_at' not in columns:
+            self.conn.execute("ALTER TABLE subscribers ADD COLUMN bounced_at TEXT")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_subscribers_due ON subscribers (completed, current_day)"
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def add(self, email: str, group_name: str = '', subjects: Iterable[str] = DEFAULT_SUBJECTS,
+            current_day: int = 1):
+        """구독자 추가 (이미 있으면 그룹/과목/시작 Day를 갱신하고 수신 거부 기록을 지움)
+
+        받을 과목이 하나도 없으면 ValueError (빈 메일만 받게 되므로)
+        """
+        subjects = [subject for subject in DEFAULT_SUBJECTS if subject in subjects]
+        if not subjects:
+            raise ValueError(f"구독 과목이 없습니다: {email}")
+        self.conn.execute(
+            """
+            INSERT INTO subscribers (email, group_name, subjects, current_day, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(email) DO UPDATE SET
+                group_name = excluded.group_name,
+                subjects = excluded.subjects,
+                current_day = excluded.current_day,
+                completed = 0,
+                bounced_at = NULL
+            """,
+            (email, group_name, ','.join(subjects), current_day,
+             datetime.utcnow().isoformat() + "Z")
+        )
+        self.conn.commit()
+
+    def remove(self, email: str) -> bool:
+        """구독 해지"""
+        cursor = self.conn.execute("DELETE FROM subscribers WHERE email = ?", (email,))
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def all(self) -> List[Subscriber]:
+        """전체 구독자"""
+        return self._select("SELECT * FROM subscribers ORDER BY group_name, email", ())
+
+    def due(self, today: str) -> List[Subscriber]:
+        """오늘 발송 대상 (완료되지 않았고, 수신 거부되지 않았고, 오늘 아직 받지 않은 구독자)"""
+        return self._select(
+            """
+            SELECT * FROM subscribers
+            WHERE completed = 0 AND bounced_at IS NULL
+                AND (last_sent_date IS NULL OR last_sent_date != ?)
+            ORDER BY current_day, email
+            """,
+            (today,)
+        )
+
+    def mark_sent(self, emails: Iterable[str], today: str, total_days: int):
+        """발송 완료 처리 (다음 Day로 진행, 한 트랜잭션)"""
+        with self.conn:
+            self.conn.executemany(
+                """
+                UPDATE subscribers SET
+                    current_day = current_day + 1,
+                    last_sent_date = ?,
+                    sent_count = sent_count + 1,
+                    completed = (current_day + 1 > ?)
+                WHERE email = ?
+                """,
+                [(today, total_days, email) for email in emails]
+            )
+
+    def mark_bounced(self, emails: Iterable[str], today: str):
+        """영구적으로 수신 거부된(5xx) 주소 기록 (다시 add할 때까지 발송 대상에서 제외)"""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE subscribers SET bounced_at = ? WHERE email = ?",
+                [(today, email) for email in emails]
+            )
+
+    def mark_completed(self, total_days: int):
+        """총 일수를 넘어선 구독자를 완료 처리"""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE subscribers SET completed = 1 WHERE current_day > ?", (total_days,)
+            )
+
+    def _select(self, query: str, params: tuple) -> List[Subscriber]:
+        self.conn.row_factory = sqlite3.Row
+        try:
+            rows = self.conn.execute(query, params).fetchall()
+        finally:
+            self.conn.row_factory = None
+
+        return [
+            Subscriber(
+                row['email'], row['group_name'], tuple(filter(None, row['subjects'].split(','))),
+                row['current_day'], row['last_sent_date'], bool(row['completed']), row['sent_count'],
+                row['bounced_at']
+            )
+            for row in rows
+        ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="구독자별 진도 관리")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = commands.add_parser('add', help="구독자 추가")
+    add_parser.add_argument('email')
+    add_parser.add_argument('--group', default='', help="스터디 그룹 이름")
+    add_parser.add_argument('--day', type=int, default=1, help="시작 Day (기본 1)")
+    add_parser.add_argument('--subjects', default=','.join(DEFAULT_SUBJECTS),
+                            help="구독 과목 (쉼표로 구분, 기본 pharmacology,anatomy)")
+
+    remove_parser = commands.add_parser('remove', help="구독 해지")
+    remove_parser.add_argument('email')
+
+    commands.add_parser('list', help="구독자 목록")
+
+    args = parser.parse_args()
+    store = SubscriberStore()
+
+    if args.command == 'add':
+        subjects = [s.strip() for s in args.subjects.split(',') if s.strip()]
+        unknown = set(subjects) - set(DEFAULT_SUBJECTS)
+        if unknown:
+            parser.error(f"알 수 없는 과목: {', '.join(sorted(unknown))}")
+        if not subjects:
+            parser.error("과목을 하나 이상 지정하세요.")
+        store.add(args.email, args.group, subjects, args.day)
+        print(f"✅ 구독자 추가: {args.email} (Day {args.day}, {', '.join(subjects)})")
+
+    elif args.command == 'remove':
+        if store.remove(args.email):
+            print(f"✅ 구독 해지: {args.email}")
+        else:
+            print(f"⚠️  구독자를 찾을 수 없습니다: {args.email}")
+
+    else:
+        print(f"{'이메일':<30} {'그룹':<10} {'Day':>4}  {'과목':<22} 마지막 발송")
+        print("-" * 80)
+        for sub in store.all():
+            day = "거부" if sub.bounced_at else "완료" if sub.completed else str(sub.current_day)
+            print(f"{sub.email:<30} {sub.group_name:<10} {day:>4}  {','.join(sub.subjects):<22} "
+                  f"{sub.last_sent_date or '-'}")
+
+    store.close()
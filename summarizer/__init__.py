@@ -0,0 +1,44 @@
+"""
+summarizer - PDF를 Gemini로 요약하여 data/summaries/에 저장
+
+import만으로는 API 키 확인, Gemini 설정, 무거운 라이브러리 로드가 일어나지 않음
+(PyPDF2는 추출할 때, google.generativeai는 첫 요약 요청 때 로드)
+
+아래 이름은 처음 접근할 때 해당 모듈을 import함. 추출 프로세스 작업자처럼
+summarizer.extract만 쓰는 경우 pipeline/search/sqlite를 로드하지 않음
+"""
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'GeminiBackend': 'backends', 'LLMBackend': 'backends', 'StubBackend': 'backends',
+    'create_backend': 'backends',
+    'SummaryCache': 'cache', 'TextCache': 'cache',
+    'chunk_blocks': 'chunking', 'estimate_tokens': 'chunking', 'iter_blocks': 'chunking',
+    'extract_date_from_filename': 'extract', 'extract_pdf': 'extract',
+    'extract_text_from_pdf': 'extract', 'file_sha256': 'extract',
+    'iter_normalized_pages': 'extract', 'iter_pdf_pages': 'extract',
+    'pdf_fingerprint': 'extract', 'scan_pdf_files': 'extract',
+    'Metrics': 'metrics',
+    'PDFSummarizer': 'pipeline',
+    'FileLock': 'progress_store', 'ProgressStore': 'progress_store',
+    'RateLimiter': 'ratelimit', 'TokenBucket': 'ratelimit',
+    'SearchHit': 'search', 'SearchIndex': 'search', 'split_sections': 'search',
+    'tokenize': 'search',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,148 @@
+"""
+summarizer.backends - 요약 생성 백엔드 (Gemini / 오프라인 모의 백엔드)
+
+PDFSummarizer는 backend.generate(prompt, generation_config)만 호출하므로
+실제 API 없이도 추출 → 요약 → 저장 전체 파이프라인을 측정할 수 있음
+"""
+
+import os
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from .chunking import estimate_tokens
+from .config import MODEL_NAME
+
+# 사용할 백엔드 (gemini / stub)
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'gemini')
+
+# 모의 백엔드 설정 (요청당 지연 시간, 오류 비율, 출력 길이)
+STUB_LATENCY = float(os.getenv('STUB_LATENCY', '0.5'))
+STUB_ERROR_RATE = float(os.getenv('STUB_ERROR_RATE', '0'))
+STUB_OUTPUT_CHARS = int(os.getenv('STUB_OUTPUT_CHARS', '2500'))
+
+
+class LLMBackend(ABC):
+    """요약 생성 백엔드 인터페이스 (generate를 구현하지 않은 백엔드는 생성할 때 TypeError)"""
+
+    # 요약 캐시 키에 들어가는 이름 (백엔드/모델이 다르면 캐시를 공유하지 않음)
+    model_name = ""
+
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self.usage_lock = threading.Lock()
+
+    def record_usage(self, prompt_tokens: int, output_tokens: int):
+        """토큰 사용량 누적 (여러 스레드에서 호출)"""
+        with self.usage_lock:
+            self.prompt_tokens += prompt_tokens
+            self.output_tokens += output_tokens
+
+    def prepare(self):
+        """요청 전 준비 (API 키 확인 등), 실패하면 예외"""
+
+    @abstractmethod
+    def generate(self, prompt: str, generation_config: Dict) -> str:
+        """프롬프트로 텍스트 생성 (실패 시 예외, 재시도는 호출하는 쪽에서 처리)"""
+
+
+class GeminiBackend(LLMBackend):
+    """Gemini API 백엔드 (처음 사용할 때 API 키를 확인하고 모델 생성)"""
+
+    def __init__(self, model_name: str = MODEL_NAME):
+        super().__init__()
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    def prepare(self):
+        self.model  # API 키가 없으면 요청을 보내기 전에 바로 실패
+
+    @property
+    def model(self):
+        """Gemini 모델 (스레드 안전하게 한 번만 생성)"""
+        with self._lock:
+            if self._model is None:
+                import google.generativeai as genai
+
+                api_key = os.getenv('GEMINI_API_KEY')
+                if not api_key:
+                    raise ValueError("GEMINI_API_KEY가 .env 파일에 설정되지 않았습니다.")
+                genai.configure(api_key=api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    def generate(self, prompt: str, generation_config: Dict) -> str:
+        response = self.model.generate_content(prompt, generation_config=generation_config)
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None:
+            self.record_usage(usage.prompt_token_count or 0, usage.candidates_token_count or 0)
+        return response.text
+
+
+class StubBackend(LLMBackend):
+    """오프라인 모의 백엔드 (벤치마크/부하 테스트용)
+
+    같은 프롬프트에는 항상 같은 요약을 돌려주고, 오류 발생 여부도 프롬프트와
+    시도 횟수로 결정되므로 스레드 실행 순서와 상관없이 결과가 재현됨
+    """
+
+    def __init__(self, latency: float = STUB_LATENCY, error_rate: float = STUB_ERROR_RATE,
+                 output_chars: int = STUB_OUTPUT_CHARS, seed: int = 0):
+        super().__init__()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.output_chars = output_chars
+        self.seed = seed
+        self.model_name = f"stub-{output_chars}"
+        self.calls = 0
+        self.errors = 0
+        self.attempts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def generate(self, prompt: str, generation_config: Dict) -> str:
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode('utf-8')).hexdigest()
+        with self.lock:
+            attempt = self.attempts.get(digest, 0)
+            self.attempts[digest] = attempt + 1
+            self.calls += 1
+
+        time.sleep(self.latency)
+
+        roll = int(hashlib.sha256(f"{digest}:{attempt}".encode('utf-8')).hexdigest()[:8], 16)
+        if roll / 0xFFFFFFFF < self.error_rate:
+            with self.lock:
+                self.errors += 1
+            raise RuntimeError(f"모의 API 오류 (시도 {attempt + 1})")
+
+        text = self.render(digest)
+        self.record_usage(estimate_tokens(prompt), estimate_tokens(text))
+        return text
+
+    def render(self, digest: str) -> str:
+        """요약 파일과 같은 섹션 구성의 결정적 마크다운 생성 (약 output_chars자)"""
+        head = (
+            f"# 모의 요약 {digest[:8]}\n\n"
+            "## 💡 핵심 개념\n\n"
+        )
+        tail = (
+            "\n\n## 🏥 임상 적용\n\n- 모의 임상 항목\n\n"
+            "## ✅ 복습 퀴즈\n\n1. 모의 문제?\n   - 정답: 모의 정답\n"
+        )
+        line = f"- 모의 개념 {digest[:16]}\n"
+        body_chars = max(0, self.output_chars - len(head) - len(tail))
+        body = (line * (body_chars // len(line) + 1))[:body_chars].rstrip()
+        return head + body + tail
+
+
+def create_backend(name: Optional[str] = None) -> LLMBackend:
+    """이름으로 백엔드 생성 (gemini / stub, 기본값은 LLM_BACKEND 환경 변수)"""
+    name = (name or LLM_BACKEND).lower()
+    if name == 'gemini':
+        return GeminiBackend()
+    if name == 'stub':
+        return StubBackend()
+    raise ValueError(f"알 수 없는 LLM 백엔드: {name} (gemini / stub)")
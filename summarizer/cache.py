@@ -0,0 +1,200 @@
+"""
+summarizer.cache - PDF 추출 텍스트 캐시와 요약 캐시
+"""
+
+import os
+import codecs
+import json
+import hashlib
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .config import (
+    CHUNK_TOKEN_BUDGET, FAILED_SUMMARY_PREFIX, GENERATION_CONFIG, MODEL_NAME,
+    SUMMARY_CACHE_DIR, TEXT_CACHE_FILE, TEXT_READ_BYTES,
+)
+from .extract import file_sha256
+
+
+class TextCache:
+    """PDF 추출 텍스트 캐시 (SQLite, 파일 크기/수정 시각/내용 해시로 무효화)
+
+    텍스트는 zlib으로 압축하여 글자 수와 함께 저장하고, 파일별 추출 소요 시간과 페이지 수도 기록
+    읽을 때는 조금씩 풀어 반환하므로 문서 전체 텍스트를 메모리에 두지 않음
+    요약 작업 스레드가 필요할 때 한 건씩 읽어 가므로 스레드 간에 공유 (잠금으로 직렬화)
+    """
+
+    def __init__(self, db_path: Path = TEXT_CACHE_FILE):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pdf_texts (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                text BLOB NOT NULL,
+                page_count INTEGER NOT NULL,
+                extract_seconds REAL NOT NULL,
+                extracted_at TEXT NOT NULL,
+                chars INTEGER
+            )
+        """)
+        # 글자 수 열이 없던 캐시는 열을 추가 (기존 항목은 처음 조회할 때 계산)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(pdf_texts)")}
+        if 'chars' not in columns:
+            self.conn.execute("ALTER TABLE pdf_texts ADD COLUMN chars INTEGER")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_texts_sha256 ON pdf_texts (sha256)")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def size(self, pdf_path: Path) -> Optional[int]:
+        """캐시된 텍스트의 글자 수 (없거나 PDF가 변경되었으면 None, 텍스트는 풀지 않음)"""
+        with self.lock:
+            row = self._find(pdf_path)
+            if row is not None and row[1] is None:
+                row = (row[0], sum(len(piece) for piece in iter_decompressed(row[0])))
+                self.conn.execute("UPDATE pdf_texts SET chars = ? WHERE path = ?", (row[1], str(pdf_path)))
+                self.conn.commit()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[1]
+
+    def iter_text(self, pdf_path: Path) -> Iterator[str]:
+        """캐시된 텍스트를 조금씩 풀어 반환 (없으면 아무것도 반환하지 않음, 통계에 포함하지 않음)"""
+        with self.lock:
+            row = self._find(pdf_path)
+        if row is not None:
+            yield from iter_decompressed(row[0])
+
+    def _find(self, pdf_path: Path) -> Optional[Tuple[bytes, Optional[int]]]:
+        """(압축된 텍스트, 글자 수) 조회 (잠금 안에서 호출)"""
+        stat = pdf_path.stat()
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, text, chars FROM pdf_texts WHERE path = ?",
+            (str(pdf_path),)
+        ).fetchone()
+
+        # 크기와 수정 시각이 같으면 해시 계산 없이 적중
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2], row[3]
+
+        # 수정 시각만 바뀌었거나 파일명이 바뀐 경우 내용 해시로 확인
+        sha256 = file_sha256(pdf_path)
+        row = self.conn.execute(
+            "SELECT text, chars, page_count, extract_seconds FROM pdf_texts WHERE sha256 = ? LIMIT 1",
+            (sha256,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._upsert(pdf_path, stat, sha256, row[0], row[1], row[2], row[3])
+        return row[0], row[1]
+
+    def put(self, pdf_path: Path, compressed: bytes, chars: int, page_count: int, extract_seconds: float):
+        """추출 결과 저장 (extract_pdf가 페이지별로 압축한 텍스트를 그대로 저장)"""
+        with self.lock:
+            self._upsert(pdf_path, pdf_path.stat(), file_sha256(pdf_path),
+                         compressed, chars, page_count, extract_seconds)
+
+    def _upsert(self, pdf_path: Path, stat: os.stat_result, sha256: str, compressed: bytes,
+                chars: Optional[int], page_count: int, extract_seconds: float):
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO pdf_texts
+                (path, size, mtime_ns, sha256, text, page_count, extract_seconds, extracted_at, chars)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (str(pdf_path), stat.st_size, stat.st_mtime_ns, sha256, compressed,
+             page_count, extract_seconds, datetime.utcnow().isoformat() + "Z", chars)
+        )
+        self.conn.commit()
+
+
+def iter_decompressed(compressed: bytes, max_bytes: int = TEXT_READ_BYTES) -> Iterator[str]:
+    """zlib으로 압축된 UTF-8 텍스트를 max_bytes 이하씩 풀어 문자열로 반환"""
+    decompressor = zlib.decompressobj()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    data = compressed
+    while data:
+        chunk = decompressor.decompress(data, max_bytes)
+        data = decompressor.unconsumed_tail
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(decompressor.flush(), final=True)
+    if tail:
+        yield tail
+
+
+# 캐시 키 JSON에서 내용 자리 표시 (JSON 안에서는 이스케이프되므로 다른 값과 겹치지 않음)
+CONTENT_MARK = "\x00content\x00"
+
+
+class SummaryCache:
+    """요약 캐시 (내용 주소 기반, 입력이 같으면 API 호출 없이 재사용)"""
+
+    def __init__(self, cache_dir: Path = SUMMARY_CACHE_DIR, model_name: str = MODEL_NAME):
+        self.cache_dir = cache_dir
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, pdf_content: str, prompt_template: str) -> str:
+        """추출 텍스트, 프롬프트 템플릿, 모델명, 생성 설정으로 캐시 키 생성"""
+        return self.stream_key([pdf_content], prompt_template)
+
+    def stream_key(self, pieces: Iterable[str], prompt_template: str) -> str:
+        """key와 같은 키를 텍스트 조각 스트림에서 계산 (문서 전체를 합치지 않고 해시)
+
+        내용 자리에 표시를 넣은 JSON의 앞뒤 사이에, 조각마다 JSON 이스케이프한 내용을 이어 해시
+        (JSON 이스케이프는 글자 단위이므로 조각으로 나누어도 결과가 같음)
+        """
+        payload = json.dumps({
+            "model": self.model_name,
+            "generation_config": GENERATION_CONFIG,
+            "chunk_token_budget": CHUNK_TOKEN_BUDGET,
+            "prompt": prompt_template,
+            "content": CONTENT_MARK,
+        }, ensure_ascii=False, sort_keys=True)
+        head, tail = payload.split(json.dumps(CONTENT_MARK), 1)
+
+        digest = hashlib.sha256(head.encode('utf-8') + b'"')
+        for piece in pieces:
+            digest.update(json.dumps(piece, ensure_ascii=False)[1:-1].encode('utf-8'))
+        digest.update(b'"' + tail.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 요약 반환 (없으면 None)"""
+        filepath = self.cache_dir / f"{key}.md"
+        if not filepath.exists():
+            with self.lock:
+                self.misses += 1
+            return None
+
+        with self.lock:
+            self.hits += 1
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def put(self, key: str, summary: str):
+        """요약 저장 (실패 메시지는 저장하지 않음)"""
+        if summary.startswith(FAILED_SUMMARY_PREFIX):
+            return
+
+        filepath = self.cache_dir / f"{key}.md"
+        tmp_path = filepath.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(summary)
+        tmp_path.replace(filepath)
@@ -0,0 +1,85 @@
+"""
+summarizer.chunking - 긴 자료를 토큰 예산 이하의 청크로 분할
+"""
+
+from typing import Iterable, Iterator
+
+from .config import CHARS_PER_TOKEN
+
+
+def iter_blocks(text: str) -> Iterator[str]:
+    """텍스트를 문단("\n\n") 단위로 하나씩 반환 (split과 달리 목록을 만들지 않음)"""
+    start = 0
+    while True:
+        end = text.find("\n\n", start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 2
+
+
+def iter_stream_blocks(pieces: Iterable[str], max_chars: int) -> Iterator[str]:
+    """텍스트 조각 스트림을 문단("\n\n") 단위로 하나씩 반환 (iter_blocks의 스트림 버전)
+
+    문단 구분 없이 max_chars보다 길게 이어지면 chunk_blocks처럼 줄 경계에서 잘라 반환하므로
+    조각 크기 + max_chars 정도만 메모리에 둠
+    """
+    buffer = ""
+    for piece in pieces:
+        buffer += piece
+        start = 0
+        while True:
+            end = buffer.find("\n\n", start)
+            if end < 0:
+                break
+            yield buffer[start:end]
+            start = end + 2
+        buffer = buffer[start:]
+
+        while len(buffer) > max_chars:
+            cut = buffer.rfind('\n', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            yield buffer[:cut]
+            buffer = buffer[cut:].lstrip('\n')
+
+    yield buffer
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한글 혼합 텍스트 기준 약 3자/토큰)"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def chunk_blocks(blocks: Iterable[str], max_chars: int) -> Iterator[str]:
+    """텍스트 블록(페이지/문단)을 max_chars 이하의 청크로 묶음
+
+    블록 경계에서 나누며, 한 블록이 max_chars보다 길면 줄 경계에서 자름
+    """
+    current = []
+    size = 0
+
+    for block in blocks:
+        while len(block) > max_chars:
+            cut = block.rfind('\n', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                yield "\n\n".join(current)
+                current, size = [], 0
+            yield block[:cut]
+            block = block[cut:].lstrip('\n')
+
+        if not block:
+            continue
+
+        if current and size + 2 + len(block) > max_chars:
+            yield "\n\n".join(current)
+            current, size = [], 0
+
+        size += len(block) + (2 if current else 0)
+        current.append(block)
+
+    if current:
+        yield "\n\n".join(current)
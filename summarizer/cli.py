@@ -0,0 +1,60 @@
+"""
+summarizer.cli - 명령행 실행 (python setup.py, python search.py)
+"""
+
+import argparse
+import time
+from typing import List, Optional
+
+from .backends import LLM_BACKEND, create_backend
+from .config import SEARCH_INDEX_FILE, SUBJECTS
+from .pipeline import PDFSummarizer
+from .search import SearchIndex
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="PDF를 Gemini로 요약하여 저장")
+    parser.add_argument('--append', action='store_true',
+                        help="새로 추가/변경된 PDF만 처리하고 index.json에 병합 (진도 유지)")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="확인 없이 바로 진행 (CI 등 비대화형 실행)")
+    parser.add_argument('--backend', choices=('gemini', 'stub'), default=LLM_BACKEND,
+                        help="요약 백엔드 (stub: API 없이 모의 요약 생성, 벤치마크용)")
+    args = parser.parse_args(argv)
+
+    summarizer = PDFSummarizer(create_backend(args.backend))
+    try:
+        summarizer.run(incremental=args.append, assume_yes=args.yes)
+    finally:
+        summarizer.write_metrics()
+
+
+def search_main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="요약 파일 전문 검색")
+    parser.add_argument('query', help="검색어 (예: \"Facial nerve\", 보톡스)")
+    parser.add_argument('--limit', type=int, default=10, help="최대 결과 수 (기본 10)")
+    parser.add_argument('--subject', choices=tuple(SUBJECTS), help="과목 제한")
+    parser.add_argument('--rebuild', action='store_true', help="색인을 지우고 다시 생성")
+    args = parser.parse_args(argv)
+
+    if args.rebuild and SEARCH_INDEX_FILE.exists():
+        SEARCH_INDEX_FILE.unlink()
+
+    index = SearchIndex()
+    try:
+        # 요약 파일이 직접 수정/추가되었으면 해당 파일만 다시 색인
+        updated, removed = index.sync()
+        if updated or removed:
+            print(f"🗂️  색인 갱신: {updated}개 파일 재색인, {removed}개 삭제")
+
+        started = time.perf_counter()
+        hits = index.search(args.query, args.limit, args.subject)
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        index.close()
+
+    print(f"🔍 \"{args.query}\": {len(hits)}건 ({elapsed:.1f}ms)")
+    for rank, hit in enumerate(hits, 1):
+        label = SUBJECTS.get(hit.subject, {}).get('label', hit.subject)
+        print(f"\n{rank:2d}. Day {hit.day:02d} {label} · {hit.title or '(머리말)'}  [{hit.score}]")
+        print(f"    {hit.snippet}")
@@ -0,0 +1,166 @@
+"""
+summarizer.config - 모델, 경로, 동시성, 프롬프트 설정
+
+환경 변수는 import 시점에 읽으므로 .env는 import 전에 로드 (setup.py 참고)
+"""
+
+import os
+from pathlib import Path
+
+# Gemini 모델 설정 (2.0 Flash)
+MODEL_NAME = "gemini-2.0-flash-exp"
+
+# PDF 텍스트 추출 병렬 프로세스 수 (0 또는 미설정 시 CPU 코어 수)
+EXTRACT_WORKERS = int(os.getenv('EXTRACT_WORKERS', '0')) or os.cpu_count() or 1
+
+# 요약 생성 동시 요청 수 및 Rate limit (분당 요청 수 / 분당 토큰 수)
+SUMMARY_CONCURRENCY = int(os.getenv('SUMMARY_CONCURRENCY', '4'))
+REQUESTS_PER_MINUTE = int(os.getenv('GEMINI_RPM', '15'))
+TOKENS_PER_MINUTE = int(os.getenv('GEMINI_TPM', '1000000'))
+
+# 인덱스 / 진도 파일
+INDEX_FILE = Path("index.json")
+PROGRESS_FILE = Path("progress.json")
+
+# 요약 파일 저장 경로
+SUMMARIES_DIR = Path("data/summaries")
+
+# PDF 추출 텍스트 캐시 (SQLite)
+TEXT_CACHE_FILE = Path("data/cache/text_cache.sqlite")
+
+# 텍스트 캐시에서 한 번에 풀어 읽는 최대 바이트 (요약할 때 문서 전체를 메모리에 두지 않도록)
+TEXT_READ_BYTES = 64 * 1024
+
+# 요약 전문 검색 색인 (SQLite, 요약 파일에서 언제든 다시 만들 수 있음)
+SEARCH_INDEX_FILE = Path("data/cache/search_index.sqlite")
+
+# 요약 캐시 경로 (추출 텍스트/프롬프트/모델/생성 설정 해시 기준)
+SUMMARY_CACHE_DIR = Path("data/cache/summaries")
+
+# 요청당 원본 자료 토큰 예산 (초과 시 청크로 나누어 요약 후 합침)
+CHUNK_TOKEN_BUDGET = int(os.getenv('CHUNK_TOKEN_BUDGET', '5000'))
+
+# 토큰 수 추정용 (한글 혼합 텍스트 기준 약 3자/토큰)
+CHARS_PER_TOKEN = 3
+
+# 생성 설정
+GENERATION_CONFIG = {
+    'temperature': 0.7,
+    'top_p': 0.95,
+    'max_output_tokens': 2048,
+}
+
+# 프롬프트 템플릿
+PHARMACOLOGY_PROMPT = """
+다음은 약리학 수업자료입니다.
+학생이 매일 아침 읽을 학습 자료를 만들어주세요.
+
+**분량**: 약 1,500~2,000자 (5-7분 읽기)
+
+**수업자료를 전반적으로 요약**:
+
+**필수 정리 내용**:
+- 수업자료를 전반적으로 요약한 후, 필수적인 내용을 정리해주세요.
+
+1. **💡 핵심 개념** (4-5개)
+   - 각 개념을 2-3문장으로 상세히 설명
+   - 약물의 작용 기전 포함
+   - 왜 이렇게 작동하는지 논리적으로 설명
+
+2. **🏥 임상 적용**
+   - 실제 처방 예시 (적응증)
+   - 주의사항 및 금기
+   - 주요 부작용
+
+3. **⚠️ 중요 암기 사항**
+   - 시험에 나올 핵심 포인트
+   - 약물명
+   - 특이사항
+
+4. **✅ 오늘의 퀴즈** (5문제)
+   - 객관식 또는 OX 문제
+   - 각 문제 아래에 답과 간단한 해설
+
+**작성 가이드**:
+- 마크다운 형식 사용
+- 전문 용어는 처음 나올 때 쉽게 풀어서 설명
+- 문단 구분 명확히
+- 불릿 포인트 적절히 사용
+- 학생 입장에서 이해하기 쉽게
+
+**원본 자료**:
+{pdf_content}
+"""
+
+ANATOMY_PROMPT = """
+다음은 해부학 수업자료입니다.
+학생이 매일 아침 읽을 학습 자료를 만들어주세요.
+
+**분량**: 약 1,500~2,000자 (5-7분 읽기)
+
+**필수 정리 내용**:
+- 수업자료를 전반적으로 요약한 후, 필수적인 내용을 정리해주세요.
+
+1. **📚 학습 키워드** (2-3개)
+   - 어떤 구조를 배우고 무엇을 알아야 하는지
+
+2. **🔍 구조와 위치** (상세)
+   - 해부학적 위치 명확히
+
+3. **⚙️ 기능** (생리학적 의미)
+   - 각 구조의 역할
+   - 움직임, 작용
+   - 다른 구조와의 협력
+
+4. **🏥 임상 의의**
+   - 관련 질환
+   - 손상 시 증상
+   - 검사/진단 방법
+   - 임상에서 중요한 이유
+
+5. **✅ 오늘의 퀴즈** (5문제)
+   - 위치, 기능, 임상 관련 문제
+   - 각 문제 아래에 답과 해설
+
+**작성 가이드**:
+- 마크다운 형식 사용
+- 3차원 구조는 텍스트로 최대한 상세히
+- 용어는 영어로, anterior/posterior 등
+- 도해 없이도 이해 가능하게
+- 문단 구분 명확히
+
+**원본 자료**:
+{pdf_content}
+"""
+
+# 긴 자료를 나눈 청크별 정리 프롬프트 (map 단계)
+CHUNK_PROMPT = """
+다음은 {subject_label} 수업자료의 일부입니다.
+나중에 여러 부분을 합쳐 하나의 학습 자료를 만들 수 있도록, 이 부분의 내용을 정리해주세요.
+
+**작성 가이드**:
+- 마크다운 불릿 포인트 사용
+- 핵심 개념, 기전, 약물명/구조명, 수치, 임상 관련 내용은 빠짐없이 포함
+- 원본 자료에 없는 내용은 추가하지 않기
+- 퀴즈, 인사말, 서론은 작성하지 않기
+
+**원본 자료 (일부)**:
+{pdf_content}
+"""
+
+# 요약 실패 시 반환되는 내용의 머리말
+FAILED_SUMMARY_PREFIX = "# 요약 생성 실패"
+
+# 과목별 프롬프트 및 표시 이름 (scan_pdf_files 쌍 순서와 동일)
+SUBJECTS = {
+    "pharmacology": {
+        "prompt": PHARMACOLOGY_PROMPT,
+        "chunk_prompt": CHUNK_PROMPT.replace("{subject_label}", "약리학"),
+        "label": "약리학",
+    },
+    "anatomy": {
+        "prompt": ANATOMY_PROMPT,
+        "chunk_prompt": CHUNK_PROMPT.replace("{subject_label}", "해부학"),
+        "label": "해부학",
+    },
+}
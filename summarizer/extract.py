@@ -0,0 +1,143 @@
+"""
+summarizer.extract - PDF 텍스트 추출 및 파일 스캔
+
+프로세스 풀 작업자가 가볍게 import할 수 있도록 PyPDF2는 추출할 때만 로드
+"""
+
+import hashlib
+import re
+import time
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# 과도한 공백 정리 규칙
+EXCESS_NEWLINES = re.compile(r'\n{3,}')
+EXCESS_SPACES = re.compile(r' {2,}')
+
+
+def iter_normalized_pages(raw_pages: Iterable[Optional[str]]) -> Iterator[str]:
+    """페이지 텍스트를 한 페이지씩 정리하여 반환
+
+    "\n\n".join(결과)는 전체 텍스트를 합친 뒤 정리한 결과와 같음
+    (페이지 경계의 줄바꿈은 구분자 "\n\n"으로 합쳐지고, 문서 앞뒤 공백은 제거)
+    """
+    held = []  # 공백만 있는 페이지는 뒤에 내용이 나올 때까지 보류
+    started = False
+
+    for raw in raw_pages:
+        if not raw:
+            continue
+
+        text = EXCESS_SPACES.sub(' ', EXCESS_NEWLINES.sub('\n\n', raw)).strip('\n')
+        if not started:
+            text = text.lstrip()
+            started = bool(text)
+        if not text:
+            continue
+
+        if text.strip():
+            yield from held
+            held = [text]
+        else:
+            held.append(text)
+
+    if held:
+        yield held[0].rstrip()
+
+
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
+    """PDF를 한 페이지씩 읽어 정리된 텍스트 반환 (문서 전체를 메모리에 두지 않음)"""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(str(pdf_path))
+    yield from iter_normalized_pages(page.extract_text() for page in reader.pages)
+
+
+def extract_pdf(pdf_path: Path) -> Optional[Tuple[bytes, int, int, float]]:
+    """PDF에서 텍스트 추출 (프로세스 풀에서 호출할 수 있도록 모듈 수준 함수)
+
+    페이지를 읽는 대로 zlib으로 압축하므로 작업자는 문서 전체 텍스트를 만들지 않음
+    (압축된 텍스트, 글자 수, 페이지 수, 추출 소요 시간) 반환, 읽기 오류 시 None
+    """
+    from PyPDF2 import PdfReader
+
+    started = time.perf_counter()
+    try:
+        reader = PdfReader(str(pdf_path))
+        compressor = zlib.compressobj()
+        parts = []
+        chars = 0
+
+        pages = iter_normalized_pages(page.extract_text() for page in reader.pages)
+        for i, page in enumerate(pages):
+            if i:
+                page = "\n\n" + page
+            chars += len(page)
+            parts.append(compressor.compress(page.encode('utf-8')))
+        parts.append(compressor.flush())
+
+        return b"".join(parts), chars, len(reader.pages), time.perf_counter() - started
+
+    except Exception as e:
+        print(f"⚠️  PDF 읽기 오류 ({pdf_path.name}): {e}")
+        return None
+
+
+def extract_text_from_pdf(pdf_path: Path) -> str:
+    """PDF에서 텍스트 추출 (읽기 오류 시 빈 문자열)"""
+    try:
+        return "\n\n".join(iter_pdf_pages(pdf_path))
+    except Exception as e:
+        print(f"⚠️  PDF 읽기 오류 ({pdf_path.name}): {e}")
+        return ""
+
+
+def file_sha256(path: Path) -> str:
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def pdf_fingerprint(pdf_path: Path) -> str:
+    """PDF 변경 감지용 지문 (파일 크기 + 수정 시각)"""
+    stat = pdf_path.stat()
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def extract_date_from_filename(filename: str) -> Tuple[str, str]:
+    """파일명에서 날짜와 제목 추출 (YYYYMMDD_제목.pdf)"""
+    match = re.match(r'(\d{8})_(.+)\.pdf', filename)
+    if match:
+        date_str = match.group(1)
+        title = match.group(2)
+        return date_str, title
+    return "00000000", filename.replace('.pdf', '')
+
+
+def scan_pdf_files(pharmacology_dir: Path, anatomy_dir: Path) -> List[Tuple[Path, Path]]:
+    """PDF 파일 스캔 및 날짜순 정렬 (과목별 n번째 파일끼리 쌍으로 묶음)"""
+    pharma_files = sorted(
+        pharmacology_dir.glob("*.pdf"),
+        key=lambda p: extract_date_from_filename(p.name)[0]
+    )
+
+    anatomy_files = sorted(
+        anatomy_dir.glob("*.pdf"),
+        key=lambda p: extract_date_from_filename(p.name)[0]
+    )
+
+    # 쌍으로 묶기
+    max_len = max(len(pharma_files), len(anatomy_files))
+    pairs = []
+
+    for i in range(max_len):
+        pharma = pharma_files[i] if i < len(pharma_files) else None
+        anatomy = anatomy_files[i] if i < len(anatomy_files) else None
+        if pharma or anatomy:
+            pairs.append((pharma, anatomy))
+
+    return pairs
@@ -0,0 +1,99 @@
+"""
+summarizer.metrics - 단계별 소요 시간과 카운터 기록 (setup.py / daily_mailer.py 공용)
+
+METRICS_FILE이 설정된 경우에만 실행이 끝날 때 파일로 기록
+- *.prom: Prometheus 텍스트 형식 (실행마다 덮어씀, node_exporter textfile collector용)
+- 그 외: JSON lines (실행마다 한 줄 추가)
+"""
+
+import os
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+# 메트릭 파일 경로 (미설정 시 기록 안 함)
+METRICS_FILE = os.getenv('METRICS_FILE')
+
+# Prometheus 메트릭 이름 접두사
+METRIC_PREFIX = "daily_study"
+
+
+class Metrics:
+    """실행 1회의 단계별 타이머와 카운터 (스레드 안전)"""
+
+    def __init__(self, job: str):
+        self.job = job
+        self.started_at = datetime.utcnow().isoformat() + "Z"
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """with 블록 소요 시간을 stage에 누적"""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - t0)
+
+    def add_time(self, stage: str, seconds: float):
+        with self.lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def incr(self, name: str, amount: float = 1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict:
+        """현재까지의 기록 (JSON 한 줄 형식)"""
+        with self.lock:
+            return {
+                "job": self.job,
+                "started_at": self.started_at,
+                "duration_seconds": round(time.perf_counter() - self.started, 3),
+                "stages": {stage: round(seconds, 3) for stage, seconds in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        record = self.snapshot()
+        label = f'job="{self.job}"'
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_run_duration_seconds gauge",
+            f"{METRIC_PREFIX}_run_duration_seconds{{{label}}} {record['duration_seconds']}",
+            f"# TYPE {METRIC_PREFIX}_run_timestamp_seconds gauge",
+            f"{METRIC_PREFIX}_run_timestamp_seconds{{{label}}} {time.time():.0f}",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds gauge",
+        ]
+        lines += [
+            f'{METRIC_PREFIX}_stage_seconds{{{label},stage="{stage}"}} {seconds}'
+            for stage, seconds in record['stages'].items()
+        ]
+        for name, value in record['counters'].items():
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+            lines.append(f"{METRIC_PREFIX}_{name}{{{label}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Optional[str] = METRICS_FILE) -> Optional[Path]:
+        """메트릭 파일 기록 (path가 없으면 아무것도 하지 않음)"""
+        if not path:
+            return None
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == '.prom':
+            # textfile collector가 쓰다 만 파일을 읽지 않도록 교체 방식으로 저장
+            tmp_path = path.with_suffix('.prom.tmp')
+            tmp_path.write_text(self.to_prometheus(), encoding='utf-8')
+            tmp_path.replace(path)
+        else:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.snapshot(), ensure_ascii=False) + "\n")
+        return path
@@ -0,0 +1,519 @@
+"""
+summarizer.pipeline - PDF 추출 → 요약 → 저장 파이프라인
+
+google.generativeai와 tqdm은 실제로 사용할 때 로드하므로 import만으로는
+API 키나 네트워크가 필요하지 않음
+"""
+
+import sys
+import json
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait,
+)
+from contextlib import nullcontext
+from itertools import chain
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .backends import LLMBackend, create_backend
+from .cache import SummaryCache, TextCache
+from .chunking import chunk_blocks, estimate_tokens, iter_blocks, iter_stream_blocks
+from .config import (
+    CHARS_PER_TOKEN, CHUNK_TOKEN_BUDGET, EXTRACT_WORKERS, FAILED_SUMMARY_PREFIX,
+    GENERATION_CONFIG, INDEX_FILE, PROGRESS_FILE, SUBJECTS, SUMMARIES_DIR, SUMMARY_CONCURRENCY,
+)
+from .extract import (
+    extract_date_from_filename, extract_pdf, extract_text_from_pdf, pdf_fingerprint,
+    scan_pdf_files,
+)
+from .metrics import Metrics
+from .progress_store import ProgressStore
+from .ratelimit import RateLimiter
+from .search import SearchIndex
+
+
+class PDFSummarizer:
+    """PDF 요약 생성 클래스"""
+
+    def __init__(self, backend: Optional[LLMBackend] = None, extract_workers: Optional[int] = None,
+                 concurrency: Optional[int] = None, rate_limiter: Optional[RateLimiter] = None,
+                 summary_cache: Optional[SummaryCache] = None, text_cache: Optional[TextCache] = None,
+                 metrics: Optional[Metrics] = None, search_index: Optional[SearchIndex] = None):
+        self.backend = backend or create_backend()
+        self.metrics = metrics or Metrics("setup")
+        self.text_cache = text_cache or TextCache()
+        self.summary_cache = summary_cache or SummaryCache(model_name=self.backend.model_name)
+        self.search_index = search_index or SearchIndex()
+        self.extract_workers = extract_workers or EXTRACT_WORKERS
+        self.concurrency = concurrency or SUMMARY_CONCURRENCY
+        self.request_slots = threading.BoundedSemaphore(self.concurrency)
+        self.chunk_chars = CHUNK_TOKEN_BUDGET * CHARS_PER_TOKEN
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.pharmacology_dir = Path("data/pharmacology")
+        self.anatomy_dir = Path("data/anatomy")
+        self.summaries_dir = SUMMARIES_DIR
+        self.summaries_dir.mkdir(parents=True, exist_ok=True)
+
+    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+        """PDF에서 텍스트 추출"""
+        return extract_text_from_pdf(pdf_path)
+
+    def extract_all(self, pdf_pairs: List[Tuple[Path, Path]]) -> Dict[Path, int]:
+        """모든 PDF 텍스트를 프로세스 풀에서 병렬 추출하여 텍스트 캐시에 저장
+
+        텍스트 캐시에 있는 PDF는 다시 파싱하지 않음. 본문은 캐시에만 두고
+        {PDF 경로: 글자 수} 반환 (0이면 추출 실패 또는 빈 문서)
+        """
+        from tqdm import tqdm
+
+        pdf_files = [pdf for pair in pdf_pairs for pdf in pair if pdf]
+        sizes = {pdf: self.text_cache.size(pdf) for pdf in pdf_files}
+        missing = [pdf for pdf in pdf_files if sizes[pdf] is None]
+        workers = min(self.extract_workers, len(missing)) or 1
+
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as pool:
+            if pool:
+                results = pool.map(extract_pdf, missing)
+                desc = f"텍스트 추출 중 ({workers}프로세스)"
+            else:
+                results = (extract_pdf(pdf) for pdf in missing)
+                desc = "텍스트 추출 중"
+
+            # 작업자는 압축된 텍스트만 돌려주고, 완료되는 대로 캐시에 저장
+            for pdf, result in zip(missing, tqdm(results, total=len(missing), desc=desc, unit="파일")):
+                if result is None:
+                    sizes[pdf] = 0
+                    continue
+                self.text_cache.put(pdf, *result)
+                sizes[pdf] = result[1]
+
+        return sizes
+
+    def iter_text(self, pdf_path: Path) -> Iterator[str]:
+        """텍스트 캐시에서 추출 텍스트를 조금씩 읽기 (extract_all 이후 호출)"""
+        return self.text_cache.iter_text(pdf_path)
+
+    def extract_date_from_filename(self, filename: str) -> Tuple[str, str]:
+        """파일명에서 날짜와 제목 추출 (YYYYMMDD_제목.pdf)"""
+        return extract_date_from_filename(filename)
+
+    def scan_pdf_files(self) -> List[Tuple[Path, Path]]:
+        """PDF 파일 스캔 및 날짜순 정렬"""
+        return scan_pdf_files(self.pharmacology_dir, self.anatomy_dir)
+
+    def generate_summary(self, pdf_content: str, prompt_template: str,
+                        subject: str, retry_count: int = 3) -> str:
+        """백엔드(Gemini 등)로 요약 생성 (동시 요청 수는 concurrency개로 제한)"""
+        prompt = prompt_template.format(pdf_content=pdf_content)
+        token_count = estimate_tokens(prompt) + GENERATION_CONFIG['max_output_tokens']
+
+        for attempt in range(retry_count):
+            try:
+                waited = self.rate_limiter.acquire(token_count)
+                self.metrics.incr("rate_limit_wait_seconds", waited)
+                self.metrics.incr("api_calls")
+                with self.request_slots:
+                    text = self.backend.generate(prompt, GENERATION_CONFIG)
+
+                if text:
+                    return text.strip()
+
+            except Exception as e:
+                self.metrics.incr("api_errors")
+                if attempt < retry_count - 1:
+                    print(f"⚠️  API 호출 실패 (재시도 {attempt + 1}/{retry_count}): {e}")
+                    self.metrics.incr("retries")
+                    time.sleep(2 ** attempt)  # 지수 백오프
+                else:
+                    print(f"❌ API 호출 최종 실패 ({subject}): {e}")
+                    self.metrics.incr("failed_generations")
+                    return f"{FAILED_SUMMARY_PREFIX}\n\n오류: {e}"
+
+        self.metrics.incr("failed_generations")
+        return f"{FAILED_SUMMARY_PREFIX}\n\n알 수 없는 오류"
+
+    def summarize_document(self, pieces: Iterable[str], subject: str, label: str) -> str:
+        """자료 전체를 요약 (토큰 예산 초과 시 청크별 정리 후 합쳐서 요약)
+
+        pieces는 텍스트 조각 스트림. 예산 이내로 끝나면 합쳐서 한 번에 요약하고, 넘으면
+        문단 단위로 읽는 대로 청크를 만들어 요청하므로 문서 전체를 메모리에 두지 않음
+        """
+        pieces = iter(pieces)
+        head = []
+        size = 0
+        for piece in pieces:
+            head.append(piece)
+            size += len(piece)
+            if size > self.chunk_chars:
+                break
+        else:
+            return self.generate_summary("".join(head), SUBJECTS[subject]['prompt'], label)
+
+        def rest() -> Iterator[str]:
+            nonlocal size  # 끝까지 읽으면 문서 전체 글자 수
+            for piece in pieces:
+                size += len(piece)
+                yield piece
+
+        blocks = iter_stream_blocks(chain(head, rest()), self.chunk_chars)
+        while True:
+            partials = self.summarize_chunks(chunk_blocks(blocks, self.chunk_chars), subject, label)
+
+            failed = [p for p in partials if p.startswith(FAILED_SUMMARY_PREFIX)]
+            if failed:
+                return failed[0]
+
+            notes = "\n\n".join(
+                f"### 파트 {i}/{len(partials)}\n{partial}" for i, partial in enumerate(partials, 1)
+            )
+            # 예산 이내가 되었거나 더 줄어들지 않으면 그대로 최종 요약
+            if len(notes) <= self.chunk_chars or len(notes) >= size:
+                break
+            size = len(notes)
+            blocks = iter_blocks(notes)
+
+        return self.generate_summary(notes, SUBJECTS[subject]['prompt'], label)
+
+    def summarize_chunks(self, chunks: Iterable[str], subject: str, label: str) -> List[str]:
+        """청크별 정리를 동시에 생성 (청크 단위로 캐시하여 최종 요약 실패 시 재사용)
+
+        청크는 만들어지는 대로 요청하고 진행 중인 요청은 concurrency개까지만 두므로
+        문서 전체를 청크 목록으로 복사하지 않음
+        """
+        chunk_prompt = SUBJECTS[subject]['chunk_prompt']
+        partials = []
+        running = {}
+
+        def collect(futures):
+            for future in futures:
+                i, key = running.pop(future)
+                partials[i] = future.result()
+                self.summary_cache.put(key, partials[i])
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for i, chunk in enumerate(chunks):
+                key = self.summary_cache.key(chunk, chunk_prompt)
+                partials.append(self.summary_cache.get(key))
+                if partials[i] is not None:
+                    continue
+
+                if len(running) >= self.concurrency:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = pool.submit(self.generate_summary, chunk, chunk_prompt, f"{label} 파트 {i + 1}")
+                running[future] = (i, key)
+
+            collect(as_completed(list(running)))
+
+        return partials
+
+    def split_cached(self, tasks: List[Tuple[int, str, Path]]
+                     ) -> Tuple[Dict[Tuple[int, str], str], List[Tuple[int, str, Path]]]:
+        """캐시 적중 요약과 API 호출이 필요한 작업으로 분리 (캐시 키는 텍스트 스트림에서 계산)"""
+        cached = {}
+        pending = []
+
+        for day, subject, pdf in tasks:
+            key = self.summary_cache.stream_key(self.iter_text(pdf), SUBJECTS[subject]['prompt'])
+            summary = self.summary_cache.get(key)
+            if summary is None:
+                pending.append((day, subject, pdf))
+            else:
+                cached[(day, subject)] = summary
+
+        return cached, pending
+
+    def summarize_task(self, subject: str, pdf: Path, label: str) -> str:
+        """PDF 하나를 요약하고 요약 캐시에 저장 (텍스트는 캐시에서 조금씩 읽음)"""
+        summary = self.summarize_document(self.iter_text(pdf), subject, label)
+        key = self.summary_cache.stream_key(self.iter_text(pdf), SUBJECTS[subject]['prompt'])
+        self.summary_cache.put(key, summary)
+        return summary
+
+    def summarize_all(self, tasks: List[Tuple[int, str, Path]]) -> Dict[Tuple[int, str], str]:
+        """(day, subject, PDF 경로) 작업을 동시에 요약 (최대 concurrency개 요청 진행)
+
+        텍스트는 각 작업이 텍스트 캐시에서 조각 단위로 읽으므로 문서 전체를 메모리에 두지 않음
+        완료되는 대로 dayNN_subject.md와 요약 캐시에 저장하고 {(day, subject): 요약} 반환
+        """
+        from tqdm import tqdm
+
+        summaries = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool, \
+                tqdm(total=len(tasks), desc="요약 생성 중", unit="파일") as pbar:
+            futures = {
+                pool.submit(
+                    self.summarize_task,
+                    subject,
+                    pdf,
+                    f"Day{day} {SUBJECTS[subject]['label']}"
+                ): (day, subject)
+                for day, subject, pdf in tasks
+            }
+
+            for future in as_completed(futures):
+                day, subject = futures[future]
+                summary = future.result()
+                self.save_summary(day, subject, summary)
+                summaries[(day, subject)] = summary
+                pbar.update(1)
+
+        return summaries
+
+    def save_summary(self, day: int, subject: str, content: str):
+        """요약을 마크다운 파일로 저장하고 검색 색인 갱신 (해당 파일만)"""
+        filename = f"day{day:02d}_{subject}.md"
+        filepath = self.summaries_dir / filename
+
+        # 내용이 같으면 다시 쓰지 않음 (색인은 해시가 같으면 건너뜀)
+        if not (filepath.exists() and filepath.read_text(encoding='utf-8') == content):
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        if not content.startswith(FAILED_SUMMARY_PREFIX):
+            self.search_index.update(filepath, content)
+
+    def load_index(self) -> Optional[Dict]:
+        """기존 index.json 로드 (없으면 None)"""
+        if not INDEX_FILE.exists():
+            return None
+
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def find_changed_days(self, pdf_pairs: List[Tuple[Path, Path]], index_data: Dict) -> List[int]:
+        """기존 index.json과 비교하여 새로 추가되었거나 변경된 날짜 목록 반환"""
+        indexed = {entry['day']: entry for entry in index_data.get('files', [])}
+        changed = []
+
+        for day, pair in enumerate(pdf_pairs, 1):
+            entry = indexed.get(day)
+            if entry is None:
+                changed.append(day)
+                continue
+
+            for subject, pdf in zip(SUBJECTS, pair):
+                if not pdf:
+                    continue
+                info = entry.get(subject)
+                # 파일명이 다르거나, 이전 실행에서 실패했거나, 크기/수정 시각이 바뀐 경우
+                if (info is None or info.get('original') != pdf.name
+                        or info.get('fingerprint', pdf_fingerprint(pdf)) != pdf_fingerprint(pdf)):
+                    changed.append(day)
+                    break
+
+        return changed
+
+    def create_index(self, file_info: List[Dict], index_data: Optional[Dict] = None):
+        """index.json 생성 (index_data가 주어지면 해당 날짜 항목만 병합)"""
+        if index_data is None:
+            index_data = {
+                "total_days": len(file_info),
+                "created_at": datetime.utcnow().isoformat() + "Z",
+                "files": file_info
+            }
+        else:
+            entries = {entry['day']: entry for entry in index_data.get('files', [])}
+            entries.update({entry['day']: entry for entry in file_info})
+            index_data['files'] = [entries[day] for day in sorted(entries)]
+            index_data['total_days'] = len(index_data['files'])
+            index_data['updated_at'] = datetime.utcnow().isoformat() + "Z"
+
+        with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index_data, f, ensure_ascii=False, indent=2)
+
+    def create_progress(self, total_days: int):
+        """progress.json 초기화"""
+        progress_data = {
+            "current_day": 1,
+            "last_sent_date": None,
+            "total_days": total_days,
+            "completed": False,
+            "sent_count": 0
+        }
+
+        ProgressStore(PROGRESS_FILE).save(progress_data)
+
+    def extend_progress(self, total_days: int):
+        """progress.json의 total_days만 확장 (진행 중인 일정 유지)"""
+        store = ProgressStore(PROGRESS_FILE)
+
+        # 발송 중인 daily_mailer.py와 겹치지 않도록 잠금 안에서 읽고 저장
+        with store.lock.hold(blocking=True):
+            progress_data = store.load()
+            if progress_data is None:
+                self.create_progress(total_days)
+                return
+
+            progress_data['total_days'] = max(progress_data.get('total_days', 0), total_days)
+            # 새 날짜가 추가되었으면 완료 상태 해제
+            if progress_data.get('current_day', 1) <= progress_data['total_days']:
+                progress_data['completed'] = False
+
+            store.save(progress_data)
+
+    def write_metrics(self):
+        """캐시/토큰 사용량을 더해 메트릭 파일 기록 (METRICS_FILE 설정 시)"""
+        self.metrics.incr("summary_cache_hits", self.summary_cache.hits)
+        self.metrics.incr("summary_cache_misses", self.summary_cache.misses)
+        self.metrics.incr("text_cache_hits", self.text_cache.hits)
+        self.metrics.incr("text_cache_misses", self.text_cache.misses)
+        self.metrics.incr("prompt_tokens", self.backend.prompt_tokens)
+        self.metrics.incr("output_tokens", self.backend.output_tokens)
+
+        path = self.metrics.write()
+        if path:
+            print(f"📈 메트릭 기록: {path}")
+
+    def confirm(self, assume_yes: bool) -> bool:
+        """진행 여부 확인 (assume_yes면 묻지 않음, 터미널이 아니면 --yes 필요)"""
+        if assume_yes:
+            return True
+        if not sys.stdin.isatty():
+            print("\n❌ 확인 입력을 받을 수 없습니다. 확인 없이 진행하려면 --yes 옵션을 사용하세요.")
+            return False
+
+        response = input("\n계속 진행하시겠습니까? (y/n): ").lower()
+        if response != 'y':
+            print("❌ 취소되었습니다.")
+            return False
+        return True
+
+    def run(self, incremental: bool = False, assume_yes: bool = False):
+        """전체 프로세스 실행
+
+        incremental=True면 새로 추가/변경된 날짜만 처리, assume_yes=True면 확인 없이 진행
+        """
+        print("=" * 60)
+        print("📚 PDF 요약 생성 시작 (Gemini 2.0 Flash)")
+        print("=" * 60)
+
+        # PDF 파일 스캔
+        print("\n🔍 PDF 파일 스캔 중...")
+        with self.metrics.timer("scan"):
+            pdf_pairs = self.scan_pdf_files()
+
+        if not pdf_pairs:
+            print("❌ PDF 파일을 찾을 수 없습니다.")
+            print(f"   - {self.pharmacology_dir}/")
+            print(f"   - {self.anatomy_dir}/")
+            return
+
+        print(f"✅ 총 {len(pdf_pairs)}일치 PDF 발견\n")
+
+        # 증분 모드: 기존 index.json과 비교
+        index_data = self.load_index() if incremental else None
+        if index_data is not None:
+            days = self.find_changed_days(pdf_pairs, index_data)
+            if not days:
+                print("✅ 새로 추가되거나 변경된 PDF가 없습니다.")
+                return
+            print(f"🆕 새로 추가/변경된 날짜: {len(days)}일\n")
+        else:
+            days = list(range(1, len(pdf_pairs) + 1))
+
+        # 파일 목록 출력
+        print("📋 처리할 파일 목록:")
+        print("-" * 60)
+        for day in days:
+            pharma, anatomy = pdf_pairs[day - 1]
+            pharma_name = pharma.name if pharma else "없음"
+            anatomy_name = anatomy.name if anatomy else "없음"
+            print(f"Day {day:2d}: 약리학={pharma_name}")
+            print(f"        해부학={anatomy_name}")
+        print("-" * 60)
+
+        # 확인 요청
+        if not self.confirm(assume_yes):
+            return
+
+        # 텍스트 추출 (병렬, 본문은 텍스트 캐시에만 저장)
+        with self.metrics.timer("extract"):
+            text_sizes = self.extract_all([pdf_pairs[day - 1] for day in days])
+
+        tasks = []
+        fail_count = 0
+        for day in days:
+            for subject, pdf in zip(SUBJECTS, pdf_pairs[day - 1]):
+                if not pdf:
+                    continue
+                if text_sizes[pdf]:
+                    tasks.append((day, subject, pdf))
+                else:
+                    fail_count += 1
+
+        # 캐시 조회 (변경된 PDF만 API 호출)
+        with self.metrics.timer("cache_lookup"):
+            summaries, pending = self.split_cached(tasks)
+            for (day, subject), summary in summaries.items():
+                self.save_summary(day, subject, summary)
+        skipped_days = len({day for day, _, _ in tasks} - {day for day, _, _ in pending})
+
+        # 비용 추정
+        total_calls = sum(
+            1 if text_sizes[pdf] <= self.chunk_chars else -(-text_sizes[pdf] // self.chunk_chars) + 1
+            for _, _, pdf in pending
+        )
+        estimated_cost = total_calls * 0.015  # 약 $0.015/call
+        print(f"\n💰 예상 비용: ${estimated_cost:.2f} (약 {estimated_cost * 1300:.0f}원)")
+        print(f"   - 총 API 호출: 약 {total_calls}회 (캐시 재사용: {len(summaries)}개)\n")
+
+        # 요약 생성 (동시 요청 + Rate limit, 캐시로 모두 처리되면 API 키 불필요)
+        if pending:
+            self.backend.prepare()
+        with self.metrics.timer("summarize"):
+            summaries.update(self.summarize_all(pending))
+
+        # 실패한 요약은 인덱스에 넣지 않음 (--append가 변경된 것으로 보고 다시 시도)
+        failed = [key for key, summary in summaries.items() if summary.startswith(FAILED_SUMMARY_PREFIX)]
+        for key in failed:
+            del summaries[key]
+        fail_count += len(failed)
+        success_count = len(summaries)
+
+        file_info = []
+        for day in days:
+            day_info = {"day": day}
+            for subject, pdf in zip(SUBJECTS, pdf_pairs[day - 1]):
+                if (day, subject) in summaries:
+                    _, title = self.extract_date_from_filename(pdf.name)
+                    day_info[subject] = {
+                        "original": pdf.name,
+                        "summary": f"day{day:02d}_{subject}.md",
+                        "title": title,
+                        "fingerprint": pdf_fingerprint(pdf)
+                    }
+            file_info.append(day_info)
+
+        # 인덱스 및 진도 파일 생성
+        print("\n📝 인덱스 파일 생성 중...")
+        with self.metrics.timer("index"):
+            self.create_index(file_info, index_data)
+            if index_data is not None:
+                self.extend_progress(len(pdf_pairs))
+            else:
+                self.create_progress(len(pdf_pairs))
+
+        # 완료 통계
+        print("\n" + "=" * 60)
+        print("✅ 요약 생성 완료!")
+        print("=" * 60)
+        print(f"📊 통계:")
+        print(f"   - 성공: {success_count}개")
+        print(f"   - 실패: {fail_count}개")
+        print(f"   - 총 일수: {len(pdf_pairs)}일 (처리: {len(days)}일, 변경 없음: {skipped_days}일)")
+        print(f"   - 캐시 적중: {self.summary_cache.hits}개 / 미스: {self.summary_cache.misses}개")
+        print(f"   - 텍스트 캐시 적중: {self.text_cache.hits}개 / 미스: {self.text_cache.misses}개")
+        print(f"\n📂 생성된 파일:")
+        print(f"   - 요약 파일: data/summaries/ ({success_count}개)")
+        print(f"   - 인덱스: index.json")
+        print(f"   - 진도: progress.json")
+        print("\n🚀 다음 단계:")
+        print("   1. GitHub에 업로드")
+        print("   2. GitHub Secrets 설정")
+        print("   3. GitHub Actions 활성화")
+        print("=" * 60)
@@ -0,0 +1,120 @@
+"""
+summarizer.progress_store - 진도 파일 저장소 (원자적 저장 + 파일 잠금)
+
+- 저장: 임시 파일에 쓴 뒤 rename → 저장 도중 중단되어도 progress.json이 깨지지 않음
+- 잠금: 발송 확인 → 발송 → 진도 진행을 하나의 잠금 안에서 수행
+  (cron과 수동 실행이 겹쳐도 같은 날짜가 두 번 발송되지 않음)
+"""
+
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+# 저장 후 디스크 동기화 여부 (전원 차단에도 안전, 느린 디스크에서는 false 권장)
+PROGRESS_FSYNC = os.getenv('PROGRESS_FSYNC', 'true').lower() not in ('0', 'false', 'no')
+
+
+def atomic_write_json(path: Path, data: Dict, fsync: bool = PROGRESS_FSYNC):
+    """JSON 파일을 원자적으로 저장 (같은 폴더의 임시 파일에 쓰고 교체)"""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    # rename 자체도 디스크에 기록 (POSIX에서만 폴더 fsync 가능)
+    if fsync and os.name != 'nt':
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class FileLock:
+    """대상 파일 옆의 .lock 파일에 거는 권고 잠금 (프로세스 간)"""
+
+    def __init__(self, target: Path):
+        target = Path(target)
+        self.path = target.with_name(target.name + ".lock")
+        self.file = None
+
+    def acquire(self, blocking: bool = False) -> bool:
+        """잠금 획득 (다른 실행이 잡고 있으면 blocking=False일 때 False 반환)"""
+        self.file = open(self.path, 'a+')
+        try:
+            if os.name == 'nt':
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), mode, 1)
+            else:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(self.file.fileno(), flags)
+        except OSError:
+            self.file.close()
+            self.file = None
+            return False
+        return True
+
+    def release(self):
+        if self.file is None:
+            return
+        try:
+            if os.name == 'nt':
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.file.close()
+            self.file = None
+
+    @contextmanager
+    def hold(self, blocking: bool = False) -> Iterator[bool]:
+        """with 블록 동안 잠금 유지 (획득 여부를 넘겨줌)"""
+        acquired = self.acquire(blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release()
+
+
+class ProgressStore:
+    """progress.json 읽기/원자적 저장 + 발송 잠금"""
+
+    def __init__(self, path: Path, fsync: bool = PROGRESS_FSYNC):
+        self.path = Path(path)
+        self.fsync = fsync
+        self.lock = FileLock(self.path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> Optional[Dict]:
+        """진도 로드 (파일이 없으면 None)"""
+        if not self.path.exists():
+            return None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, progress: Dict):
+        atomic_write_json(self.path, progress, self.fsync)
@@ -0,0 +1,57 @@
+"""
+summarizer.ratelimit - 분당 요청 수/토큰 수 제한
+"""
+
+import threading
+import time
+
+from .config import REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE
+
+
+class TokenBucket:
+    """토큰 버킷 (분당 허용량만큼 연속적으로 충전, 스레드 안전)"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.rate = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """amount만큼 사용 가능해질 때까지 대기 후 차감 (대기한 시간(초) 반환)"""
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+
+                wait_time = (amount - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한"""
+
+    def __init__(self, requests_per_minute: int = REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = TOKENS_PER_MINUTE):
+        # 0 이하이면 충전 속도가 0이 되어 acquire에서 0으로 나누게 되므로 미리 막음
+        if requests_per_minute <= 0:
+            raise ValueError(f"GEMINI_RPM은 1 이상이어야 합니다. (현재 값: {requests_per_minute})")
+        if tokens_per_minute <= 0:
+            raise ValueError(f"GEMINI_TPM은 1 이상이어야 합니다. (현재 값: {tokens_per_minute})")
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def acquire(self, token_count: int) -> float:
+        """요청 1건과 token_count만큼 대기 후 차감 (대기한 시간(초) 반환)"""
+        return self.requests.acquire(1) + self.tokens.acquire(token_count)
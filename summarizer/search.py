@@ -0,0 +1,290 @@
+"""
+summarizer.search - 요약 파일 전문 검색 (역색인, SQLite)
+
+- 영어/숫자: 단어 단위 (소문자)
+- 한글: 2글자 n-gram (조사가 붙거나 띄어쓰기가 달라도 찾을 수 있음)
+- 순위: 섹션(제목 단위) BM25
+
+요약을 저장할 때(PDFSummarizer.save_summary) 해당 파일만 다시 색인하고,
+검색 전에는 크기/수정 시각이 바뀐 파일만 확인해 색인을 맞춤
+
+실행 방법 (search.py):
+- python search.py "Facial nerve"
+- python search.py 보톡스 --subject pharmacology --limit 5
+- python search.py 보톡스 --rebuild (색인 전체 재생성)
+"""
+
+import re
+import math
+import hashlib
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import SEARCH_INDEX_FILE, SUMMARIES_DIR
+
+# 색인 형식 버전 (토큰화 규칙이 바뀌면 올려서 전체 재색인)
+SEARCH_INDEX_VERSION = 1
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 토큰: 한글 연속 구간 또는 영문/숫자 단어
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# 섹션 제목 (마크다운 제목 또는 한 줄 전체가 굵은 글씨인 줄)
+SECTION_PATTERN = re.compile(r'^(?:#{1,6}[ \t]*(.+?)|\*\*([^*\n]+)\*\*:?)[ \t]*$', re.MULTILINE)
+
+# 요약 파일명 (dayNN_subject.md)
+SUMMARY_NAME_PATTERN = re.compile(r'^day(\d+)_([a-z]+)\.md$')
+
+# 스니펫 앞뒤 글자 수
+SNIPPET_CHARS = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 토큰 목록 (한글은 2글자 n-gram, 한 글자 구간은 그대로)"""
+    tokens = []
+    for run in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text).lower()):
+        if '가' <= run[0] <= '힣' and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def split_sections(content: str) -> List[Tuple[str, int, int]]:
+    """요약을 섹션 (제목, 시작, 끝) 목록으로 분리 (첫 제목 앞부분은 제목 없음)"""
+    sections = []
+    title, start = "", 0
+    for match in SECTION_PATTERN.finditer(content):
+        if content[start:match.start()].strip():
+            sections.append((title, start, match.start()))
+        title = (match.group(1) or match.group(2)).strip('*# \t').rstrip(':')
+        start = match.start()
+    if content[start:].strip():
+        sections.append((title, start, len(content)))
+    return sections
+
+
+def parse_summary_name(path: Path) -> Optional[Tuple[int, str]]:
+    """파일명에서 (Day, 과목) 추출 (요약 파일이 아니면 None)"""
+    match = SUMMARY_NAME_PATTERN.match(path.name)
+    return (int(match.group(1)), match.group(2)) if match else None
+
+
+class SearchHit:
+    """검색 결과 1개 (Day/과목/섹션 단위)"""
+
+    __slots__ = ('day', 'subject', 'title', 'score', 'snippet', 'path')
+
+    def __init__(self, day: int, subject: str, title: str, score: float, snippet: str, path: str):
+        self.day = day
+        self.subject = subject
+        self.title = title
+        self.score = score
+        self.snippet = snippet
+        self.path = path
+
+
+class SearchIndex:
+    """요약 파일 역색인 (섹션별 단어 빈도 + 길이, 파일 해시로 변경 확인)"""
+
+    def __init__(self, db_path: Path = SEARCH_INDEX_FILE):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SEARCH_INDEX_VERSION:
+            self.conn.executescript("""
+                DROP TABLE IF EXISTS postings;
+                DROP TABLE IF EXISTS sections;
+                DROP TABLE IF EXISTS documents;
+            """)
+            self.conn.execute(f"PRAGMA user_version = {SEARCH_INDEX_VERSION}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                day INTEGER NOT NULL,
+                subject TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sections (
+                section_id INTEGER PRIMARY KEY,
+                doc_id INTEGER NOT NULL REFERENCES documents (doc_id) ON DELETE CASCADE,
+                title TEXT NOT NULL,
+                start INTEGER NOT NULL,
+                end INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                section_id INTEGER NOT NULL REFERENCES sections (section_id) ON DELETE CASCADE,
+                tf INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                PRIMARY KEY (term, section_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_sections_doc ON sections (doc_id);
+            CREATE INDEX IF NOT EXISTS idx_postings_section ON postings (section_id);
+        """)
+        self.conn.commit()
+        self._stats = None
+
+    def close(self):
+        self.conn.close()
+
+    def update(self, path: Path, content: Optional[str] = None, commit: bool = True) -> bool:
+        """요약 파일 1개 색인 (내용이 바뀌지 않았으면 건너뜀), 다시 색인했으면 True"""
+        parsed = parse_summary_name(path)
+        if parsed is None:
+            return False
+        if content is None:
+            content = path.read_text(encoding='utf-8')
+
+        stat = path.stat()
+        sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        row = self.conn.execute(
+            "SELECT doc_id, sha256 FROM documents WHERE path = ?", (str(path),)
+        ).fetchone()
+
+        if row and row[1] == sha256:
+            # 내용이 같으면 크기/수정 시각만 갱신
+            self.conn.execute("UPDATE documents SET size = ?, mtime_ns = ? WHERE doc_id = ?",
+                              (stat.st_size, stat.st_mtime_ns, row[0]))
+            if commit:
+                self.conn.commit()
+            return False
+
+        if row:
+            self.conn.execute("DELETE FROM documents WHERE doc_id = ?", (row[0],))
+        day, subject = parsed
+        doc_id = self.conn.execute(
+            "INSERT INTO documents (path, day, subject, size, mtime_ns, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+            (str(path), day, subject, stat.st_size, stat.st_mtime_ns, sha256)
+        ).lastrowid
+
+        for title, start, end in split_sections(content):
+            tokens = tokenize(content[start:end])
+            section_id = self.conn.execute(
+                "INSERT INTO sections (doc_id, title, start, end, length) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, title, start, end, len(tokens))
+            ).lastrowid
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            self.conn.executemany(
+                "INSERT INTO postings (term, section_id, tf, length) VALUES (?, ?, ?, ?)",
+                [(term, section_id, tf, len(tokens)) for term, tf in counts.items()]
+            )
+
+        self._stats = None
+        if commit:
+            self.conn.commit()
+        return True
+
+    def remove(self, path: Path, commit: bool = True):
+        """요약 파일 색인 삭제"""
+        self.conn.execute("DELETE FROM documents WHERE path = ?", (str(path),))
+        self._stats = None
+        if commit:
+            self.conn.commit()
+
+    def sync(self, summaries_dir: Path = SUMMARIES_DIR) -> Tuple[int, int]:
+        """폴더와 색인 맞추기 (크기/수정 시각이 바뀐 파일만 읽음), (재색인 수, 삭제 수) 반환"""
+        indexed = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self.conn.execute("SELECT path, size, mtime_ns FROM documents")
+        }
+        updated = 0
+        current = set()
+        for path in sorted(summaries_dir.glob("day*_*.md")):
+            if parse_summary_name(path) is None:
+                continue
+            current.add(str(path))
+            stat = path.stat()
+            if indexed.get(str(path)) != (stat.st_size, stat.st_mtime_ns):
+                updated += self.update(path, commit=False)
+
+        removed = set(indexed) - current
+        for path in removed:
+            self.remove(Path(path), commit=False)
+        self.conn.commit()
+        return updated, len(removed)
+
+    def stats(self) -> Tuple[int, float]:
+        """(섹션 수, 평균 섹션 길이) - BM25 계산용, 색인이 바뀔 때까지 재사용"""
+        if self._stats is None:
+            count, average = self.conn.execute("SELECT COUNT(*), AVG(length) FROM sections").fetchone()
+            self._stats = (count, average or 0.0)
+        return self._stats
+
+    def search(self, query: str, limit: int = 10, subject: Optional[str] = None) -> List[SearchHit]:
+        """검색어와 관련된 섹션을 점수순으로 반환 (subject를 주면 해당 과목만)"""
+        terms = set(tokenize(query))
+        count, average = self.stats()
+        if not terms or not count:
+            return []
+
+        # 단어별 idf (문서 빈도는 기본 키 (term, section_id) 색인으로 바로 셈)
+        placeholders = ", ".join("?" * len(terms))
+        weights = [
+            (term, math.log(1 + (count - df + 0.5) / (df + 0.5)))
+            for term, df in self.conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term",
+                tuple(terms)
+            )
+        ]
+        if not weights:
+            return []
+
+        # 점수 합산과 정렬은 SQLite 안에서 (섹션 길이를 postings에 함께 저장해 조인 없이 계산)
+        params = {"k1": BM25_K1, "b": BM25_B, "average": average, "subject": subject, "limit": limit}
+        for i, (term, idf) in enumerate(weights):
+            params[f"term{i}"], params[f"idf{i}"] = term, idf
+        values = ", ".join(f"(:term{i}, :idf{i})" for i in range(len(weights)))
+        subject_filter = """
+            JOIN sections s ON s.section_id = p.section_id
+            JOIN documents d ON d.doc_id = s.doc_id AND d.subject = :subject
+        """ if subject else ""
+        ranked = self.conn.execute(f"""
+            WITH weights (term, idf) AS (VALUES {values})
+            SELECT p.section_id,
+                   SUM(w.idf * p.tf * (:k1 + 1)
+                       / (p.tf + :k1 * (1 - :b + :b * p.length / :average))) AS score
+            FROM weights w
+            JOIN postings p ON p.term = w.term
+            {subject_filter}
+            GROUP BY p.section_id
+            ORDER BY score DESC
+            LIMIT :limit
+        """, params).fetchall()
+
+        hits = []
+        for section_id, score in ranked:
+            day, hit_subject, path, title, start, end = self.conn.execute(
+                "SELECT d.day, d.subject, d.path, s.title, s.start, s.end FROM sections s "
+                "JOIN documents d ON d.doc_id = s.doc_id WHERE s.section_id = ?",
+                (section_id,)
+            ).fetchone()
+            hits.append(SearchHit(day, hit_subject, title, round(score, 3),
+                                  self.snippet(Path(path), start, end, query), path))
+        return hits
+
+    def snippet(self, path: Path, start: int, end: int, query: str) -> str:
+        """섹션에서 검색어가 처음 나오는 부분 (파일이 없으면 빈 문자열)"""
+        try:
+            text = path.read_text(encoding='utf-8')[start:end]
+        except OSError:
+            return ""
+
+        lowered = text.lower()
+        positions = [lowered.find(word) for word in query.lower().split()]
+        position = min((p for p in positions if p >= 0), default=0)
+        begin = max(0, position - SNIPPET_CHARS)
+        excerpt = " ".join(text[begin:position + SNIPPET_CHARS * 2].split())
+        return ("…" if begin else "") + excerpt + "…"